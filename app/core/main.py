@@ -1,465 +1,861 @@
-from fastapi import FastAPI, Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from sqlalchemy.orm import Session
-from datetime import datetime, timedelta
-from typing import List, Optional
-import uvicorn
-
-from database.database import engine, get_db, Base
-from app.models.models import User, Artist, Organizer, Booking, Review, Message
-from app.schemas.schemas import (
-    UserCreate, UserResponse, Token,
-    ArtistCreate, ArtistResponse, ArtistUpdate,
-    OrganizerCreate, OrganizerResponse,
-    BookingCreate, BookingResponse, BookingUpdate,
-    ReviewCreate, ReviewResponse,
-    MessageCreate, MessageResponse,
-    ArtistSearch
-)
-from app.services.auth import (
-    get_password_hash, verify_password, create_access_token,
-    get_current_user, get_current_active_user
-)
-
-# Создание таблиц в БД
-Base.metadata.create_all(bind=engine)
-
-app = FastAPI(
-    title="МузПлатформа API",
-    description="API для платформы взаимодействия музыкальных исполнителей и организаторов",
-    version="1.0.0"
-)
-
-# CORS для фронтенда
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Монтирование статических файлов
-import os
-
-if not os.path.exists("static"):
-    os.makedirs("static")
-    os.makedirs("static/css")
-    os.makedirs("static/js")
-    os.makedirs("static/images")
-
-app.mount("/static", StaticFiles(directory="static"), name="static")
-
-# Главная страница перенаправляет на static/index.html
-from fastapi.responses import RedirectResponse
-
-
-@app.get("/")
-def root():
-    """Перенаправление на главную страницу"""
-    return RedirectResponse(url="/static/index.html")
-
-
-# ==================== Ф1: РЕГИСТРАЦИЯ И АУТЕНТИФИКАЦИЯ ====================
-
-@app.post("/api/register", response_model=UserResponse, tags=["Аутентификация"])
-def register_user(user: UserCreate, db: Session = Depends(get_db)):
-    """Регистрация нового пользователя (артист/организатор/админ)"""
-    # Проверка существования email
-    db_user = db.query(User).filter(User.email == user.email).first()
-    if db_user:
-        raise HTTPException(status_code=400, detail="Email уже зарегистрирован")
-
-    # Создание пользователя
-    hashed_password = get_password_hash(user.password)
-    db_user = User(
-        email=user.email,
-        password_hash=hashed_password,
-        phone=user.phone,
-        role=user.role,
-        is_active=True
-    )
-    db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
-
-    return db_user
-
-
-@app.post("/api/token", response_model=Token, tags=["Аутентификация"])
-def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
-    """Аутентификация и получение токена"""
-    user = db.query(User).filter(User.email == form_data.username).first()
-    if not user or not verify_password(form_data.password, user.password_hash):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Неверный email или пароль",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    access_token = create_access_token(data={"sub": user.email})
-    return {"access_token": access_token, "token_type": "bearer"}
-
-
-@app.get("/api/users/me", response_model=UserResponse, tags=["Пользователи"])
-def get_current_user_info(current_user: User = Depends(get_current_active_user)):
-    """Получение информации о текущем пользователе"""
-    return current_user
-
-
-# ==================== ВСПОМОГАТЕЛЬНЫЕ ФУНКЦИИ ====================
-
-# ИСПРАВЛЕНИЕ: Функция для преобразования строки жанров в список для Pydantic
-def _prepare_artist_response(artist_db):
-    """Преобразует строку жанров из БД в список для схемы ответа Pydantic."""
-    # Если genres — строка (из БД), преобразуем ее в список
-    if artist_db and isinstance(artist_db.genres, str):
-        # Разделяем строку, удаляем пробелы и фильтруем пустые элементы
-        artist_db.genres = [g.strip() for g in artist_db.genres.split(',') if g.strip()]
-    elif artist_db and artist_db.genres is None:
-        artist_db.genres = []
-
-    return artist_db
-
-# ==================== Ф2: УПРАВЛЕНИЕ ПРОФИЛЕМ АРТИСТА ====================
-
-@app.post("/api/artists", response_model=ArtistResponse, tags=["Артисты"])
-def create_artist_profile(
-        artist: ArtistCreate,
-        current_user: User = Depends(get_current_active_user),
-        db: Session = Depends(get_db)
-):
-    """Создание профиля артиста"""
-    if current_user.role != "artist":
-        raise HTTPException(status_code=403, detail="Только артисты могут создавать профиль артиста")
-
-    # Проверка существования профиля
-    existing = db.query(Artist).filter(Artist.user_id == current_user.id).first()
-    if existing:
-        raise HTTPException(status_code=400, detail="Профиль артиста уже существует")
-
-    db_artist = Artist(
-        user_id=current_user.id,
-        stage_name=artist.stage_name,
-        bio=artist.bio,
-        genres=",".join(artist.genres),
-        price_min=artist.price_min,
-        price_max=artist.price_max
-    )
-    db.add(db_artist)
-    db.commit()
-    db.refresh(db_artist)
-
-    return _prepare_artist_response(db_artist)
-
-
-@app.get("/api/artists/{artist_id}", response_model=ArtistResponse, tags=["Артисты"])
-def get_artist_profile(artist_id: int, db: Session = Depends(get_db)):
-    """Получение профиля артиста"""
-    artist = db.query(Artist).filter(Artist.artist_id == artist_id).first()
-    if not artist:
-        raise HTTPException(status_code=404, detail="Артист не найден")
-    return _prepare_artist_response(artist)
-
-
-@app.put("/api/artists/{artist_id}", response_model=ArtistResponse, tags=["Артисты"])
-def update_artist_profile(
-        artist_id: int,
-        artist_update: ArtistUpdate,
-        current_user: User = Depends(get_current_active_user),
-        db: Session = Depends(get_db)
-):
-    """Обновление профиля артиста"""
-    artist = db.query(Artist).filter(Artist.artist_id == artist_id).first()
-    if not artist:
-        raise HTTPException(status_code=404, detail="Артист не найден")
-
-    if artist.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Нет прав для редактирования")
-
-    update_data = artist_update.dict(exclude_unset=True)
-    if "genres" in update_data:
-        update_data["genres"] = ",".join(update_data["genres"])
-
-    for key, value in update_data.items():
-        setattr(artist, key, value)
-
-    db.commit()
-    db.refresh(artist)
-    return _prepare_artist_response(artist)
-
-
-# ==================== Ф3: УПРАВЛЕНИЕ ПРОФИЛЕМ ОРГАНИЗАТОРА ====================
-
-@app.post("/api/organizers", response_model=OrganizerResponse, tags=["Организаторы"])
-def create_organizer_profile(
-        organizer: OrganizerCreate,
-        current_user: User = Depends(get_current_active_user),
-        db: Session = Depends(get_db)
-):
-    """Создание профиля организатора"""
-    if current_user.role != "organizer":
-        raise HTTPException(status_code=403, detail="Только организаторы могут создавать профиль")
-
-    existing = db.query(Organizer).filter(Organizer.user_id == current_user.id).first()
-    if existing:
-        raise HTTPException(status_code=400, detail="Профиль организатора уже существует")
-
-    db_organizer = Organizer(
-        user_id=current_user.id,
-        company_name=organizer.company_name,
-        description=organizer.description,
-        address=organizer.address,
-        website=organizer.website
-    )
-    db.add(db_organizer)
-    db.commit()
-    db.refresh(db_organizer)
-
-    return db_organizer
-
-
-@app.get("/api/organizers/{organizer_id}", response_model=OrganizerResponse, tags=["Организаторы"])
-def get_organizer_profile(organizer_id: int, db: Session = Depends(get_db)):
-    """Получение профиля организатора"""
-    organizer = db.query(Organizer).filter(Organizer.organizer_id == organizer_id).first()
-    if not organizer:
-        raise HTTPException(status_code=404, detail="Организатор не найден")
-    return organizer
-
-
-# ==================== Ф4: ПОИСК И ФИЛЬТРАЦИЯ АРТИСТОВ ====================
-
-@app.get("/api/artists", response_model=List[ArtistResponse], tags=["Артисты"])
-def search_artists(
-        genre: Optional[str] = None,
-        price_min: Optional[float] = None,
-        price_max: Optional[float] = None,
-        search: Optional[str] = None,
-        db: Session = Depends(get_db)
-):
-    """Поиск и фильтрация артистов"""
-    query = db.query(Artist)
-
-    if genre:
-        query = query.filter(Artist.genres.contains(genre))
-
-    if price_min:
-        query = query.filter(Artist.price_min >= price_min)
-
-    if price_max:
-        query = query.filter(Artist.price_max <= price_max)
-
-    if search:
-        query = query.filter(
-            (Artist.stage_name.contains(search)) | (Artist.bio.contains(search))
-        )
-
-    artists = query.all()
-    return [_prepare_artist_response(a) for a in artists]
-
-
-# ==================== Ф5: ПОДАЧА И ОБРАБОТКА ЗАЯВОК ====================
-
-@app.post("/api/bookings", response_model=BookingResponse, tags=["Бронирования"])
-def create_booking(
-        booking: BookingCreate,
-        current_user: User = Depends(get_current_active_user),
-        db: Session = Depends(get_db)
-):
-    """Создание заявки на бронирование"""
-    if current_user.role != "organizer":
-        raise HTTPException(status_code=403, detail="Только организаторы могут создавать заявки")
-
-    # Проверка существования артиста
-    artist = db.query(Artist).filter(Artist.artist_id == booking.artist_id).first()
-    if not artist:
-        raise HTTPException(status_code=404, detail="Артист не найден")
-
-    # Получение ID организатора
-    organizer = db.query(Organizer).filter(Organizer.user_id == current_user.id).first()
-    if not organizer:
-        raise HTTPException(status_code=400, detail="Создайте профиль организатора")
-
-    db_booking = Booking(
-        event_id=booking.event_id,
-        artist_id=booking.artist_id,
-        organizer_id=organizer.organizer_id,
-        status="pending",
-        proposed_price=booking.proposed_price,
-        technical_requirements=booking.technical_requirements
-    )
-    db.add(db_booking)
-    db.commit()
-    db.refresh(db_booking)
-
-    return db_booking
-
-
-@app.get("/api/bookings", response_model=List[BookingResponse], tags=["Бронирования"])
-def get_bookings(
-        current_user: User = Depends(get_current_active_user),
-        db: Session = Depends(get_db)
-):
-    """Получение списка бронирований пользователя"""
-    if current_user.role == "artist":
-        artist = db.query(Artist).filter(Artist.user_id == current_user.id).first()
-        if not artist:
-            return []
-        return db.query(Booking).filter(Booking.artist_id == artist.artist_id).all()
-
-    elif current_user.role == "organizer":
-        organizer = db.query(Organizer).filter(Organizer.user_id == current_user.id).first()
-        if not organizer:
-            return []
-        return db.query(Booking).filter(Booking.organizer_id == organizer.organizer_id).all()
-
-    return []
-
-
-@app.patch("/api/bookings/{booking_id}", response_model=BookingResponse, tags=["Бронирования"])
-def update_booking_status(
-        booking_id: int,
-        booking_update: BookingUpdate,
-        current_user: User = Depends(get_current_active_user),
-        db: Session = Depends(get_db)
-):
-    """Обновление статуса бронирования"""
-    booking = db.query(Booking).filter(Booking.booking_id == booking_id).first()
-    if not booking:
-        raise HTTPException(status_code=404, detail="Бронирование не найдено")
-
-    # Проверка прав доступа
-    if current_user.role == "artist":
-        artist = db.query(Artist).filter(Artist.user_id == current_user.id).first()
-        if not artist or booking.artist_id != artist.artist_id:
-            raise HTTPException(status_code=403, detail="Нет прав для изменения")
-
-    if booking_update.status:
-        booking.status = booking_update.status
-
-    if booking_update.response_deadline:
-        booking.response_deadline = booking_update.response_deadline
-
-    db.commit()
-    db.refresh(booking)
-    return booking
-
-
-# ==================== Ф7: СИСТЕМА КОММУНИКАЦИИ ====================
-
-@app.post("/api/messages", response_model=MessageResponse, tags=["Сообщения"])
-def send_message(
-        message: MessageCreate,
-        current_user: User = Depends(get_current_active_user),
-        db: Session = Depends(get_db)
-):
-    """Отправка сообщения"""
-    # Проверка существования получателя
-    receiver = db.query(User).filter(User.id == message.receiver_id).first()
-    if not receiver:
-        raise HTTPException(status_code=404, detail="Получатель не найден")
-
-    db_message = Message(
-        sender_id=current_user.id,
-        receiver_id=message.receiver_id,
-        booking_id=message.booking_id,
-        content=message.content,
-        is_read=False
-    )
-    db.add(db_message)
-    db.commit()
-    db.refresh(db_message)
-
-    return db_message
-
-
-@app.get("/api/messages", response_model=List[MessageResponse], tags=["Сообщения"])
-def get_messages(
-        current_user: User = Depends(get_current_active_user),
-        db: Session = Depends(get_db)
-):
-    """Получение сообщений текущего пользователя"""
-    messages = db.query(Message).filter(
-        (Message.sender_id == current_user.id) | (Message.receiver_id == current_user.id)
-    ).order_by(Message.sent_at.desc()).all()
-
-    return messages
-
-
-# ==================== Ф8: РЕЙТИНГ И ОТЗЫВЫ ====================
-
-@app.post("/api/reviews", response_model=ReviewResponse, tags=["Отзывы"])
-def create_review(
-        review: ReviewCreate,
-        current_user: User = Depends(get_current_active_user),
-        db: Session = Depends(get_db)
-):
-    """Создание отзыва"""
-    # Проверка существования бронирования
-    booking = db.query(Booking).filter(Booking.booking_id == review.booking_id).first()
-    if not booking:
-        raise HTTPException(status_code=404, detail="Бронирование не найдено")
-
-    if booking.status != "confirmed":
-        raise HTTPException(status_code=400, detail="Можно оставлять отзывы только для подтвержденных бронирований")
-
-    db_review = Review(
-        booking_id=review.booking_id,
-        reviewer_id=current_user.id,
-        reviewed_id=review.reviewed_id,
-        rating_score=review.rating_score,
-        comment=review.comment
-    )
-    db.add(db_review)
-    db.commit()
-    db.refresh(db_review)
-
-    # Обновление рейтинга артиста
-    if current_user.role == "organizer":
-        artist = db.query(Artist).filter(Artist.artist_id == booking.artist_id).first()
-        if artist:
-            reviews = db.query(Review).join(Booking).filter(
-                Booking.artist_id == artist.artist_id
-            ).all()
-            if reviews:
-                avg_rating = sum(r.rating_score for r in reviews) / len(reviews)
-                artist.rating = round(avg_rating, 2)
-                db.commit()
-
-    return db_review
-
-
-@app.get("/api/reviews/artist/{artist_id}", response_model=List[ReviewResponse], tags=["Отзывы"])
-def get_artist_reviews(artist_id: int, db: Session = Depends(get_db)):
-    """Получение отзывов об артисте"""
-    reviews = db.query(Review).join(Booking).filter(
-        Booking.artist_id == artist_id
-    ).all()
-    return reviews
-
-
-# ==================== ГЛАВНАЯ СТРАНИЦА ====================
-
-@app.get("/", tags=["Главная"])
-def read_root():
-    """Главная страница с информацией об API"""
-    return {
-        "message": "Добро пожаловать в МузПлатформу API",
-        "version": "1.0.0",
-        "docs": "/docs",
-        "features": [
-            "Регистрация и аутентификация пользователей",
-            "Управление профилями артистов и организаторов",
-            "Поиск и фильтрация артистов",
-            "Система бронирования",
-            "Внутренние сообщения",
-            "Рейтинги и отзывы"
-        ]
-    }
-
-
-if __name__ == "__main__":
+from fastapi import (
+    FastAPI, Depends, HTTPException, Query, Request, Response, WebSocket, WebSocketDisconnect, status
+)
+from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime, timedelta
+from typing import List, Optional
+from contextlib import asynccontextmanager
+import asyncio
+import uvicorn
+
+from database.database import DB_AUTO_MIGRATE, AsyncSessionLocal, get_db, upgrade_database
+from app.models.models import User, Artist, Organizer, Booking, Review, Message, Conversation
+from app.schemas.schemas import (
+    UserCreate, UserResponse, Token,
+    ArtistCreate, ArtistResponse, ArtistUpdate,
+    OrganizerCreate, OrganizerResponse,
+    BookingCreate, BookingResponse, BookingUpdate,
+    BookingBatchCreate, BookingBatchUpdate, BookingBatchResult,
+    ReviewCreate, ReviewResponse,
+    MessageCreate, MessageResponse, ConversationResponse, MessagesRead, UnreadCount,
+    ArtistSearch, SqlProfileRequest, SqlProfileResponse
+)
+from app.services.auth import (
+    get_password_hash_async, verify_password_async, password_needs_rehash, create_access_token,
+    get_current_user, get_current_active_user, get_current_admin, get_principal
+)
+from app.services import events
+from app.services import metrics, sql_profiler
+from app.services.events import STREAM_HEARTBEAT_SECONDS, format_sse, publish_to_users, user_channel
+from app.services.passwords import password_hasher
+from app.services.principals import Principal
+from app.services.ratings import apply_review
+from app.services.conversations import mark_read, record_message, thread_filter, unread_total
+from app.services.assets import StaticAssets
+from app.services.compression import CompressionMiddleware
+from app.services.serialization import page_response, response_columns, streaming_response
+from app.services.response_cache import CacheRule, ResponseCacheMiddleware, response_cache
+from app.services import search as artist_search
+from app.services.catalog import price_conditions
+from app.services.genres import artist_ids_with_genres, genre_names_by_artist, resolve_genres
+from app.services.pagination import NEXT_CURSOR_HEADER, PageParams, paginate, set_next_cursor
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Схема БД создается и обновляется миграциями (migrations/)
+    if DB_AUTO_MIGRATE:
+        await asyncio.to_thread(upgrade_database)
+    yield
+    password_hasher.shutdown()
+
+
+app = FastAPI(
+    title="МузПлатформа API",
+    description="API для платформы взаимодействия музыкальных исполнителей и организаторов",
+    version="1.0.0",
+    lifespan=lifespan
+)
+
+# Кеш публичных ответов с ETag; записи сбрасываются по меткам в обработчиках изменений
+app.add_middleware(
+    ResponseCacheMiddleware,
+    cache=response_cache,
+    rules=[
+        CacheRule("/api/artists", lambda p: ["artists"], anonymous_only=True),
+        CacheRule("/api/artists/{artist_id:int}", lambda p: [f"artist:{p['artist_id']}"]),
+        CacheRule("/api/organizers/{organizer_id:int}", lambda p: [f"organizer:{p['organizer_id']}"]),
+        CacheRule("/api/reviews/artist/{artist_id:int}", lambda p: [f"reviews:artist:{p['artist_id']}"]),
+    ],
+)
+
+# CORS для фронтенда
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag"],
+)
+
+# Сжатие снаружи кеша ответов: в кеше хранится несжатое тело, кодировка выбирается для каждого клиента
+app.add_middleware(CompressionMiddleware)
+
+# Метрики снаружи остальных middleware: время ответа включает кеш, CORS и сжатие
+app.add_middleware(metrics.MetricsMiddleware)
+
+# Статика из app/core/static; после сборки (python -m app.services.assets) — файлы с хешем и сжатые варианты
+app.mount("/static", StaticAssets(), name="static")
+
+# Главная страница перенаправляет на static/index.html
+from fastapi.responses import RedirectResponse
+
+
+@app.get("/")
+async def root():
+    """Перенаправление на главную страницу"""
+    return RedirectResponse(url="/static/index.html")
+
+
+# ==================== Ф1: РЕГИСТРАЦИЯ И АУТЕНТИФИКАЦИЯ ====================
+
+@app.post("/api/register", response_model=UserResponse, tags=["Аутентификация"])
+async def register_user(user: UserCreate, db: AsyncSession = Depends(get_db)):
+    """Регистрация нового пользователя (артист/организатор/админ)"""
+    # Проверка существования email
+    db_user = (await db.scalars(select(User).where(User.email == user.email))).first()
+    if db_user:
+        raise HTTPException(status_code=400, detail="Email уже зарегистрирован")
+
+    # Создание пользователя
+    hashed_password = await get_password_hash_async(user.password)
+    db_user = User(
+        email=user.email,
+        password_hash=hashed_password,
+        phone=user.phone,
+        role=user.role,
+        is_active=True
+    )
+    db.add(db_user)
+    await db.commit()
+    await db.refresh(db_user)
+
+    return db_user
+
+
+@app.post("/api/token", response_model=Token, tags=["Аутентификация"])
+async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_db)):
+    """Аутентификация и получение токена"""
+    user = (await db.scalars(select(User).where(User.email == form_data.username))).first()
+    if not user or not await verify_password_async(form_data.password, user.password_hash):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Неверный email или пароль",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    # Стоимость bcrypt изменилась — пересчитываем хеш, пока известен пароль
+    if password_needs_rehash(user.password_hash):
+        try:
+            user.password_hash = await get_password_hash_async(form_data.password)
+            await db.commit()
+        except HTTPException:
+            # Пул хеширования занят: пересчитаем при следующем входе
+            pass
+
+    access_token = create_access_token(data={"sub": user.email})
+    return {"access_token": access_token, "token_type": "bearer"}
+
+
+@app.get("/api/users/me", response_model=UserResponse, tags=["Пользователи"])
+async def get_current_user_info(current_user: Principal = Depends(get_current_active_user)):
+    """Получение информации о текущем пользователе"""
+    return current_user
+
+
+# ==================== Ф2: УПРАВЛЕНИЕ ПРОФИЛЕМ АРТИСТА ====================
+
+@app.post("/api/artists", response_model=ArtistResponse, tags=["Артисты"])
+async def create_artist_profile(
+        artist: ArtistCreate,
+        current_user: Principal = Depends(get_current_active_user),
+        db: AsyncSession = Depends(get_db)
+):
+    """Создание профиля артиста"""
+    if current_user.role != "artist":
+        raise HTTPException(status_code=403, detail="Только артисты могут создавать профиль артиста")
+
+    # Проверка существования профиля
+    if current_user.artist_id is not None:
+        raise HTTPException(status_code=400, detail="Профиль артиста уже существует")
+
+    db_artist = Artist(
+        user_id=current_user.id,
+        stage_name=artist.stage_name,
+        bio=artist.bio,
+        genres=await resolve_genres(db, artist.genres),
+        price_min=artist.price_min,
+        price_max=artist.price_max
+    )
+    db.add(db_artist)
+    await artist_search.index_artist(db, db_artist)
+    await db.commit()
+    await db.refresh(db_artist)
+    response_cache.invalidate("artists")
+
+    return db_artist
+
+
+@app.get("/api/artists/{artist_id}", response_model=ArtistResponse, tags=["Артисты"])
+async def get_artist_profile(artist_id: int, db: AsyncSession = Depends(get_db)):
+    """Получение профиля артиста"""
+    artist = (await db.scalars(select(Artist).where(Artist.artist_id == artist_id))).first()
+    if not artist:
+        raise HTTPException(status_code=404, detail="Артист не найден")
+    return artist
+
+
+@app.put("/api/artists/{artist_id}", response_model=ArtistResponse, tags=["Артисты"])
+async def update_artist_profile(
+        artist_id: int,
+        artist_update: ArtistUpdate,
+        current_user: Principal = Depends(get_current_active_user),
+        db: AsyncSession = Depends(get_db)
+):
+    """Обновление профиля артиста"""
+    artist = (await db.scalars(select(Artist).where(Artist.artist_id == artist_id))).first()
+    if not artist:
+        raise HTTPException(status_code=404, detail="Артист не найден")
+
+    if artist.artist_id != current_user.artist_id:
+        raise HTTPException(status_code=403, detail="Нет прав для редактирования")
+
+    update_data = artist_update.dict(exclude_unset=True)
+    if "genres" in update_data:
+        update_data["genres"] = await resolve_genres(db, update_data["genres"] or [])
+
+    for key, value in update_data.items():
+        setattr(artist, key, value)
+
+    await artist_search.index_artist(db, artist)
+    await db.commit()
+    await db.refresh(artist)
+    response_cache.invalidate(f"artist:{artist_id}", "artists")
+    return artist
+
+
+# ==================== Ф3: УПРАВЛЕНИЕ ПРОФИЛЕМ ОРГАНИЗАТОРА ====================
+
+@app.post("/api/organizers", response_model=OrganizerResponse, tags=["Организаторы"])
+async def create_organizer_profile(
+        organizer: OrganizerCreate,
+        current_user: Principal = Depends(get_current_active_user),
+        db: AsyncSession = Depends(get_db)
+):
+    """Создание профиля организатора"""
+    if current_user.role != "organizer":
+        raise HTTPException(status_code=403, detail="Только организаторы могут создавать профиль")
+
+    if current_user.organizer_id is not None:
+        raise HTTPException(status_code=400, detail="Профиль организатора уже существует")
+
+    db_organizer = Organizer(
+        user_id=current_user.id,
+        company_name=organizer.company_name,
+        description=organizer.description,
+        address=organizer.address,
+        website=organizer.website
+    )
+    db.add(db_organizer)
+    await db.commit()
+    await db.refresh(db_organizer)
+
+    return db_organizer
+
+
+@app.get("/api/organizers/{organizer_id}", response_model=OrganizerResponse, tags=["Организаторы"])
+async def get_organizer_profile(organizer_id: int, db: AsyncSession = Depends(get_db)):
+    """Получение профиля организатора"""
+    organizer = (await db.scalars(select(Organizer).where(Organizer.organizer_id == organizer_id))).first()
+    if not organizer:
+        raise HTTPException(status_code=404, detail="Организатор не найден")
+    return organizer
+
+
+# ==================== Ф4: ПОИСК И ФИЛЬТРАЦИЯ АРТИСТОВ ====================
+
+@app.get("/api/artists", response_model=List[ArtistResponse], tags=["Артисты"])
+async def search_artists(
+        genre: Optional[List[str]] = Query(None),
+        genre_match: str = Query("any", pattern="^(any|all)$"),
+        price_min: Optional[float] = None,
+        price_max: Optional[float] = None,
+        search: Optional[str] = None,
+        page: PageParams = Depends(),
+        db: AsyncSession = Depends(get_db)
+):
+    """
+    Поиск и фильтрация артистов (search — полнотекстовый поиск с ранжированием).
+    Несколько genre: genre_match=any — любой из жанров, all — все жанры.
+    Постранично: курсор следующей страницы возвращается в заголовке X-Next-Cursor.
+    """
+    # Быстрый путь: только колонки ответа, без ORM-объектов и валидации response_model
+    query = select(*response_columns(ArtistResponse, Artist, exclude={"genres"}))
+
+    if genre:
+        query = query.where(Artist.artist_id.in_(artist_ids_with_genres(genre, genre_match == "all")))
+
+    query = query.where(*price_conditions(db, price_min, price_max))
+
+    fts = artist_search.search_subquery(db, search) if search else None
+    if fts is not None:
+        query = query.join(fts, fts.c.artist_id == Artist.artist_id)
+        artists, next_cursor = await paginate(db, query, [fts.c.rank, Artist.artist_id], page)
+    else:
+        artists, next_cursor = await paginate(db, query, [Artist.rating, Artist.artist_id], page, descending=True)
+
+    genres = await genre_names_by_artist(db, [artist["artist_id"] for artist in artists])
+    for artist in artists:
+        artist["genres"] = genres[artist["artist_id"]]
+    return page_response(artists, next_cursor)
+
+
+# ==================== Ф5: ПОДАЧА И ОБРАБОТКА ЗАЯВОК ====================
+
+@app.post("/api/bookings", response_model=BookingResponse, tags=["Бронирования"])
+async def create_booking(
+        booking: BookingCreate,
+        current_user: Principal = Depends(get_current_active_user),
+        db: AsyncSession = Depends(get_db)
+):
+    """Создание заявки на бронирование"""
+    if current_user.role != "organizer":
+        raise HTTPException(status_code=403, detail="Только организаторы могут создавать заявки")
+
+    # Проверка существования артиста
+    artist = (await db.scalars(select(Artist).where(Artist.artist_id == booking.artist_id))).first()
+    if not artist:
+        raise HTTPException(status_code=404, detail="Артист не найден")
+
+    if current_user.organizer_id is None:
+        raise HTTPException(status_code=400, detail="Создайте профиль организатора")
+
+    db_booking = Booking(
+        event_id=booking.event_id,
+        artist_id=booking.artist_id,
+        organizer_id=current_user.organizer_id,
+        status="pending",
+        proposed_price=booking.proposed_price,
+        technical_requirements=booking.technical_requirements
+    )
+    db.add(db_booking)
+    await db.commit()
+    await db.refresh(db_booking)
+
+    return db_booking
+
+
+@app.get("/api/bookings", response_model=List[BookingResponse], tags=["Бронирования"])
+async def get_bookings(
+        page: PageParams = Depends(),
+        current_user: Principal = Depends(get_current_active_user),
+        db: AsyncSession = Depends(get_db)
+):
+    """Получение списка бронирований пользователя (новые первыми, постранично)"""
+    if current_user.role == "artist":
+        if current_user.artist_id is None:
+            return []
+        query = select(*response_columns(BookingResponse, Booking)).where(Booking.artist_id == current_user.artist_id)
+
+    elif current_user.role == "organizer":
+        if current_user.organizer_id is None:
+            return []
+        query = select(*response_columns(BookingResponse, Booking)).where(
+            Booking.organizer_id == current_user.organizer_id
+        )
+
+    else:
+        return []
+
+    bookings, next_cursor = await paginate(db, query, [Booking.created_at, Booking.booking_id], page, descending=True)
+    return page_response(bookings, next_cursor)
+
+
+@app.get("/api/bookings/export", response_model=List[BookingResponse], tags=["Бронирования"])
+async def export_bookings(
+        request: Request,
+        current_user: Principal = Depends(get_current_active_user),
+):
+    """
+    Все бронирования пользователя одним потоковым ответом (новые первыми).
+    JSON-массив по частям; с Accept: application/x-ndjson — по объекту в строке.
+    """
+    if current_user.artist_id is not None:
+        condition = Booking.artist_id == current_user.artist_id
+    elif current_user.organizer_id is not None:
+        condition = Booking.organizer_id == current_user.organizer_id
+    else:
+        return []
+
+    query = select(*response_columns(BookingResponse, Booking)).where(condition).order_by(
+        Booking.created_at.desc(), Booking.booking_id.desc()
+    )
+    return streaming_response(request, query)
+
+
+@app.patch("/api/bookings/{booking_id}", response_model=BookingResponse, tags=["Бронирования"])
+async def update_booking_status(
+        booking_id: int,
+        booking_update: BookingUpdate,
+        current_user: Principal = Depends(get_current_active_user),
+        db: AsyncSession = Depends(get_db)
+):
+    """Обновление статуса бронирования"""
+    booking = (await db.scalars(select(Booking).where(Booking.booking_id == booking_id))).first()
+    if not booking:
+        raise HTTPException(status_code=404, detail="Бронирование не найдено")
+
+    # Проверка прав доступа
+    if current_user.role == "artist" and booking.artist_id != current_user.artist_id:
+        raise HTTPException(status_code=403, detail="Нет прав для изменения")
+
+    status_changed = booking_update.status is not None and booking_update.status != booking.status
+    if booking_update.status:
+        booking.status = booking_update.status
+
+    if booking_update.response_deadline:
+        booking.response_deadline = booking_update.response_deadline
+
+    await db.commit()
+    await db.refresh(booking)
+
+    if status_changed:
+        parties = (await db.execute(
+            select(Artist.user_id, Organizer.user_id).where(
+                Artist.artist_id == booking.artist_id, Organizer.organizer_id == booking.organizer_id
+            )
+        )).one()
+        await publish_to_users(
+            parties, "booking_status", BookingResponse.model_validate(booking).model_dump(mode="json")
+        )
+    return booking
+
+
+@app.post("/api/bookings:batch", response_model=List[BookingBatchResult], tags=["Бронирования"])
+async def create_bookings_batch(
+        batch: BookingBatchCreate,
+        current_user: Principal = Depends(get_current_active_user),
+        db: AsyncSession = Depends(get_db)
+):
+    """Пакетное создание заявок: одна проверка артистов и одна вставка в транзакции"""
+    if current_user.role != "organizer":
+        raise HTTPException(status_code=403, detail="Только организаторы могут создавать заявки")
+
+    if current_user.organizer_id is None:
+        raise HTTPException(status_code=400, detail="Создайте профиль организатора")
+
+    artist_ids = {item.artist_id for item in batch.items}
+    existing = set((await db.scalars(select(Artist.artist_id).where(Artist.artist_id.in_(artist_ids)))).all())
+
+    results = [BookingBatchResult(index=index, status_code=200) for index in range(len(batch.items))]
+    rows, row_indexes = [], []
+    for index, item in enumerate(batch.items):
+        if item.artist_id not in existing:
+            results[index].status_code = 404
+            results[index].detail = "Артист не найден"
+            continue
+        rows.append({
+            "event_id": item.event_id,
+            "artist_id": item.artist_id,
+            "organizer_id": current_user.organizer_id,
+            "status": "pending",
+            "proposed_price": item.proposed_price,
+            "technical_requirements": item.technical_requirements,
+        })
+        row_indexes.append(index)
+
+    if rows:
+        # INSERT ... RETURNING пакетом; порядок id не гарантирован (PostgreSQL),
+        # поэтому SQLAlchemy возвращает строки в порядке параметров
+        created = (await db.scalars(insert(Booking).returning(Booking, sort_by_parameter_order=True), rows)).all()
+        await db.commit()
+        for index, db_booking in zip(row_indexes, created):
+            results[index].booking = BookingResponse.model_validate(db_booking)
+
+    return results
+
+
+@app.patch("/api/bookings:batch", response_model=List[BookingBatchResult], tags=["Бронирования"])
+async def update_bookings_batch(
+        batch: BookingBatchUpdate,
+        current_user: Principal = Depends(get_current_active_user),
+        db: AsyncSession = Depends(get_db)
+):
+    """Пакетное обновление статусов: одна выборка бронирований и один UPDATE в транзакции"""
+    booking_ids = {item.booking_id for item in batch.items}
+    # Бронирования вместе с пользователями сторон — для проверки прав и уведомлений
+    found = {
+        booking.booking_id: (booking, artist_user_id, organizer_user_id)
+        for booking, artist_user_id, organizer_user_id in (await db.execute(
+            select(Booking, Artist.user_id, Organizer.user_id)
+            .join(Artist, Artist.artist_id == Booking.artist_id)
+            .join(Organizer, Organizer.organizer_id == Booking.organizer_id)
+            .where(Booking.booking_id.in_(booking_ids))
+        )).all()
+    }
+
+    results = [BookingBatchResult(index=index, status_code=200) for index in range(len(batch.items))]
+    rows, row_indexes, seen = [], [], set()
+    for index, item in enumerate(batch.items):
+        if item.booking_id not in found:
+            results[index].status_code = 404
+            results[index].detail = "Бронирование не найдено"
+            continue
+        booking = found[item.booking_id][0]
+        if current_user.role == "artist" and booking.artist_id != current_user.artist_id:
+            results[index].status_code = 403
+            results[index].detail = "Нет прав для изменения"
+            continue
+        if item.booking_id in seen:
+            results[index].status_code = 400
+            results[index].detail = "Бронирование уже есть в пакете"
+            continue
+        seen.add(item.booking_id)
+
+        row = {"booking_id": item.booking_id, "updated_at": datetime.utcnow()}
+        if item.status:
+            row["status"] = item.status
+        if item.response_deadline:
+            row["response_deadline"] = item.response_deadline
+        rows.append(row)
+        row_indexes.append(index)
+
+    if not rows:
+        return results
+
+    previous_status = {booking_id: found[booking_id][0].status for booking_id in seen}
+    await db.execute(update(Booking), rows)
+    await db.commit()
+
+    updated = {
+        booking.booking_id: booking
+        for booking in (await db.scalars(
+            select(Booking).where(Booking.booking_id.in_(seen)).execution_options(populate_existing=True)
+        )).all()
+    }
+    for index in row_indexes:
+        booking = updated[batch.items[index].booking_id]
+        results[index].booking = BookingResponse.model_validate(booking)
+        if booking.status != previous_status[booking.booking_id]:
+            _, artist_user_id, organizer_user_id = found[booking.booking_id]
+            await publish_to_users(
+                [artist_user_id, organizer_user_id], "booking_status",
+                results[index].booking.model_dump(mode="json"),
+            )
+
+    return results
+
+
+# ==================== Ф7: СИСТЕМА КОММУНИКАЦИИ ====================
+
+@app.post("/api/messages", response_model=MessageResponse, tags=["Сообщения"])
+async def send_message(
+        message: MessageCreate,
+        current_user: Principal = Depends(get_current_active_user),
+        db: AsyncSession = Depends(get_db)
+):
+    """Отправка сообщения"""
+    # Проверка существования получателя
+    receiver = (await db.scalars(select(User).where(User.id == message.receiver_id))).first()
+    if not receiver:
+        raise HTTPException(status_code=404, detail="Получатель не найден")
+
+    db_message = Message(
+        sender_id=current_user.id,
+        receiver_id=message.receiver_id,
+        booking_id=message.booking_id,
+        content=message.content,
+        is_read=False
+    )
+    db.add(db_message)
+    await record_message(db, db_message)
+    await db.commit()
+    await db.refresh(db_message)
+
+    await publish_to_users(
+        [db_message.sender_id, db_message.receiver_id],
+        "message",
+        MessageResponse.model_validate(db_message).model_dump(mode="json"),
+    )
+    return db_message
+
+
+@app.get("/api/messages", response_model=List[MessageResponse], tags=["Сообщения"])
+async def get_messages(
+        page: PageParams = Depends(),
+        current_user: Principal = Depends(get_current_active_user),
+        db: AsyncSession = Depends(get_db)
+):
+    """Получение сообщений текущего пользователя (новые первыми, постранично)"""
+    query = select(*response_columns(MessageResponse, Message)).where(
+        (Message.sender_id == current_user.id) | (Message.receiver_id == current_user.id)
+    )
+
+    messages, next_cursor = await paginate(db, query, [Message.sent_at, Message.message_id], page, descending=True)
+    return page_response(messages, next_cursor)
+
+
+@app.get("/api/messages/export", response_model=List[MessageResponse], tags=["Сообщения"])
+async def export_messages(
+        request: Request,
+        current_user: Principal = Depends(get_current_active_user),
+):
+    """Вся переписка пользователя потоковым ответом (JSON-массив или NDJSON, новые первыми)"""
+    query = select(*response_columns(MessageResponse, Message)).where(
+        (Message.sender_id == current_user.id) | (Message.receiver_id == current_user.id)
+    ).order_by(Message.sent_at.desc(), Message.message_id.desc())
+    return streaming_response(request, query)
+
+
+@app.get("/api/messages/unread", response_model=UnreadCount, tags=["Сообщения"])
+async def get_unread_count(
+        current_user: Principal = Depends(get_current_active_user),
+        db: AsyncSession = Depends(get_db)
+):
+    """Количество непрочитанных сообщений"""
+    return {"unread_count": await unread_total(db, current_user.id)}
+
+
+@app.post("/api/messages/read", response_model=UnreadCount, tags=["Сообщения"])
+async def mark_messages_read(
+        read: MessagesRead,
+        current_user: Principal = Depends(get_current_active_user),
+        db: AsyncSession = Depends(get_db)
+):
+    """Отметка входящих сообщений прочитанными (всех, от собеседника или по бронированию)"""
+    await mark_read(db, current_user.id, read.counterpart_id, read.booking_id, read.up_to_message_id)
+    await db.commit()
+    return {"unread_count": await unread_total(db, current_user.id)}
+
+
+@app.get("/api/conversations", response_model=List[ConversationResponse], tags=["Сообщения"])
+async def get_conversations(
+        response: Response,
+        page: PageParams = Depends(),
+        current_user: Principal = Depends(get_current_active_user),
+        db: AsyncSession = Depends(get_db)
+):
+    """Диалоги пользователя с последним сообщением и числом непрочитанных (свежие первыми)"""
+    query = select(Conversation).where(Conversation.user_id == current_user.id)
+
+    conversations, next_cursor = await paginate(
+        db, query, [Conversation.last_message_at, Conversation.counterpart_id], page, descending=True
+    )
+    set_next_cursor(response, next_cursor)
+    return conversations
+
+
+@app.get("/api/conversations/{counterpart_id}/messages", response_model=List[MessageResponse], tags=["Сообщения"])
+async def get_conversation_messages(
+        counterpart_id: int,
+        page: PageParams = Depends(),
+        current_user: Principal = Depends(get_current_active_user),
+        db: AsyncSession = Depends(get_db)
+):
+    """Переписка с собеседником (новые первыми, постранично)"""
+    query = select(*response_columns(MessageResponse, Message)).where(thread_filter(current_user.id, counterpart_id))
+
+    messages, next_cursor = await paginate(db, query, [Message.sent_at, Message.message_id], page, descending=True)
+    return page_response(messages, next_cursor)
+
+
+@app.get("/api/bookings/{booking_id}/messages", response_model=List[MessageResponse], tags=["Сообщения"])
+async def get_booking_messages(
+        booking_id: int,
+        page: PageParams = Depends(),
+        current_user: Principal = Depends(get_current_active_user),
+        db: AsyncSession = Depends(get_db)
+):
+    """Переписка по бронированию (новые первыми, постранично)"""
+    booking = (await db.scalars(select(Booking).where(Booking.booking_id == booking_id))).first()
+    if not booking:
+        raise HTTPException(status_code=404, detail="Бронирование не найдено")
+
+    if booking.artist_id != current_user.artist_id and booking.organizer_id != current_user.organizer_id:
+        raise HTTPException(status_code=403, detail="Нет доступа к переписке")
+
+    query = select(*response_columns(MessageResponse, Message)).where(Message.booking_id == booking_id)
+
+    messages, next_cursor = await paginate(db, query, [Message.sent_at, Message.message_id], page, descending=True)
+    return page_response(messages, next_cursor)
+
+
+# ==================== Ф7: ДОСТАВКА СОБЫТИЙ (WebSocket / SSE) ====================
+
+async def _authenticate_stream(token: Optional[str]) -> Optional[Principal]:
+    """Проверка токена для долгих соединений: сессия БД закрывается сразу после проверки"""
+    if not token:
+        return None
+    async with AsyncSessionLocal() as db:
+        principal = await get_principal(token, db)
+    return principal if principal is not None and principal.is_active else None
+
+
+async def _wait_websocket_closed(websocket: WebSocket):
+    try:
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+
+
+@app.websocket("/api/ws")
+async def events_websocket(websocket: WebSocket, token: Optional[str] = None):
+    """События пользователя: новые сообщения и изменения статусов бронирований (JWT в параметре token)"""
+    principal = await _authenticate_stream(token)
+    if principal is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+    async with events.broker.subscribe(user_channel(principal.id)) as subscription:
+        closed = asyncio.create_task(_wait_websocket_closed(websocket))
+        try:
+            while True:
+                next_event = asyncio.ensure_future(subscription.get(STREAM_HEARTBEAT_SECONDS))
+                await asyncio.wait({next_event, closed}, return_when=asyncio.FIRST_COMPLETED)
+                if closed.done():
+                    next_event.cancel()
+                    break
+                if subscription.overflowed:
+                    # Клиент пропустил события и должен перезапросить данные
+                    await websocket.send_json({"type": "overflow", "data": {}})
+                    await websocket.close()
+                    break
+                await websocket.send_json(next_event.result() or {"type": "ping", "data": {}})
+        finally:
+            closed.cancel()
+
+
+@app.get("/api/events", tags=["Сообщения"])
+async def events_stream(request: Request, token: Optional[str] = None):
+    """
+    События пользователя через Server-Sent Events.
+    JWT передается в заголовке Authorization или в параметре token (для EventSource).
+    """
+    authorization = request.headers.get("authorization", "")
+    if authorization.lower().startswith("bearer "):
+        token = authorization[7:]
+
+    principal = await _authenticate_stream(token)
+    if principal is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Не удалось проверить учетные данные",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    async def stream():
+        async with events.broker.subscribe(user_channel(principal.id)) as subscription:
+            yield ": connected\n\n"
+            while not await request.is_disconnected():
+                event = await subscription.get(STREAM_HEARTBEAT_SECONDS)
+                if subscription.overflowed:
+                    yield format_sse({"type": "overflow", "data": {}})
+                    break
+                yield format_sse(event) if event else ": ping\n\n"
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# ==================== Ф8: РЕЙТИНГ И ОТЗЫВЫ ====================
+
+@app.post("/api/reviews", response_model=ReviewResponse, tags=["Отзывы"])
+async def create_review(
+        review: ReviewCreate,
+        current_user: Principal = Depends(get_current_active_user),
+        db: AsyncSession = Depends(get_db)
+):
+    """Создание отзыва"""
+    # Проверка существования бронирования
+    booking = (await db.scalars(select(Booking).where(Booking.booking_id == review.booking_id))).first()
+    if not booking:
+        raise HTTPException(status_code=404, detail="Бронирование не найдено")
+
+    if booking.status != "confirmed":
+        raise HTTPException(status_code=400, detail="Можно оставлять отзывы только для подтвержденных бронирований")
+
+    db_review = Review(
+        booking_id=review.booking_id,
+        reviewer_id=current_user.id,
+        reviewed_id=review.reviewed_id,
+        rating_score=review.rating_score,
+        comment=review.comment
+    )
+    db.add(db_review)
+
+    # Обновление рейтинга артиста (или организатора, если отзыв оставил артист)
+    await apply_review(db, booking, current_user.role, review.rating_score)
+    await db.commit()
+    await db.refresh(db_review)
+    response_cache.invalidate(
+        f"reviews:artist:{booking.artist_id}",
+        f"artist:{booking.artist_id}",
+        f"organizer:{booking.organizer_id}",
+        "artists",
+    )
+
+    return db_review
+
+
+@app.get("/api/reviews/artist/{artist_id}", response_model=List[ReviewResponse], tags=["Отзывы"])
+async def get_artist_reviews(
+        artist_id: int,
+        response: Response,
+        page: PageParams = Depends(),
+        db: AsyncSession = Depends(get_db)
+):
+    """Получение отзывов об артисте (новые первыми, постранично)"""
+    query = select(Review).join(Booking).where(
+        Booking.artist_id == artist_id
+    )
+
+    reviews, next_cursor = await paginate(db, query, [Review.created_at, Review.review_id], page, descending=True)
+    set_next_cursor(response, next_cursor)
+    return reviews
+
+
+# ==================== ДИАГНОСТИКА ====================
+
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    """Метрики процесса в текстовом формате Prometheus"""
+    return PlainTextResponse(metrics.registry.render(), media_type=metrics.CONTENT_TYPE)
+
+
+@app.post("/api/admin/sql-profile", response_model=SqlProfileResponse, tags=["Администрирование"])
+async def profile_sql(
+        profile: SqlProfileRequest,
+        request: Request,
+        current_user: Principal = Depends(get_current_admin),
+):
+    """Выполнение запроса к API с трассировкой SQL: время каждого запроса и признаки N+1"""
+    headers = dict(profile.headers)
+    if not any(key.lower() == "authorization" for key in headers):
+        headers["Authorization"] = request.headers["Authorization"]
+    return await sql_profiler.profile_request(
+        request.app, profile.method, profile.path, profile.params, headers, profile.body
+    )
+
+
+# ==================== ГЛАВНАЯ СТРАНИЦА ====================
+
+@app.get("/", tags=["Главная"])
+async def read_root():
+    """Главная страница с информацией об API"""
+    return {
+        "message": "Добро пожаловать в МузПлатформу API",
+        "version": "1.0.0",
+        "docs": "/docs",
+        "features": [
+            "Регистрация и аутентификация пользователей",
+            "Управление профилями артистов и организаторов",
+            "Поиск и фильтрация артистов",
+            "Система бронирования",
+            "Внутренние сообщения",
+            "Рейтинги и отзывы"
+        ]
+    }
+
+
+if __name__ == "__main__":
     uvicorn.run("main:app", host="127.0.0.1", port=8010, reload=True)
\ No newline at end of file
@@ -1,128 +1,226 @@
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, ForeignKey, Text, Enum
-from sqlalchemy.orm import relationship
-from datetime import datetime
-import enum
-
-from database.database import Base
-
-class UserRole(str, enum.Enum):
-    artist = "artist"
-    organizer = "organizer"
-    admin = "admin"
-
-
-class BookingStatus(str, enum.Enum):
-    pending = "pending"
-    confirmed = "confirmed"
-    declined = "declined"
-    cancelled = "cancelled"
-
-
-class User(Base):
-    __tablename__ = "users"
-
-    id = Column(Integer, primary_key=True, index=True)
-    email = Column(String, unique=True, index=True, nullable=False)
-    password_hash = Column(String, nullable=False)
-    phone = Column(String, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    last_login = Column(DateTime, nullable=True)
-    is_active = Column(Boolean, default=True)
-    role = Column(Enum(UserRole), nullable=False)
-
-    # Связи
-    artist_profile = relationship("Artist", back_populates="user", uselist=False)
-    organizer_profile = relationship("Organizer", back_populates="user", uselist=False)
-    sent_messages = relationship("Message", foreign_keys="Message.sender_id", back_populates="sender")
-    received_messages = relationship("Message", foreign_keys="Message.receiver_id", back_populates="receiver")
-    reviews_written = relationship("Review", foreign_keys="Review.reviewer_id", back_populates="reviewer")
-    reviews_received = relationship("Review", foreign_keys="Review.reviewed_id", back_populates="reviewed")
-
-
-class Artist(Base):
-    __tablename__ = "artists"
-
-    artist_id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), unique=True, nullable=False)
-    stage_name = Column(String, nullable=False)
-    bio = Column(Text, nullable=True)
-    genres = Column(String, nullable=True)  # Хранится как строка через запятую
-    price_min = Column(Float, nullable=True)
-    price_max = Column(Float, nullable=True)
-    rating = Column(Float, default=0.0)
-
-    # Связи
-    user = relationship("User", back_populates="artist_profile")
-    bookings = relationship("Booking", back_populates="artist")
-
-
-class Organizer(Base):
-    __tablename__ = "organizers"
-
-    organizer_id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), unique=True, nullable=False)
-    company_name = Column(String, nullable=False)
-    description = Column(Text, nullable=True)
-    address = Column(String, nullable=True)
-    website = Column(String, nullable=True)
-    rating = Column(Float, default=0.0)
-
-    # Связи
-    user = relationship("User", back_populates="organizer_profile")
-    bookings = relationship("Booking", back_populates="organizer")
-
-
-class Booking(Base):
-    __tablename__ = "bookings"
-
-    booking_id = Column(Integer, primary_key=True, index=True)
-    event_id = Column(Integer, nullable=True)  # Связь с событием (пока не реализовано)
-    artist_id = Column(Integer, ForeignKey("artists.artist_id"), nullable=False)
-    organizer_id = Column(Integer, ForeignKey("organizers.organizer_id"), nullable=False)
-    status = Column(Enum(BookingStatus), default=BookingStatus.pending)
-    proposed_price = Column(Float, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    response_deadline = Column(DateTime, nullable=True)
-    technical_requirements = Column(Text, nullable=True)
-
-    # Связи
-    artist = relationship("Artist", back_populates="bookings")
-    organizer = relationship("Organizer", back_populates="bookings")
-    reviews = relationship("Review", back_populates="booking")
-    messages = relationship("Message", back_populates="booking")
-
-
-class Review(Base):
-    __tablename__ = "reviews"
-
-    review_id = Column(Integer, primary_key=True, index=True)
-    booking_id = Column(Integer, ForeignKey("bookings.booking_id"), nullable=False)
-    reviewer_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    reviewed_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    rating_score = Column(Float, nullable=False)  # От 1.0 до 5.0
-    comment = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    is_verified = Column(Boolean, default=False)
-
-    # Связи
-    booking = relationship("Booking", back_populates="reviews")
-    reviewer = relationship("User", foreign_keys=[reviewer_id], back_populates="reviews_written")
-    reviewed = relationship("User", foreign_keys=[reviewed_id], back_populates="reviews_received")
-
-
-class Message(Base):
-    __tablename__ = "messages"
-
-    message_id = Column(Integer, primary_key=True, index=True)
-    sender_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    receiver_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    booking_id = Column(Integer, ForeignKey("bookings.booking_id"), nullable=True)
-    content = Column(Text, nullable=False)
-    sent_at = Column(DateTime, default=datetime.utcnow)
-    is_read = Column(Boolean, default=False)
-
-    # Связи
-    sender = relationship("User", foreign_keys=[sender_id], back_populates="sent_messages")
-    receiver = relationship("User", foreign_keys=[receiver_id], back_populates="received_messages")
-    booking = relationship("Booking", back_populates="messages")
\ No newline at end of file
+from sqlalchemy import (
+    Column, Integer, String, Float, Boolean, DateTime, ForeignKey, Text, Enum, DDL, Index, Table, event
+)
+from sqlalchemy.orm import relationship
+from datetime import datetime
+import enum
+
+from database.database import Base
+
+class UserRole(str, enum.Enum):
+    artist = "artist"
+    organizer = "organizer"
+    admin = "admin"
+
+
+class BookingStatus(str, enum.Enum):
+    pending = "pending"
+    confirmed = "confirmed"
+    declined = "declined"
+    cancelled = "cancelled"
+
+
+class User(Base):
+    __tablename__ = "users"
+
+    id = Column(Integer, primary_key=True, index=True)
+    email = Column(String, unique=True, index=True, nullable=False)
+    password_hash = Column(String, nullable=False)
+    phone = Column(String, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    last_login = Column(DateTime, nullable=True)
+    is_active = Column(Boolean, default=True)
+    role = Column(Enum(UserRole), nullable=False)
+
+    # Связи
+    artist_profile = relationship("Artist", back_populates="user", uselist=False)
+    organizer_profile = relationship("Organizer", back_populates="user", uselist=False)
+    sent_messages = relationship("Message", foreign_keys="Message.sender_id", back_populates="sender")
+    received_messages = relationship("Message", foreign_keys="Message.receiver_id", back_populates="receiver")
+    reviews_written = relationship("Review", foreign_keys="Review.reviewer_id", back_populates="reviewer")
+    reviews_received = relationship("Review", foreign_keys="Review.reviewed_id", back_populates="reviewed")
+
+
+class Artist(Base):
+    __tablename__ = "artists"
+
+    artist_id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), unique=True, nullable=False)
+    stage_name = Column(String, nullable=False)
+    bio = Column(Text, nullable=True)
+    price_min = Column(Float, nullable=True)
+    price_max = Column(Float, nullable=True)
+    rating = Column(Float, default=0.0)  # rating_sum / rating_count
+    rating_sum = Column(Float, nullable=False, default=0.0, server_default="0")
+    rating_count = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # Связи
+    user = relationship("User", back_populates="artist_profile")
+    bookings = relationship("Booking", back_populates="artist")
+    genres = relationship(
+        "Genre", secondary="artist_genres", back_populates="artists", lazy="selectin", order_by="Genre.name"
+    )
+
+    __table_args__ = (
+        # Фильтр по цене и сортировка каталога по рейтингу
+        Index("ix_artists_price_min", "price_min"),
+        Index("ix_artists_price_max", "price_max"),
+        Index("ix_artists_rating_artist_id", "rating", "artist_id"),
+    )
+
+
+# Связь артист <-> жанр. Индекс (genre_id, artist_id) — инвертированный индекс для фильтра по жанрам
+artist_genres = Table(
+    "artist_genres",
+    Base.metadata,
+    Column("artist_id", Integer, ForeignKey("artists.artist_id", ondelete="CASCADE"), primary_key=True),
+    Column("genre_id", Integer, ForeignKey("genres.genre_id", ondelete="CASCADE"), primary_key=True),
+    Index("ix_artist_genres_genre_id_artist_id", "genre_id", "artist_id"),
+)
+
+
+class Genre(Base):
+    __tablename__ = "genres"
+
+    genre_id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, unique=True, index=True, nullable=False)  # В нижнем регистре
+
+    # Связи
+    artists = relationship("Artist", secondary=artist_genres, back_populates="genres")
+
+
+# Полнотекстовый индекс артистов (stage_name, bio, genres).
+# Синхронизируется в app/services/search.py, rowid / artist_id совпадает с Artist.artist_id
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS artists_fts USING fts5("
+        "stage_name, bio, genres, tokenize = 'porter unicode61 remove_diacritics 2')"
+    ).execute_if(dialect="sqlite"),
+)
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL(
+        "CREATE TABLE IF NOT EXISTS artists_fts ("
+        "artist_id INTEGER PRIMARY KEY REFERENCES artists (artist_id) ON DELETE CASCADE, "
+        "document TSVECTOR NOT NULL); "
+        "CREATE INDEX IF NOT EXISTS ix_artists_fts_document ON artists_fts USING GIN (document)"
+    ).execute_if(dialect="postgresql"),
+)
+event.listen(Base.metadata, "before_drop", DDL("DROP TABLE IF EXISTS artists_fts"))
+
+
+class Organizer(Base):
+    __tablename__ = "organizers"
+
+    organizer_id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), unique=True, nullable=False)
+    company_name = Column(String, nullable=False)
+    description = Column(Text, nullable=True)
+    address = Column(String, nullable=True)
+    website = Column(String, nullable=True)
+    rating = Column(Float, default=0.0)  # rating_sum / rating_count
+    rating_sum = Column(Float, nullable=False, default=0.0, server_default="0")
+    rating_count = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # Связи
+    user = relationship("User", back_populates="organizer_profile")
+    bookings = relationship("Booking", back_populates="organizer")
+
+
+class Booking(Base):
+    __tablename__ = "bookings"
+
+    booking_id = Column(Integer, primary_key=True, index=True)
+    event_id = Column(Integer, nullable=True)  # Связь с событием (пока не реализовано)
+    artist_id = Column(Integer, ForeignKey("artists.artist_id"), nullable=False)
+    organizer_id = Column(Integer, ForeignKey("organizers.organizer_id"), nullable=False)
+    status = Column(Enum(BookingStatus), default=BookingStatus.pending)
+    proposed_price = Column(Float, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    response_deadline = Column(DateTime, nullable=True)
+    technical_requirements = Column(Text, nullable=True)
+
+    # Связи
+    artist = relationship("Artist", back_populates="bookings")
+    organizer = relationship("Organizer", back_populates="bookings")
+    reviews = relationship("Review", back_populates="booking")
+    messages = relationship("Message", back_populates="booking")
+
+    __table_args__ = (
+        # Списки бронирований участника (новые первыми) и выборки по статусу
+        Index("ix_bookings_artist_id_created_at", "artist_id", "created_at", "booking_id"),
+        Index("ix_bookings_organizer_id_created_at", "organizer_id", "created_at", "booking_id"),
+        Index("ix_bookings_artist_id_status_created_at", "artist_id", "status", "created_at"),
+        Index("ix_bookings_organizer_id_status_created_at", "organizer_id", "status", "created_at"),
+    )
+
+
+class Review(Base):
+    __tablename__ = "reviews"
+
+    review_id = Column(Integer, primary_key=True, index=True)
+    booking_id = Column(Integer, ForeignKey("bookings.booking_id"), nullable=False)
+    reviewer_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    reviewed_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    rating_score = Column(Float, nullable=False)  # От 1.0 до 5.0
+    comment = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    is_verified = Column(Boolean, default=False)
+
+    # Связи
+    booking = relationship("Booking", back_populates="reviews")
+    reviewer = relationship("User", foreign_keys=[reviewer_id], back_populates="reviews_written")
+    reviewed = relationship("User", foreign_keys=[reviewed_id], back_populates="reviews_received")
+
+    __table_args__ = (
+        # Отзывы по бронированию: соединение с bookings и проверка повторного отзыва
+        Index("ix_reviews_booking_id_reviewer_id", "booking_id", "reviewer_id"),
+    )
+
+
+class Message(Base):
+    __tablename__ = "messages"
+
+    message_id = Column(Integer, primary_key=True, index=True)
+    sender_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    receiver_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    booking_id = Column(Integer, ForeignKey("bookings.booking_id"), nullable=True)
+    content = Column(Text, nullable=False)
+    sent_at = Column(DateTime, default=datetime.utcnow)
+    is_read = Column(Boolean, default=False)
+
+    # Связи
+    sender = relationship("User", foreign_keys=[sender_id], back_populates="sent_messages")
+    receiver = relationship("User", foreign_keys=[receiver_id], back_populates="received_messages")
+    booking = relationship("Booking", back_populates="messages")
+
+    __table_args__ = (
+        # Переписка пары пользователей в обоих направлениях и общий список сообщений пользователя
+        Index("ix_messages_sender_id_receiver_id_sent_at", "sender_id", "receiver_id", "sent_at", "message_id"),
+        Index("ix_messages_receiver_id_sender_id_sent_at", "receiver_id", "sender_id", "sent_at", "message_id"),
+        # Непрочитанные сообщения пользователя по собеседникам
+        Index("ix_messages_receiver_id_is_read_sender_id", "receiver_id", "is_read", "sender_id"),
+        Index("ix_messages_booking_id_sent_at", "booking_id", "sent_at", "message_id"),
+    )
+
+
+class Conversation(Base):
+    """Диалог пользователя с собеседником: последнее сообщение и счетчик непрочитанных"""
+    __tablename__ = "conversations"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    counterpart_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    last_message_id = Column(Integer, ForeignKey("messages.message_id"), nullable=False)
+    last_message_at = Column(DateTime, nullable=False)
+    unread_count = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # Связи
+    last_message = relationship("Message", lazy="joined")
+
+    __table_args__ = (
+        Index("ix_conversations_user_id_last_message_at", "user_id", "last_message_at", "counterpart_id"),
+    )
\ No newline at end of file
@@ -0,0 +1,189 @@
+"""
+Сборка и раздача статики: имена с хешем содержимого, заранее сжатые варианты (br, gzip)
+и манифест. Сборка:
+
+    python -m app.services.assets
+
+Файлы с хешем в имени кешируются навсегда (immutable); HTML и исходные имена — с проверкой по ETag.
+Без собранного манифеста статика отдается из исходного каталога как есть (режим разработки).
+"""
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import shutil
+from pathlib import Path
+from typing import Dict, Optional
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, PlainTextResponse, Response
+from starlette.staticfiles import StaticFiles
+
+from app.services.compression import COMPRESSIBLE_TYPES, SUPPORTED_ENCODINGS, accepted_encodings, compress
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+STATIC_SOURCE_DIR = Path(os.getenv("STATIC_SOURCE_DIR", ROOT_DIR / "app" / "core" / "static"))
+STATIC_BUILD_DIR = Path(os.getenv("STATIC_BUILD_DIR", ROOT_DIR / "build" / "static"))
+
+MANIFEST_NAME = "manifest.json"
+HASH_LENGTH = 12
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+# Страницы открываются по постоянным адресам (/static/index.html) и не переименовываются
+UNHASHED_SUFFIXES = (".html",)
+# Ссылки на статику внутри HTML, CSS и JS: /static/css/style.css
+STATIC_URL = re.compile(r"(?<![\w.-])/static/([\w./-]+)")
+
+
+def _media_type(name: str) -> str:
+    return mimetypes.guess_type(name)[0] or "application/octet-stream"
+
+
+def _is_text(name: str) -> bool:
+    return _media_type(name) in COMPRESSIBLE_TYPES
+
+
+def _build_order(name: str) -> int:
+    # Файлы собираются после тех, на которые могут ссылаться: картинки -> CSS -> JS -> HTML
+    if name.endswith(UNHASHED_SUFFIXES):
+        return 3
+    if name.endswith(".js"):
+        return 2
+    return 1 if name.endswith(".css") else 0
+
+
+def _hashed_name(name: str, digest: str) -> str:
+    stem, dot, suffix = name.rpartition(".")
+    return f"{stem}.{digest}.{suffix}" if dot else f"{name}.{digest}"
+
+
+# ==================== СБОРКА ====================
+
+def build_assets(source: Path = STATIC_SOURCE_DIR, target: Path = STATIC_BUILD_DIR) -> dict:
+    """Собирает статику из source в target и возвращает манифест"""
+    source, target = Path(source), Path(target)
+    if target.exists():
+        shutil.rmtree(target)
+    target.mkdir(parents=True)
+
+    names = sorted(
+        (path.relative_to(source).as_posix() for path in source.rglob("*") if path.is_file()),
+        key=lambda name: (_build_order(name), name),
+    )
+    assets: Dict[str, str] = {}
+    files: Dict[str, dict] = {}
+
+    def rewrite(match):
+        return "/static/" + assets.get(match.group(1), match.group(1))
+
+    for name in names:
+        content = (source / name).read_bytes()
+        if _is_text(name):
+            # Ссылки на уже собранные файлы заменяются на имена с хешем
+            content = STATIC_URL.sub(rewrite, content.decode("utf-8")).encode("utf-8")
+
+        digest = hashlib.sha256(content).hexdigest()[:HASH_LENGTH]
+        immutable = not name.endswith(UNHASHED_SUFFIXES)
+        served = _hashed_name(name, digest) if immutable else name
+        path = target / served
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+
+        encodings = {}
+        if _is_text(name):
+            for encoding in SUPPORTED_ENCODINGS:
+                compressed = compress(content, encoding)
+                # Вариант хранится, только если он меньше исходного файла
+                if len(compressed) < len(content):
+                    Path(str(path) + ENCODING_SUFFIXES[encoding]).write_bytes(compressed)
+                    encodings[encoding] = len(compressed)
+
+        assets[name] = served
+        files[served] = {
+            "etag": digest,
+            "size": len(content),
+            "encodings": encodings,
+            "immutable": immutable,
+        }
+
+    manifest = {"assets": assets, "files": files}
+    (target / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2, ensure_ascii=False), encoding="utf-8")
+    return manifest
+
+
+def load_manifest(target: Path = STATIC_BUILD_DIR) -> Optional[dict]:
+    path = Path(target) / MANIFEST_NAME
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+# ==================== РАЗДАЧА ====================
+
+def _etag_matches(header: Optional[str], etag: str) -> bool:
+    if not header:
+        return False
+    tags = [tag.strip() for tag in header.split(",")]
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+
+class StaticAssets:
+    """ASGI-приложение для /static: собранные файлы по манифесту с выбором сжатого варианта"""
+
+    def __init__(self, source: Path = STATIC_SOURCE_DIR, build: Path = STATIC_BUILD_DIR):
+        self.build = Path(build)
+        self.manifest = load_manifest(self.build)
+        # Без сборки — исходные файлы; ответы API-уровня сжимает CompressionMiddleware
+        self.fallback = StaticFiles(directory=source) if self.manifest is None else None
+
+    async def __call__(self, scope, receive, send):
+        if self.fallback is not None:
+            await self.fallback(scope, receive, send)
+            return
+        response = self.get_response(scope)
+        await response(scope, receive, send)
+
+    def get_response(self, scope) -> Response:
+        if scope["method"] not in ("GET", "HEAD"):
+            return PlainTextResponse("Method Not Allowed", status_code=405)
+
+        # Mount передает путь внутри точки монтирования: /static/css/a.css -> /css/a.css.
+        # Поиск только по манифесту, поэтому выйти за каталог сборки нельзя
+        name = scope["path"].lstrip("/")
+        entry = self.manifest["files"].get(name)
+        cache_control = IMMUTABLE_CACHE_CONTROL
+        if entry is None and name in self.manifest["assets"]:
+            # Старое имя без хеша (закладки, внешние ссылки): то же содержимое, но с проверкой
+            name = self.manifest["assets"][name]
+            entry = self.manifest["files"][name]
+            cache_control = REVALIDATE_CACHE_CONTROL
+        if entry is None:
+            return PlainTextResponse("Not Found", status_code=404)
+        if not entry["immutable"]:
+            cache_control = REVALIDATE_CACHE_CONTROL
+
+        request_headers = Headers(scope=scope)
+        encodings = accepted_encodings(request_headers.get("accept-encoding"), list(entry["encodings"]))
+        encoding = encodings[0] if encodings else None
+        # У каждого представления свой сильный ETag
+        etag = f'"{entry["etag"]}-{encoding}"' if encoding else f'"{entry["etag"]}"'
+        headers = {"ETag": etag, "Cache-Control": cache_control}
+        if entry["encodings"]:
+            headers["Vary"] = "Accept-Encoding"
+        if _etag_matches(request_headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+
+        path = self.build / name
+        if encoding:
+            headers["Content-Encoding"] = encoding
+            path = Path(str(path) + ENCODING_SUFFIXES[encoding])
+        return FileResponse(path, headers=headers, media_type=_media_type(name), method=scope["method"])
+
+
+if __name__ == "__main__":
+    built = build_assets()
+    total = sum(entry["size"] for entry in built["files"].values())
+    print(f"Собрано файлов: {len(built['files'])}, {total} байт -> {STATIC_BUILD_DIR}")
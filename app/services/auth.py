@@ -1,117 +1,163 @@
-from datetime import datetime, timedelta
-from typing import Optional
-
-import bcrypt
-from jose import JWTError, jwt
-from passlib.context import CryptContext
-from fastapi import Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
-from database.database import get_db
-from app.models.models import User
-
-# Конфигурация безопасности
-SECRET_KEY = "your-secret-key-change-in-production-min-32-chars"
-ALGORITHM = "HS256"
-ACCESS_TOKEN_EXPIRE_MINUTES = 1440  # 24 часа
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/token")
-
-
-# ==================== ХЕШИРОВАНИЕ ПАРОЛЕЙ ====================
-
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Проверка пароля"""
-    return pwd_context.verify(plain_password, hashed_password)
-
-
-def get_password_hash(password: str) -> str:
-    """
-    Хеширует пароль с помощью bcrypt.
-    """
-    # Обрезаем пароль до 72 символов (по требованию bcrypt)
-    # Если пароль длиннее 72 символов, используется только первая часть.
-    # Мы кодируем его в байты перед обрезкой, хотя в большинстве случаев
-    # обрезка строки достаточна для ASCII/UTF-8.
-    password_bytes = password.encode('utf-8')
-    truncated_password = password_bytes[:72]
-
-    # Генерация соли и хеширование
-    salt = bcrypt.gensalt()
-    hash_bytes = bcrypt.hashpw(truncated_password, salt)
-
-    # Возвращаем хеш в виде строки
-    return hash_bytes.decode('utf-8')
-
-
-# ==================== JWT ТОКЕНЫ ====================
-
-def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
-    """Создание JWT токена"""
-    to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
-
-
-def decode_access_token(token: str):
-    """Декодирование JWT токена"""
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        email: str = payload.get("sub")
-        if email is None:
-            return None
-        return email
-    except JWTError:
-        return None
-
-
-# ==================== ЗАВИСИМОСТИ ДЛЯ АУТЕНТИФИКАЦИИ ====================
-
-async def get_current_user(
-        token: str = Depends(oauth2_scheme),
-        db: Session = Depends(get_db)
-) -> User:
-    """Получение текущего пользователя из токена"""
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Не удалось проверить учетные данные",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-
-    email = decode_access_token(token)
-    if email is None:
-        raise credentials_exception
-
-    user = db.query(User).filter(User.email == email).first()
-    if user is None:
-        raise credentials_exception
-
-    return user
-
-
-async def get_current_active_user(
-        current_user: User = Depends(get_current_user)
-) -> User:
-    """Проверка активности пользователя"""
-    if not current_user.is_active:
-        raise HTTPException(status_code=400, detail="Неактивный пользователь")
-    return current_user
-
-
-async def get_current_admin(
-        current_user: User = Depends(get_current_active_user)
-) -> User:
-    """Проверка прав администратора"""
-    if current_user.role != "admin":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Недостаточно прав"
-        )
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+
+from jose import JWTError, jwt
+from fastapi import Depends, HTTPException, status
+from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.database import get_db
+from app.models.models import Artist, Organizer, User
+from app.services import metrics, passwords
+from app.services.principals import Principal, principal_cache
+
+# Конфигурация безопасности
+SECRET_KEY = "your-secret-key-change-in-production-min-32-chars"
+ALGORITHM = "HS256"
+ACCESS_TOKEN_EXPIRE_MINUTES = 1440  # 24 часа
+
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/token")
+
+
+# ==================== ХЕШИРОВАНИЕ ПАРОЛЕЙ ====================
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Проверка пароля"""
+    return passwords.check_password(plain_password, hashed_password)
+
+
+def get_password_hash(password: str) -> str:
+    """
+    Хеширует пароль с помощью bcrypt.
+    """
+    return passwords.hash_password(password, passwords.BCRYPT_ROUNDS)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Хеш создан с другой стоимостью, чем BCRYPT_ROUNDS"""
+    return passwords.get_rounds(hashed_password) != passwords.BCRYPT_ROUNDS
+
+
+async def _run_password_job(func, *args):
+    """Выполняет bcrypt в пуле хеширования; при переполнении очереди — 503"""
+    started = time.perf_counter()
+    try:
+        result = await passwords.password_hasher.run(func, *args)
+    except passwords.PasswordHasherBusy:
+        metrics.password_hash_rejected.inc()
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Сервис перегружен, повторите попытку позже",
+            headers={"Retry-After": str(passwords.PASSWORD_HASH_RETRY_AFTER)},
+        )
+    metrics.password_hash_duration.observe(time.perf_counter() - started, func.__name__)
+    return result
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Проверка пароля в пуле хеширования"""
+    return await _run_password_job(passwords.check_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Хеширование пароля в пуле хеширования"""
+    return await _run_password_job(passwords.hash_password, password, passwords.BCRYPT_ROUNDS)
+
+
+# ==================== JWT ТОКЕНЫ ====================
+
+def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
+    """Создание JWT токена"""
+    to_encode = data.copy()
+    if expires_delta:
+        expire = datetime.utcnow() + expires_delta
+    else:
+        expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+
+    to_encode.update({"exp": expire})
+    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return encoded_jwt
+
+
+def decode_access_token_payload(token: str) -> Optional[dict]:
+    """Декодирование JWT токена с проверкой подписи и срока действия"""
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except JWTError:
+        return None
+    if payload.get("sub") is None:
+        return None
+    return payload
+
+
+def decode_access_token(token: str):
+    """Декодирование JWT токена"""
+    payload = decode_access_token_payload(token)
+    return payload["sub"] if payload else None
+
+
+# ==================== ЗАВИСИМОСТИ ДЛЯ АУТЕНТИФИКАЦИИ ====================
+
+async def get_principal(token: str, db: AsyncSession) -> Optional[Principal]:
+    """Пользователь по токену (из кеша principal_cache или БД); None, если токен недействителен"""
+    principal = principal_cache.get(token)
+    if principal is not None:
+        return principal
+
+    payload = decode_access_token_payload(token)
+    if payload is None:
+        return None
+
+    # Один запрос: пользователь и id его профилей через LEFT JOIN (без жанров и прочих полей профиля)
+    user = (await db.scalars(
+        select(User)
+        .options(
+            joinedload(User.artist_profile).load_only(Artist.artist_id).noload(Artist.genres),
+            joinedload(User.organizer_profile).load_only(Organizer.organizer_id),
+        )
+        .where(User.email == payload["sub"])
+    )).first()
+    if user is None:
+        return None
+
+    principal = Principal.from_user(user)
+    principal_cache.set(token, principal, payload.get("exp"))
+    return principal
+
+
+async def get_current_user(
+        token: str = Depends(oauth2_scheme),
+        db: AsyncSession = Depends(get_db)
+) -> Principal:
+    """Получение текущего пользователя из токена"""
+    principal = await get_principal(token, db)
+    if principal is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Не удалось проверить учетные данные",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return principal
+
+
+async def get_current_active_user(
+        current_user: Principal = Depends(get_current_user)
+) -> Principal:
+    """Проверка активности пользователя"""
+    if not current_user.is_active:
+        raise HTTPException(status_code=400, detail="Неактивный пользователь")
+    return current_user
+
+
+async def get_current_admin(
+        current_user: Principal = Depends(get_current_active_user)
+) -> Principal:
+    """Проверка прав администратора"""
+    if current_user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Недостаточно прав"
+        )
     return current_user
\ No newline at end of file
@@ -0,0 +1,26 @@
+from typing import List, Optional
+
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.models import Artist
+
+
+def selective(db: AsyncSession, condition):
+    """
+    Помечает условие как выборочное для планировщика SQLite.
+    Без статистики SQLite обходит весь индекс сортировки (rating) вместо поиска по индексу цены.
+    """
+    if db.get_bind().dialect.name == "sqlite":
+        return func.unlikely(condition)
+    return condition
+
+
+def price_conditions(db: AsyncSession, price_min: Optional[float], price_max: Optional[float]) -> List:
+    """Условия фильтра каталога по цене"""
+    conditions = []
+    if price_min:
+        conditions.append(selective(db, Artist.price_min >= price_min))
+    if price_max:
+        conditions.append(selective(db, Artist.price_max <= price_max))
+    return conditions
@@ -0,0 +1,172 @@
+"""
+Сжатие ответов: выбор кодировки по Accept-Encoding и middleware для ответов API.
+Статика сжимается заранее при сборке (app/services/assets.py) и здесь не пережимается.
+"""
+import gzip
+import os
+import zlib
+from typing import List, Optional, Sequence
+
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import brotli
+except ImportError:  # без brotli — только gzip
+    brotli = None
+
+# Ответы меньше порога не сжимаются: выигрыш меньше накладных расходов
+COMPRESS_MIN_BYTES = int(os.getenv("COMPRESS_MIN_BYTES", "1024"))
+# Уровни для сжатия на лету (статика при сборке сжимается максимально)
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "4"))
+
+# Кодировки в порядке предпочтения сервера
+SUPPORTED_ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+COMPRESSIBLE_TYPES = (
+    "text/html", "text/css", "text/plain", "text/csv",
+    "application/json", "application/x-ndjson", "application/javascript", "text/javascript",
+    "image/svg+xml",
+)
+
+
+def accepted_encodings(header: Optional[str], available: Sequence[str] = SUPPORTED_ENCODINGS) -> List[str]:
+    """
+    Кодировки из available, которые принимает клиент, от лучшей к худшей:
+    по q из Accept-Encoding, при равном q — в порядке available
+    """
+    weights = {}
+    for part in (header or "").split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        weights[name] = quality
+
+    ranked = []
+    for position, encoding in enumerate(available):
+        quality = weights.get(encoding, weights.get("*", 0.0))
+        if quality > 0:
+            ranked.append((-quality, position, encoding))
+    return [encoding for _, _, encoding in sorted(ranked)]
+
+
+def weak_etag(etag: str) -> str:
+    """Сжатое представление не совпадает побайтно с исходным — сильный ETag становится слабым"""
+    return etag if etag.startswith("W/") else f"W/{etag}"
+
+
+# ==================== СЖАТИЕ ПОТОКА ====================
+
+class _GzipStream:
+    def __init__(self):
+        # wbits=31 — формат gzip (заголовок и контрольная сумма)
+        self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        # Z_SYNC_FLUSH отдает клиенту все, что накоплено: части потоковой выдачи не задерживаются
+        chunk = self._compressor.compress(data)
+        return chunk + self._compressor.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+class _BrotliStream:
+    def __init__(self):
+        self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        chunk = self._compressor.process(data)
+        return chunk + (self._compressor.finish() if final else self._compressor.flush())
+
+
+def compress(data: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+    """Сжимает данные целиком (для сборки статики)"""
+    if encoding == "br":
+        return brotli.compress(data, quality=11 if level is None else level)
+    # mtime=0 — одинаковый результат для одинакового содержимого
+    return gzip.compress(data, compresslevel=9 if level is None else level, mtime=0)
+
+
+def _compressible(headers: Headers) -> bool:
+    content_type = headers.get("content-type", "").split(";")[0].strip().lower()
+    return content_type in COMPRESSIBLE_TYPES and "content-encoding" not in headers
+
+
+# ==================== MIDDLEWARE ====================
+
+class CompressionMiddleware:
+    """
+    ASGI middleware: сжимает ответы текстовых типов (JSON, NDJSON, HTML) в br или gzip.
+    Потоковые ответы сжимаются по частям с flush; SSE и уже сжатые ответы не трогаются
+    """
+
+    def __init__(self, app, minimum_size: int = COMPRESS_MIN_BYTES):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encodings = accepted_encodings(Headers(scope=scope).get("accept-encoding"))
+        if not encodings:
+            await self.app(scope, receive, send)
+            return
+
+        encoding = encodings[0]
+        start_message = None
+        stream = None
+        # None — решение еще не принято (ждем первую часть тела)
+        compressing: Optional[bool] = None
+
+        async def send_wrapper(message):
+            nonlocal start_message, stream, compressing
+            if message["type"] == "http.response.start":
+                start_message = message
+                headers = Headers(raw=message["headers"])
+                if message["status"] in (204, 304) or not _compressible(headers):
+                    compressing = False
+                    await send(message)
+                return
+            if message["type"] != "http.response.body" or compressing is False:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if compressing is None:
+                if not more_body and len(body) < self.minimum_size:
+                    compressing = False
+                    await send(start_message)
+                    await send(message)
+                    return
+                compressing = True
+                stream = _BrotliStream() if encoding == "br" else _GzipStream()
+                headers = MutableHeaders(raw=start_message["headers"])
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                if "etag" in headers:
+                    headers["ETag"] = weak_etag(headers["etag"])
+                del headers["Content-Length"]
+                if not more_body:
+                    body = stream.compress(body, final=True)
+                    headers["Content-Length"] = str(len(body))
+                    await send(start_message)
+                    await send({"type": "http.response.body", "body": body})
+                    return
+                await send(start_message)
+
+            await send({
+                "type": "http.response.body",
+                "body": stream.compress(body, final=not more_body),
+                "more_body": more_body,
+            })
+
+        await self.app(scope, receive, send_wrapper)
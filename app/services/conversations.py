@@ -0,0 +1,146 @@
+import asyncio
+import sys
+from typing import Optional
+
+from sqlalchemy import case, delete, false, func, insert, literal, select, union_all, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.models import Conversation, Message
+
+
+def _upsert(db: AsyncSession):
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    return dialect.insert(Conversation)
+
+
+def thread_filter(user_id: int, counterpart_id: int):
+    """Условие на сообщения между двумя пользователями в обе стороны"""
+    return (
+        ((Message.sender_id == user_id) & (Message.receiver_id == counterpart_id))
+        | ((Message.sender_id == counterpart_id) & (Message.receiver_id == user_id))
+    )
+
+
+async def record_message(db: AsyncSession, message: Message) -> None:
+    """Обновляет диалоги отправителя и получателя (в транзакции с вставкой сообщения)"""
+    await db.flush()
+    sides = [(message.sender_id, message.receiver_id, 0)]
+    if message.receiver_id != message.sender_id:
+        sides.append((message.receiver_id, message.sender_id, 1))
+
+    for user_id, counterpart_id, unread in sides:
+        stmt = _upsert(db).values(
+            user_id=user_id,
+            counterpart_id=counterpart_id,
+            last_message_id=message.message_id,
+            last_message_at=message.sent_at,
+            unread_count=unread,
+        )
+        await db.execute(stmt.on_conflict_do_update(
+            index_elements=[Conversation.user_id, Conversation.counterpart_id],
+            set_={
+                "last_message_id": stmt.excluded.last_message_id,
+                "last_message_at": stmt.excluded.last_message_at,
+                "unread_count": Conversation.unread_count + unread,
+            },
+        ))
+
+
+async def mark_read(
+        db: AsyncSession,
+        user_id: int,
+        counterpart_id: Optional[int] = None,
+        booking_id: Optional[int] = None,
+        up_to_message_id: Optional[int] = None,
+) -> int:
+    """Отмечает входящие сообщения прочитанными одним UPDATE и пересчитывает счетчики диалогов"""
+    conditions = [Message.receiver_id == user_id, Message.is_read == false()]
+    if counterpart_id is not None:
+        conditions.append(Message.sender_id == counterpart_id)
+    if booking_id is not None:
+        conditions.append(Message.booking_id == booking_id)
+    if up_to_message_id is not None:
+        conditions.append(Message.message_id <= up_to_message_id)
+
+    result = await db.execute(
+        update(Message).where(*conditions).values(is_read=True).execution_options(synchronize_session=False)
+    )
+    if not result.rowcount:
+        return 0
+
+    # Счетчики пересчитываются по индексу (receiver_id, is_read, sender_id)
+    unread = (
+        select(func.count())
+        .where(
+            Message.receiver_id == user_id,
+            Message.is_read == false(),
+            Message.sender_id == Conversation.counterpart_id,
+        )
+        .scalar_subquery()
+    )
+    stmt = update(Conversation).where(Conversation.user_id == user_id, Conversation.unread_count > 0)
+    if counterpart_id is not None:
+        stmt = stmt.where(Conversation.counterpart_id == counterpart_id)
+    await db.execute(stmt.values(unread_count=unread).execution_options(synchronize_session=False))
+    return result.rowcount
+
+
+async def unread_total(db: AsyncSession, user_id: int) -> int:
+    """Общее число непрочитанных сообщений пользователя"""
+    total = await db.scalar(
+        select(func.coalesce(func.sum(Conversation.unread_count), 0)).where(Conversation.user_id == user_id)
+    )
+    return int(total)
+
+
+async def rebuild_conversations(db: AsyncSession) -> int:
+    """Пересобирает таблицу диалогов по всем сообщениям одним GROUP BY"""
+    sides = union_all(
+        select(
+            Message.sender_id.label("user_id"),
+            Message.receiver_id.label("counterpart_id"),
+            Message.message_id,
+            Message.sent_at,
+            literal(0).label("unread"),
+        ),
+        select(
+            Message.receiver_id,
+            Message.sender_id,
+            Message.message_id,
+            Message.sent_at,
+            case((Message.is_read == false(), 1), else_=0),
+        ).where(Message.receiver_id != Message.sender_id),
+    ).subquery()
+
+    await db.execute(delete(Conversation))
+    result = await db.execute(
+        insert(Conversation).from_select(
+            ["user_id", "counterpart_id", "last_message_id", "last_message_at", "unread_count"],
+            select(
+                sides.c.user_id,
+                sides.c.counterpart_id,
+                func.max(sides.c.message_id),
+                func.max(sides.c.sent_at),
+                func.sum(sides.c.unread),
+            ).group_by(sides.c.user_id, sides.c.counterpart_id),
+        )
+    )
+    await db.commit()
+    return result.rowcount
+
+
+if __name__ == "__main__":
+    # python -m app.services.conversations rebuild
+    if sys.argv[1:] != ["rebuild"]:
+        print("Использование: python -m app.services.conversations rebuild")
+        sys.exit(1)
+
+    from database.database import AsyncSessionLocal, upgrade_database
+
+    async def main():
+        async with AsyncSessionLocal() as session:
+            print(f"Диалогов: {await rebuild_conversations(session)}")
+
+    upgrade_database()
+    asyncio.run(main())
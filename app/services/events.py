@@ -0,0 +1,103 @@
+import asyncio
+import json
+import os
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional, Set
+
+# Максимум неотправленных событий на одного подписчика
+SUBSCRIBER_QUEUE_SIZE = int(os.getenv("SUBSCRIBER_QUEUE_SIZE", "100"))
+# Интервал служебных сообщений, поддерживающих соединение
+STREAM_HEARTBEAT_SECONDS = float(os.getenv("STREAM_HEARTBEAT_SECONDS", "15"))
+
+
+def user_channel(user_id: int) -> str:
+    """Канал событий пользователя"""
+    return f"user:{user_id}"
+
+
+class Subscription:
+    """Очередь событий одного подключения (WebSocket или SSE)"""
+
+    def __init__(self, maxsize: int):
+        self.queue: "asyncio.Queue[dict]" = asyncio.Queue(maxsize=maxsize)
+        # Подписчик не успевал читать и пропустил события — клиент должен перезапросить данные
+        self.overflowed = False
+
+    def put(self, event: dict) -> None:
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[dict]:
+        """Следующее событие или None, если за timeout событий не было"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class Broker(ABC):
+    """
+    Интерфейс pub/sub для доставки событий подключенным клиентам.
+    При нескольких процессах приложения подключается реализация поверх общего брокера.
+    """
+
+    @abstractmethod
+    async def publish(self, channel: str, event: dict) -> None:
+        ...
+
+    @abstractmethod
+    def subscribe(self, channel: str) -> "AsyncIterator[Subscription]":
+        """Асинхронный контекстный менеджер подписки на канал"""
+
+
+class InProcessBroker(Broker):
+    """Брокер в памяти процесса: события получают подписчики этого же процесса"""
+
+    def __init__(self, queue_size: int = SUBSCRIBER_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._subscribers: Dict[str, Set[Subscription]] = {}
+
+    async def publish(self, channel: str, event: dict) -> None:
+        for subscription in list(self._subscribers.get(channel, ())):
+            subscription.put(event)
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str):
+        subscription = Subscription(self.queue_size)
+        self._subscribers.setdefault(channel, set()).add(subscription)
+        try:
+            yield subscription
+        finally:
+            subscribers = self._subscribers.get(channel)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[channel]
+
+    def subscriber_count(self) -> int:
+        return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+
+broker: Broker = InProcessBroker()
+
+
+def set_broker(new_broker: Broker) -> None:
+    """Заменяет брокер (например, на общий для нескольких процессов)"""
+    global broker
+    broker = new_broker
+
+
+async def publish_to_users(user_ids, event_type: str, data: dict) -> None:
+    """Публикует событие в каналы пользователей (после commit)"""
+    event = {"type": event_type, "data": data}
+    for user_id in set(user_ids):
+        await broker.publish(user_channel(user_id), event)
+
+
+def format_sse(event: dict) -> str:
+    """Событие в формате text/event-stream"""
+    payload = json.dumps(event["data"], ensure_ascii=False, default=str)
+    return f"event: {event['type']}\ndata: {payload}\n\n"
@@ -0,0 +1,109 @@
+import asyncio
+import sys
+from typing import Dict, Iterable, List
+
+from sqlalchemy import func, inspect, select, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.models import Artist, Genre, artist_genres
+
+
+def normalize_genres(names: Iterable[str]) -> List[str]:
+    """Приводит названия жанров к нижнему регистру и убирает пустые и повторяющиеся"""
+    result = []
+    for name in names or []:
+        name = name.strip().lower()
+        if name and name not in result:
+            result.append(name)
+    return result
+
+
+async def resolve_genres(db: AsyncSession, names: Iterable[str]) -> List[Genre]:
+    """
+    Возвращает жанры по названиям, создавая недостающие.
+    Недостающие вставляются с ON CONFLICT DO NOTHING: одновременное создание
+    того же жанра другим запросом не приводит к ошибке уникальности.
+    """
+    names = normalize_genres(names)
+    if not names:
+        return []
+
+    existing = {g.name: g for g in await db.scalars(select(Genre).where(Genre.name.in_(names)))}
+    missing = [name for name in names if name not in existing]
+    if missing:
+        dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+        await db.execute(
+            dialect.insert(Genre)
+            .values([{"name": name} for name in missing])
+            .on_conflict_do_nothing(index_elements=[Genre.name])
+        )
+        existing.update({g.name: g for g in await db.scalars(select(Genre).where(Genre.name.in_(missing)))})
+    return [existing[name] for name in names]
+
+
+async def genre_names_by_artist(db: AsyncSession, artist_ids: Iterable[int]) -> Dict[int, List[str]]:
+    """Названия жанров артистов одним запросом (по алфавиту, как связь Artist.genres)"""
+    result = {artist_id: [] for artist_id in artist_ids}
+    if result:
+        rows = await db.execute(
+            select(artist_genres.c.artist_id, Genre.name)
+            .join(Genre, Genre.genre_id == artist_genres.c.genre_id)
+            .where(artist_genres.c.artist_id.in_(list(result)))
+            .order_by(Genre.name)
+        )
+        for artist_id, name in rows:
+            result[artist_id].append(name)
+    return result
+
+
+def artist_ids_with_genres(names: Iterable[str], match_all: bool = False):
+    """
+    Подзапрос artist_id артистов с указанными жанрами.
+    match_all=False — хотя бы один из жанров (OR), True — все жанры (AND).
+    """
+    names = normalize_genres(names)
+    stmt = (
+        select(artist_genres.c.artist_id)
+        .join(Genre, Genre.genre_id == artist_genres.c.genre_id)
+        .where(Genre.name.in_(names))
+    )
+    if match_all and len(names) > 1:
+        stmt = stmt.group_by(artist_genres.c.artist_id).having(func.count() == len(names))
+    return stmt
+
+
+async def backfill_legacy_genres(db: AsyncSession) -> int:
+    """Переносит жанры из старой колонки artists.genres (строка через запятую) в таблицу жанров"""
+    connection = await db.connection()
+    columns = await connection.run_sync(lambda conn: {c["name"] for c in inspect(conn).get_columns("artists")})
+    if "genres" not in columns:
+        return 0
+
+    count = 0
+    rows = await db.execute(text("SELECT artist_id, genres FROM artists WHERE genres IS NOT NULL AND genres != ''"))
+    for artist_id, genres in rows.all():
+        artist = await db.get(Artist, artist_id)
+        artist.genres = await resolve_genres(db, genres.split(","))
+        await db.flush()
+        count += 1
+    await db.commit()
+    return count
+
+
+if __name__ == "__main__":
+    # python -m app.services.genres backfill
+    if sys.argv[1:] != ["backfill"]:
+        print("Использование: python -m app.services.genres backfill")
+        sys.exit(1)
+
+    from database.database import AsyncSessionLocal, upgrade_database
+    from app.services.search import rebuild_index
+
+    async def main():
+        async with AsyncSessionLocal() as session:
+            print(f"Перенесены жанры артистов: {await backfill_legacy_genres(session)}")
+            print(f"Проиндексировано артистов: {await rebuild_index(session)}")
+
+    upgrade_database()
+    asyncio.run(main())
@@ -0,0 +1,270 @@
+import os
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from starlette.routing import Match
+
+# METRICS_ENABLED=0 — не собирать метрики (эндпоинт /metrics отдает пустой ответ)
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "1") == "1"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 50, 100)
+FAST_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+# ==================== ТИПЫ МЕТРИК ====================
+# Метрики живут в памяти процесса; при нескольких воркерах Prometheus опрашивает каждый.
+# Обновления без блокировок: все происходит в потоке event loop
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in sorted(self._values.items())
+        ]
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # labels -> [счетчики по корзинам (последняя — +Inf), сумма, количество]
+        self._values: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        entry = self._values.get(labels)
+        if entry is None:
+            entry = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        entry[0][bisect_left(self.buckets, value)] += 1
+        entry[1] += value
+        entry[2] += 1
+
+    def count(self, *labels: str) -> int:
+        entry = self._values.get(labels)
+        return entry[2] if entry else 0
+
+    def sum(self, *labels: str) -> float:
+        entry = self._values.get(labels)
+        return entry[1] if entry else 0.0
+
+    def samples(self) -> List[str]:
+        lines = []
+        for labels, (counts, total, count) in sorted(self._values.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(float(bound)) if bound != float("inf") else "+Inf"}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {count}")
+        return lines
+
+
+class Gauge:
+    """Значения читаются в момент опроса: callback возвращает {значения меток: значение}"""
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str],
+                 callback: Callable[[], Dict[Tuple[str, ...], float]]):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.callback = callback
+
+    def samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in sorted(self.callback().items())
+        ]
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+
+    def register(self, metric):
+        self._metrics[metric.name] = metric
+        return metric
+
+    def get(self, name: str):
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Все метрики в текстовом формате Prometheus"""
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+http_request_duration = registry.register(Histogram(
+    "http_request_duration_seconds", "Время обработки HTTP-запроса", ("method", "route", "status"),
+))
+db_queries_per_request = registry.register(Histogram(
+    "db_queries_per_request", "Число SQL-запросов на HTTP-запрос", ("route",), QUERY_COUNT_BUCKETS,
+))
+db_time_per_request = registry.register(Histogram(
+    "db_time_per_request_seconds", "Суммарное время SQL-запросов на HTTP-запрос", ("route",),
+))
+db_queries = registry.register(Counter("db_queries_total", "Выполнено SQL-запросов"))
+db_query_duration = registry.register(Histogram(
+    "db_query_duration_seconds", "Время выполнения SQL-запроса", buckets=FAST_BUCKETS,
+))
+db_pool_checkouts = registry.register(Counter(
+    "db_pool_checkouts_total", "Выдано соединений из пула", ("engine",),
+))
+db_pool_wait = registry.register(Histogram(
+    "db_pool_wait_seconds", "Ожидание соединения из пула (включая открытие нового)", ("engine",), FAST_BUCKETS,
+))
+password_hash_duration = registry.register(Histogram(
+    "password_hash_duration_seconds", "Время bcrypt с учетом очереди пула хеширования", ("operation",),
+))
+password_hash_rejected = registry.register(Counter(
+    "password_hash_rejected_total", "Отклонено задач bcrypt из-за переполнения очереди",
+))
+
+
+# ==================== УЧЕТ ЗАПРОСОВ К БД ====================
+
+@dataclass
+class RequestStats:
+    """SQL-запросы текущего HTTP-запроса"""
+    queries: int = 0
+    db_time: float = 0.0
+    # ASGI scope запроса: маршрут для журнала медленных запросов
+    scope: Optional[dict] = None
+
+
+# Статистика текущего HTTP-запроса (None вне запроса — служебные команды, фоновые задачи)
+current_request: ContextVar[Optional[RequestStats]] = ContextVar("current_request", default=None)
+
+
+def record_query(duration: float) -> None:
+    """Вызывается из after_cursor_execute (database/database.py)"""
+    if not METRICS_ENABLED:
+        return
+    db_queries.inc()
+    db_query_duration.observe(duration)
+    stats = current_request.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_time += duration
+
+
+def record_pool_checkout(engine_name: str, wait: float) -> None:
+    if not METRICS_ENABLED:
+        return
+    db_pool_checkouts.inc(engine_name)
+    db_pool_wait.observe(wait, engine_name)
+
+
+def register_pool_gauges(pools: Dict[str, Callable]) -> None:
+    """Занятые соединения и размер пулов движков; NullPool и StaticPool их не ведут и пропускаются"""
+    def reader(method: str):
+        def read():
+            values = {}
+            for engine_name, get_pool in pools.items():
+                pool = get_pool()
+                if hasattr(pool, method):
+                    values[(engine_name,)] = getattr(pool, method)()
+            return values
+        return read
+
+    registry.register(Gauge("db_pool_checked_out", "Занято соединений пула", ("engine",), reader("checkedout")))
+    registry.register(Gauge("db_pool_size", "Размер пула", ("engine",), reader("size")))
+
+
+# ==================== MIDDLEWARE ====================
+
+def route_template(scope) -> str:
+    """
+    Шаблон маршрута запроса. Ответы из кеша (ResponseCacheMiddleware) не доходят до роутера,
+    поэтому маршрут ищется по таблице маршрутов приложения
+    """
+    route = scope.get("route")
+    if route is None and "app" in scope:
+        for candidate in scope["app"].router.routes:
+            if candidate.matches(scope)[0] == Match.FULL:
+                route = candidate
+                break
+    return getattr(route, "path", None) or "unmatched"
+
+
+class MetricsMiddleware:
+    """ASGI middleware: время ответа по шаблону маршрута и SQL-запросы на HTTP-запрос"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not METRICS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats(scope=scope)
+        token = current_request.set(stats)
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            current_request.reset(token)
+            # Шаблон пути, а не сам путь: число рядов метрики не растет с числом id
+            route_path = route_template(scope)
+            http_request_duration.observe(
+                time.perf_counter() - started, scope["method"], route_path, str(status_code)
+            )
+            db_queries_per_request.observe(stats.queries, route_path)
+            db_time_per_request.observe(stats.db_time, route_path)
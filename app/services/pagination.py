@@ -0,0 +1,94 @@
+import base64
+import json
+import os
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, Query, Response
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Размер страницы по умолчанию и верхняя граница для параметра limit
+PAGE_SIZE_DEFAULT = int(os.getenv("PAGE_SIZE_DEFAULT", "50"))
+PAGE_SIZE_MAX = int(os.getenv("PAGE_SIZE_MAX", "200"))
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class PageParams:
+    """Параметры страницы: непрозрачный курсор и размер страницы (не больше PAGE_SIZE_MAX)"""
+
+    def __init__(self, cursor: Optional[str] = None, limit: Optional[int] = Query(None, ge=1)):
+        self.cursor = cursor
+        self.limit = min(limit or PAGE_SIZE_DEFAULT, PAGE_SIZE_MAX)
+
+
+# ==================== КУРСОРЫ ====================
+
+def encode_cursor(values: Sequence) -> str:
+    """Кодирует значения ключей сортировки последней записи в непрозрачный курсор"""
+    payload = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: Sequence) -> list:
+    """Декодирует курсор и приводит значения к типам колонок сортировки"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError
+        return [
+            datetime.fromisoformat(v) if v is not None and column.type.python_type is datetime else v
+            for v, column in zip(values, columns)
+        ]
+    except (ValueError, TypeError, NotImplementedError):
+        raise HTTPException(status_code=400, detail="Некорректный курсор")
+
+
+# ==================== KEYSET-ПАГИНАЦИЯ ====================
+
+def _after(columns: Sequence, descending: bool, values: list):
+    """Условие "строго после курсора" для ключей с одинаковым направлением сортировки"""
+    if len(columns) == 1:
+        return columns[0] < values[0] if descending else columns[0] > values[0]
+    if descending:
+        return tuple_(*columns) < tuple_(*values)
+    return tuple_(*columns) > tuple_(*values)
+
+
+async def paginate(
+        db: AsyncSession, stmt: Select, order_by: Sequence, page: PageParams, descending: bool = False
+) -> Tuple[List, Optional[str]]:
+    """
+    Возвращает страницу запроса и курсор следующей страницы (None, если это последняя).
+    order_by — уникальный набор ключей сортировки, последним должен идти первичный ключ.
+    Запрос одной сущности дает объекты, запрос колонок — словари {имя колонки: значение}.
+    """
+    names = [description["name"] for description in stmt.column_descriptions]
+    columns = list(order_by)
+    if page.cursor:
+        stmt = stmt.where(_after(columns, descending, decode_cursor(page.cursor, columns)))
+
+    ordering = [c.desc() if descending else c.asc() for c in columns]
+    rows = (await db.execute(
+        stmt.order_by(None)
+        .order_by(*ordering)
+        .add_columns(*[c.label(f"_page_key_{i}") for i, c in enumerate(columns)])
+        .limit(page.limit + 1)
+    )).all()
+
+    next_cursor = None
+    if len(rows) > page.limit:
+        rows = rows[:page.limit]
+        next_cursor = encode_cursor(rows[-1][len(names):])
+    if len(names) == 1:
+        return [row[0] for row in rows], next_cursor
+    return [dict(zip(names, row)) for row in rows], next_cursor
+
+
+def set_next_cursor(response: Response, next_cursor: Optional[str]) -> None:
+    """Передает курсор следующей страницы в заголовке ответа"""
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
@@ -0,0 +1,87 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Callable, Optional
+
+import bcrypt
+
+# Стоимость bcrypt (log2 числа раундов). При изменении хеши пересчитываются при входе
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
+# Отдельный пул процессов для bcrypt, чтобы хеширование не отнимало CPU у остальных запросов.
+# PASSWORD_HASH_WORKERS=0 — считать в пуле потоков текущего процесса
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(max(1, (os.cpu_count() or 2) // 2))))
+# Максимум задач в работе и в очереди; сверх него запросы сразу получают 503
+PASSWORD_HASH_QUEUE_SIZE = int(os.getenv("PASSWORD_HASH_QUEUE_SIZE", "32"))
+PASSWORD_HASH_RETRY_AFTER = int(os.getenv("PASSWORD_HASH_RETRY_AFTER", "1"))
+
+
+class PasswordHasherBusy(Exception):
+    """Очередь хеширования заполнена"""
+
+
+# ==================== BCRYPT ====================
+# Функции верхнего уровня: выполняются в процессах пула
+
+def hash_password(password: str, rounds: int = BCRYPT_ROUNDS) -> str:
+    """Хеширует пароль с помощью bcrypt"""
+    # Обрезаем пароль до 72 байт (по требованию bcrypt)
+    # Если пароль длиннее 72 байт, используется только первая часть.
+    password_bytes = password.encode('utf-8')[:72]
+    return bcrypt.hashpw(password_bytes, bcrypt.gensalt(rounds)).decode('utf-8')
+
+
+def check_password(password: str, hashed_password: str) -> bool:
+    """Проверка пароля по хешу bcrypt"""
+    try:
+        return bcrypt.checkpw(password.encode('utf-8')[:72], hashed_password.encode('utf-8'))
+    except ValueError:
+        # Некорректный хеш в БД
+        return False
+
+
+def get_rounds(hashed_password: str) -> Optional[int]:
+    """Стоимость из хеша вида $2b$12$..."""
+    try:
+        return int(hashed_password.split("$")[2])
+    except (IndexError, ValueError):
+        return None
+
+
+# ==================== ПУЛ ХЕШИРОВАНИЯ ====================
+
+class PasswordHasher:
+    """Ограниченный пул для bcrypt: не больше queue_size задач в работе и ожидании"""
+
+    def __init__(self, workers: int, queue_size: int):
+        self.workers = workers
+        self.queue_size = queue_size
+        self.in_flight = 0
+        self._executor: Optional[Executor] = None
+
+    def _get_executor(self) -> Optional[Executor]:
+        if self.workers > 0 and self._executor is None:
+            # spawn: пул создается из процесса с работающими потоками и event loop
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    async def run(self, func: Callable, *args):
+        if self.in_flight >= self.queue_size:
+            raise PasswordHasherBusy()
+
+        self.in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self.in_flight -= 1
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(PASSWORD_HASH_WORKERS, PASSWORD_HASH_QUEUE_SIZE)
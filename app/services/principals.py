@@ -0,0 +1,140 @@
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional, Set
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.models.models import Artist, Organizer, User
+
+# Время жизни записи (сек.) и максимальное число токенов в кеше
+PRINCIPAL_CACHE_TTL = float(os.getenv("PRINCIPAL_CACHE_TTL", "60"))
+PRINCIPAL_CACHE_SIZE = int(os.getenv("PRINCIPAL_CACHE_SIZE", "10000"))
+
+# Изменение этих полей пользователя сбрасывает его записи в кеше
+_PRINCIPAL_FIELDS = ("email", "phone", "role", "is_active")
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Текущий пользователь без привязки к сессии БД, с id профилей"""
+    id: int
+    email: str
+    phone: Optional[str]
+    role: str
+    is_active: bool
+    created_at: datetime
+    artist_id: Optional[int] = None
+    organizer_id: Optional[int] = None
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(
+            id=user.id,
+            email=user.email,
+            phone=user.phone,
+            role=getattr(user.role, "value", user.role),
+            is_active=user.is_active,
+            created_at=user.created_at,
+            artist_id=user.artist_profile.artist_id if user.artist_profile else None,
+            organizer_id=user.organizer_profile.organizer_id if user.organizer_profile else None,
+        )
+
+
+class PrincipalCache:
+    """LRU-кеш токен -> Principal с TTL (не дольше срока действия токена)"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._tokens_by_user: Dict[int, Set[str]] = {}
+
+    def get(self, token: str) -> Optional[Principal]:
+        entry = self._entries.get(token)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        principal, expires_at = entry
+        if expires_at <= time.time():
+            self._remove(token)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(token)
+        self.hits += 1
+        return principal
+
+    def set(self, token: str, principal: Principal, token_expires_at: Optional[float] = None) -> None:
+        if self.maxsize <= 0:
+            return
+        expires_at = time.time() + self.ttl
+        if token_expires_at is not None:
+            expires_at = min(expires_at, token_expires_at)
+
+        self._remove(token)
+        self._entries[token] = (principal, expires_at)
+        self._tokens_by_user.setdefault(principal.id, set()).add(token)
+        while len(self._entries) > self.maxsize:
+            self._remove(next(iter(self._entries)))
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Удаляет все закешированные токены пользователя"""
+        for token in self._tokens_by_user.pop(user_id, set()):
+            self._entries.pop(token, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._tokens_by_user.clear()
+
+    def stats(self) -> dict:
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def _remove(self, token: str) -> None:
+        entry = self._entries.pop(token, None)
+        if entry is not None:
+            tokens = self._tokens_by_user.get(entry[0].id)
+            if tokens is not None:
+                tokens.discard(token)
+                if not tokens:
+                    del self._tokens_by_user[entry[0].id]
+
+
+principal_cache = PrincipalCache(PRINCIPAL_CACHE_SIZE, PRINCIPAL_CACHE_TTL)
+
+
+# ==================== ИНВАЛИДАЦИЯ ====================
+# Изменения пользователей и новые профили собираются при flush
+# и сбрасываются из кеша только после успешного commit
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_principals(session, flush_context):
+    user_ids = session.info.setdefault("principal_invalidations", set())
+    for obj in session.dirty:
+        if isinstance(obj, User):
+            state = inspect(obj)
+            if any(state.attrs[field].history.has_changes() for field in _PRINCIPAL_FIELDS):
+                user_ids.add(obj.id)
+    for obj in session.deleted:
+        if isinstance(obj, User):
+            user_ids.add(obj.id)
+    for obj in session.new | session.deleted:
+        if isinstance(obj, (Artist, Organizer)):
+            user_ids.add(obj.user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_principals(session):
+    for user_id in session.info.pop("principal_invalidations", ()):
+        principal_cache.invalidate_user(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_principals(session):
+    session.info.pop("principal_invalidations", None)
@@ -0,0 +1,87 @@
+import asyncio
+import sys
+
+from sqlalchemy import Numeric, cast, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.models import Artist, Booking, Organizer, Review, User
+
+# Отзыв организатора оценивает артиста бронирования, отзыв артиста — организатора
+_RATED_PROFILES = {
+    "organizer": (Artist, Artist.artist_id, Booking.artist_id),
+    "artist": (Organizer, Organizer.organizer_id, Booking.organizer_id),
+}
+
+
+def _rounded_average(total, count):
+    """Среднее с двумя знаками; в PostgreSQL round(x, n) есть только для numeric, не для double precision"""
+    return func.round(cast(total / count, Numeric), 2)
+
+
+async def apply_review(db: AsyncSession, booking: Booking, reviewer_role: str, score: float) -> None:
+    """
+    Добавляет оценку к рейтингу профиля одним UPDATE (в транзакции с вставкой отзыва).
+    Счетчики увеличиваются в БД, поэтому одновременные отзывы не теряются.
+    """
+    if reviewer_role not in _RATED_PROFILES:
+        return
+    model, pk, _ = _RATED_PROFILES[reviewer_role]
+    profile_id = booking.artist_id if model is Artist else booking.organizer_id
+
+    await db.execute(
+        update(model)
+        .where(pk == profile_id)
+        .values(
+            rating_sum=model.rating_sum + score,
+            rating_count=model.rating_count + 1,
+            rating=_rounded_average(model.rating_sum + score, model.rating_count + 1),
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def recompute_ratings(db: AsyncSession) -> None:
+    """Пересчитывает рейтинги всех артистов и организаторов по отзывам (по одному GROUP BY на таблицу)"""
+    for reviewer_role, (model, pk, booking_fk) in _RATED_PROFILES.items():
+        totals = (
+            select(
+                booking_fk.label("profile_id"),
+                func.sum(Review.rating_score).label("rating_sum"),
+                func.count().label("rating_count"),
+            )
+            .join(Booking, Booking.booking_id == Review.booking_id)
+            .join(User, User.id == Review.reviewer_id)
+            .where(User.role == reviewer_role)
+            .group_by(booking_fk)
+            .subquery()
+        )
+
+        await db.execute(update(model).values(rating_sum=0.0, rating_count=0, rating=0.0))
+        await db.execute(
+            update(model)
+            .where(pk == totals.c.profile_id)
+            .values(
+                rating_sum=totals.c.rating_sum,
+                rating_count=totals.c.rating_count,
+                rating=_rounded_average(totals.c.rating_sum, totals.c.rating_count),
+            )
+            .execution_options(synchronize_session=False)
+        )
+    await db.commit()
+
+
+if __name__ == "__main__":
+    # python -m app.services.ratings recompute
+    if sys.argv[1:] != ["recompute"]:
+        print("Использование: python -m app.services.ratings recompute")
+        sys.exit(1)
+
+    from database.database import AsyncSessionLocal, upgrade_database
+
+    async def main():
+        async with AsyncSessionLocal() as session:
+            await recompute_ratings(session)
+        print("Рейтинги пересчитаны")
+
+    upgrade_database()
+    asyncio.run(main())
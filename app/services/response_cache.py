@@ -0,0 +1,200 @@
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import compile_path
+
+# Ограничение кеша по суммарному размеру тел ответов
+RESPONSE_CACHE_MAX_BYTES = int(os.getenv("RESPONSE_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+RESPONSE_CACHE_MAX_AGE = int(os.getenv("RESPONSE_CACHE_MAX_AGE", "60"))
+# Сброс по меткам действует только внутри процесса, поэтому записи еще и устаревают по времени
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "30"))
+
+# Заголовки ответа, которые сохраняются вместе с телом
+_STORED_HEADERS = ("content-type", "x-next-cursor")
+
+
+@dataclass
+class CacheRule:
+    """
+    Кешируемый GET-маршрут.
+    tags — метки записи по параметрам пути, по ним запись сбрасывается при изменениях.
+    """
+    path: str
+    tags: Callable[[Dict[str, str]], List[str]]
+    cache_control: str = f"public, max-age={RESPONSE_CACHE_MAX_AGE}"
+    anonymous_only: bool = False
+    regex: object = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.regex, _, _ = compile_path(self.path)
+
+    def match(self, path: str) -> Optional[Dict[str, str]]:
+        match = self.regex.match(path)
+        return match.groupdict() if match else None
+
+
+@dataclass
+class CachedResponse:
+    body: bytes
+    etag: str
+    headers: List[Tuple[str, str]]
+    tags: List[str]
+    expires_at: float = 0.0
+
+
+class ResponseCache:
+    """LRU-кеш ответов, ограниченный по памяти, со сбросом по меткам"""
+
+    def __init__(self, max_bytes: int, ttl: float):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._keys_by_tag: Dict[str, set] = {}
+        # Версии меток: ответ, начатый до сброса метки, не попадет в кеш
+        self._versions: Dict[str, int] = {}
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= time.monotonic():
+            self._remove(key)
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def versions(self, tags: Iterable[str]) -> Tuple[int, ...]:
+        return tuple(self._versions.get(tag, 0) for tag in tags)
+
+    def set(self, key: str, entry: CachedResponse, versions: Tuple[int, ...]) -> None:
+        if len(entry.body) > self.max_bytes or self.versions(entry.tags) != versions:
+            return
+        self._remove(key)
+        entry.expires_at = time.monotonic() + self.ttl
+        self._entries[key] = entry
+        self.size += len(entry.body)
+        for tag in entry.tags:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+        while self.size > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+
+    def invalidate(self, *tags: str) -> None:
+        """Сбрасывает все ответы с указанными метками"""
+        for tag in tags:
+            self._versions[tag] = self._versions.get(tag, 0) + 1
+            for key in list(self._keys_by_tag.get(tag, ())):
+                self._remove(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._keys_by_tag.clear()
+        self.size = 0
+
+    def stats(self) -> dict:
+        return {"entries": len(self._entries), "bytes": self.size, "hits": self.hits, "misses": self.misses}
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self.size -= len(entry.body)
+        for tag in entry.tags:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+
+response_cache = ResponseCache(RESPONSE_CACHE_MAX_BYTES, RESPONSE_CACHE_TTL)
+
+
+# ==================== MIDDLEWARE ====================
+
+def make_etag(body: bytes) -> str:
+    """Сильный ETag по содержимому ответа"""
+    return '"{}"'.format(hashlib.sha256(body).hexdigest()[:32])
+
+
+def _opaque_tag(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    # If-None-Match сравнивается без учета слабости: сжатый ответ несет W/-версию того же ETag
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    return header.strip() == "*" or _opaque_tag(etag) in [_opaque_tag(tag.strip()) for tag in header.split(",")]
+
+
+def _cache_key(request: Request) -> str:
+    query = urlencode(sorted(parse_qsl(request.url.query, keep_blank_values=True)))
+    return f"{request.url.path.rstrip('/')}?{query}"
+
+
+def _cached_response(request: Request, entry: CachedResponse, rule: CacheRule, status: str) -> Response:
+    headers = {"ETag": entry.etag, "Cache-Control": rule.cache_control, "X-Cache": status}
+    if _etag_matches(request, entry.etag):
+        return Response(status_code=304, headers=headers)
+    headers.update(entry.headers)
+    return Response(content=entry.body, status_code=200, headers=headers)
+
+
+class ResponseCacheMiddleware(BaseHTTPMiddleware):
+    """Отдает публичные GET-ответы из кеша и отвечает 304 на условные запросы"""
+
+    def __init__(self, app, cache: ResponseCache, rules: List[CacheRule]):
+        super().__init__(app)
+        self.cache = cache
+        self.rules = rules
+
+    def _match(self, request: Request):
+        if request.method != "GET":
+            return None, None
+        for rule in self.rules:
+            params = rule.match(request.url.path)
+            if params is not None:
+                if rule.anonymous_only and "authorization" in request.headers:
+                    return None, None
+                return rule, params
+        return None, None
+
+    async def dispatch(self, request: Request, call_next):
+        rule, params = self._match(request)
+        if rule is None:
+            return await call_next(request)
+
+        key = _cache_key(request)
+        entry = self.cache.get(key)
+        if entry is not None:
+            return _cached_response(request, entry, rule, "HIT")
+
+        tags = rule.tags(params)
+        versions = self.cache.versions(tags)
+        response = await call_next(request)
+        if response.status_code != 200:
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        entry = CachedResponse(
+            body=body,
+            etag=make_etag(body),
+            headers=[(name, value) for name, value in response.headers.items() if name in _STORED_HEADERS],
+            tags=tags,
+        )
+        self.cache.set(key, entry, versions)
+        return _cached_response(request, entry, rule, "MISS")
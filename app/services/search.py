@@ -0,0 +1,206 @@
+import asyncio
+import re
+import sys
+from typing import List, Optional
+
+from sqlalchemy import Float, Integer, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.models import Artist
+
+# Веса колонок для ранжирования: stage_name, bio, genres
+BM25_WEIGHTS = (10.0, 1.0, 5.0)
+REBUILD_BATCH_SIZE = 1000
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+_CYRILLIC_RE = re.compile(r"[а-я]")
+
+
+# ==================== СТЕММИНГ ====================
+
+# Упрощенный стеммер Портера для русского языка (snowball russian).
+# Английские слова стеммит токенизатор porter в FTS5, поэтому здесь
+# обрабатываются только слова на кириллице.
+_PERFECTIVE_GERUND = re.compile(r"((ив|ивши|ившись|ыв|ывши|ывшись)|((?<=[ая])(в|вши|вшись)))$")
+_REFLEXIVE = re.compile(r"(с[яь])$")
+_ADJECTIVE = re.compile(
+    r"(ее|ие|ые|ое|ими|ыми|ей|ий|ый|ой|ем|им|ым|ом|его|ого|ему|ому|их|ых|ую|юю|ая|яя|ою|ею)$"
+)
+_PARTICIPLE = re.compile(r"((ивш|ывш|ующ)|((?<=[ая])(ем|нн|вш|ющ|щ)))$")
+_VERB = re.compile(
+    r"((ила|ыла|ена|ейте|уйте|ите|или|ыли|ей|уй|ил|ыл|им|ым|ен|ило|ыло|ено|ят|ует|уют|ит|ыт|ены|ить|ыть|ишь|ую|ю)"
+    r"|((?<=[ая])(ла|на|ете|йте|ли|й|л|ем|н|ло|но|ет|ют|ны|ть|ешь|нно)))$"
+)
+_NOUN = re.compile(
+    r"(а|ев|ов|ие|ье|е|иями|ями|ами|еи|ии|и|ией|ей|ой|ий|й|иям|ям|ием|ем|ам|ом|о|у|ах|иях|ях|ы|ь|ию|ью|ю|ия|ья|я)$"
+)
+_RV = re.compile(r"^(.*?[аеиоуыэюя])(.*)$")
+_DERIVATIONAL = re.compile(r".*[^аеиоуыэюя]+[аеиоуыэюя].*ость?$")
+_SUPERLATIVE = re.compile(r"(ейше|ейш)$")
+
+
+def stem_word(word: str) -> str:
+    """Приводит слово к основе (для кириллицы), остальные слова возвращает как есть"""
+    word = word.lower().replace("ё", "е")
+    if not _CYRILLIC_RE.search(word):
+        return word
+
+    match = _RV.match(word)
+    if not match:
+        return word
+    start, rv = match.groups()
+    if not rv:
+        return word
+
+    stemmed = _PERFECTIVE_GERUND.sub("", rv, 1)
+    if stemmed == rv:
+        rv = _REFLEXIVE.sub("", rv, 1)
+        stemmed = _ADJECTIVE.sub("", rv, 1)
+        if stemmed != rv:
+            rv = _PARTICIPLE.sub("", stemmed, 1)
+        else:
+            stemmed = _VERB.sub("", rv, 1)
+            rv = _NOUN.sub("", rv, 1) if stemmed == rv else stemmed
+    else:
+        rv = stemmed
+
+    rv = re.sub(r"и$", "", rv, 1)
+    if _DERIVATIONAL.match(rv):
+        rv = re.sub(r"ость?$", "", rv, 1)
+
+    stemmed = re.sub(r"ь$", "", rv, 1)
+    if stemmed == rv:
+        rv = _SUPERLATIVE.sub("", rv, 1)
+        rv = re.sub(r"нн$", "н", rv, 1)
+    else:
+        rv = stemmed
+
+    return start + rv
+
+
+def tokenize(value: Optional[str]) -> List[str]:
+    """Разбивает текст на нормализованные основы слов"""
+    if not value:
+        return []
+    return [stem_word(token) for token in _TOKEN_RE.findall(value)]
+
+
+def _normalize(value: Optional[str]) -> str:
+    return " ".join(tokenize(value))
+
+
+def build_match_expression(query: str) -> Optional[str]:
+    """Строит выражение MATCH для FTS5: все основы обязательны, поиск по префиксу"""
+    terms = tokenize(query)
+    if not terms:
+        return None
+    return " ".join('"{}"*'.format(term.replace('"', '""')) for term in terms)
+
+
+# ==================== СИНХРОНИЗАЦИЯ ИНДЕКСА ====================
+
+def _dialect(db: AsyncSession) -> str:
+    return db.get_bind().dialect.name
+
+
+def _genres_text(artist: Artist) -> str:
+    return " ".join(genre.name for genre in artist.genres)
+
+
+async def index_artist(db: AsyncSession, artist: Artist) -> None:
+    """Добавляет или обновляет артиста в полнотекстовом индексе (в текущей транзакции)"""
+    await db.flush()
+    if _dialect(db) == "postgresql":
+        await db.execute(
+            text(
+                "INSERT INTO artists_fts (artist_id, document) VALUES (:artist_id, "
+                "setweight(to_tsvector('russian', coalesce(:stage_name, '')), 'A') || "
+                "setweight(to_tsvector('russian', coalesce(:genres, '')), 'B') || "
+                "setweight(to_tsvector('russian', coalesce(:bio, '')), 'C')) "
+                "ON CONFLICT (artist_id) DO UPDATE SET document = EXCLUDED.document"
+            ),
+            {
+                "artist_id": artist.artist_id,
+                "stage_name": artist.stage_name,
+                "genres": _genres_text(artist),
+                "bio": artist.bio,
+            },
+        )
+        return
+
+    await db.execute(text("DELETE FROM artists_fts WHERE rowid = :artist_id"), {"artist_id": artist.artist_id})
+    await db.execute(
+        text(
+            "INSERT INTO artists_fts (rowid, stage_name, bio, genres) "
+            "VALUES (:artist_id, :stage_name, :bio, :genres)"
+        ),
+        {
+            "artist_id": artist.artist_id,
+            "stage_name": _normalize(artist.stage_name),
+            "bio": _normalize(artist.bio),
+            "genres": _normalize(_genres_text(artist)),
+        },
+    )
+
+
+async def rebuild_index(db: AsyncSession) -> int:
+    """Полностью перестраивает индекс по существующим артистам"""
+    await db.execute(text("DELETE FROM artists_fts"))
+    count, last_id = 0, 0
+    while True:
+        artists = (await db.scalars(
+            select(Artist).where(Artist.artist_id > last_id).order_by(Artist.artist_id).limit(REBUILD_BATCH_SIZE)
+        )).all()
+        if not artists:
+            break
+        for artist in artists:
+            await index_artist(db, artist)
+        count += len(artists)
+        last_id = artists[-1].artist_id
+        db.expunge_all()
+    await db.commit()
+    return count
+
+
+# ==================== ПОИСК ====================
+
+def search_subquery(db: AsyncSession, query: str):
+    """
+    Подзапрос (artist_id, rank) по полнотекстовому индексу.
+    Меньший rank означает более релевантный результат.
+    Возвращает None, если в запросе нет слов для поиска.
+    """
+    if _dialect(db) == "postgresql":
+        if not _TOKEN_RE.search(query):
+            return None
+        stmt = text(
+            "SELECT artist_id, -ts_rank_cd(document, q) AS rank "
+            "FROM artists_fts, plainto_tsquery('russian', :query) AS q "
+            "WHERE document @@ q"
+        ).bindparams(query=query)
+    else:
+        match = build_match_expression(query)
+        if match is None:
+            return None
+        stmt = text(
+            "SELECT rowid AS artist_id, bm25(artists_fts, {}, {}, {}) AS rank "
+            "FROM artists_fts WHERE artists_fts MATCH :match".format(*BM25_WEIGHTS)
+        ).bindparams(match=match)
+
+    return stmt.columns(artist_id=Integer, rank=Float).subquery("fts")
+
+
+if __name__ == "__main__":
+    # python -m app.services.search rebuild
+    if sys.argv[1:] != ["rebuild"]:
+        print("Использование: python -m app.services.search rebuild")
+        sys.exit(1)
+
+    from database.database import AsyncSessionLocal, upgrade_database
+
+    async def main():
+        async with AsyncSessionLocal() as session:
+            print(f"Проиндексировано артистов: {await rebuild_index(session)}")
+
+    upgrade_database()
+    asyncio.run(main())
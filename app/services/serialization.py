@@ -0,0 +1,107 @@
+"""
+Быстрый путь для списков: колонки вместо ORM-объектов, orjson вместо валидации Pydantic,
+потоковая выдача больших выборок (JSON-массив по частям или NDJSON).
+"""
+import json
+import os
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import AsyncIterator, Callable, Iterable, List, Optional, Type
+
+from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy import Select
+
+from app.services.pagination import set_next_cursor
+from database.database import AsyncSessionLocal
+
+try:
+    import orjson
+except ImportError:  # без orjson — стандартный json (медленнее, результат тот же)
+    orjson = None
+
+# Строк, читаемых из курсора БД и сериализуемых за один шаг потоковой выдачи
+STREAM_BATCH_SIZE = int(os.getenv("STREAM_BATCH_SIZE", "1000"))
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def _default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(value) -> bytes:
+    """JSON в байтах: datetime в ISO 8601, Enum — значением (как у Pydantic)"""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=_default).encode("utf-8")
+
+
+class FastJSONResponse(Response):
+    """JSON-ответ без jsonable_encoder и повторной валидации response_model"""
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return dumps(content)
+
+
+def response_columns(schema: Type[BaseModel], model, exclude: Iterable[str] = ()) -> List:
+    """Колонки модели с именами полей схемы ответа — ровно то, что попадет в JSON"""
+    return [getattr(model, name) for name in schema.model_fields if name not in set(exclude)]
+
+
+def page_response(items: list, next_cursor: Optional[str]) -> FastJSONResponse:
+    """Страница списка с курсором следующей страницы в заголовке"""
+    response = FastJSONResponse(items)
+    set_next_cursor(response, next_cursor)
+    return response
+
+
+# ==================== ПОТОКОВАЯ ВЫДАЧА ====================
+
+def wants_ndjson(request: Request) -> bool:
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+async def stream_rows(
+        stmt: Select, ndjson: bool = False, transform: Optional[Callable[[dict], dict]] = None
+) -> AsyncIterator[bytes]:
+    """
+    Выполняет запрос колонок с серверным курсором и отдает JSON частями по STREAM_BATCH_SIZE строк.
+    Сессия своя: зависимость get_db закрывается раньше, чем клиент дочитает ответ.
+    """
+    names = [description["name"] for description in stmt.column_descriptions]
+    first = True
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(stmt.execution_options(yield_per=STREAM_BATCH_SIZE))
+        if not ndjson:
+            yield b"["
+        async for rows in result.partitions():
+            items = [dict(zip(names, row)) for row in rows]
+            if transform is not None:
+                items = [transform(item) for item in items]
+            if ndjson:
+                yield b"".join(dumps(item) + b"\n" for item in items)
+            else:
+                chunk = b",".join(dumps(item) for item in items)
+                yield chunk if first else b"," + chunk
+                first = False
+        if not ndjson:
+            yield b"]"
+
+
+def streaming_response(request: Request, stmt: Select) -> StreamingResponse:
+    """Потоковый ответ: NDJSON, если клиент просит application/x-ndjson, иначе JSON-массив"""
+    ndjson = wants_ndjson(request)
+    return StreamingResponse(
+        stream_rows(stmt, ndjson),
+        media_type=NDJSON_MEDIA_TYPE if ndjson else "application/json",
+    )
@@ -0,0 +1,211 @@
+"""
+Журнал медленных SQL-запросов и профилирование отдельного HTTP-запроса.
+Оба получают запросы из after_cursor_execute движков (database/database.py).
+"""
+import asyncio
+import json
+import logging
+import os
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from urllib.parse import urlencode
+
+from app.services import metrics
+
+logger = logging.getLogger("muzplatforma.sql")
+
+# Порог медленного запроса в мс (0 — журнал отключен)
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "200"))
+# Одна и та же инструкция с разными параметрами столько раз за запрос — вероятно N+1
+N_PLUS_ONE_THRESHOLD = int(os.getenv("N_PLUS_ONE_THRESHOLD", "3"))
+# Длина SQL в журнале и в трассировке
+SQL_TEXT_LIMIT = 2000
+
+slow_queries = metrics.registry.register(metrics.Counter(
+    "db_slow_queries_total", "SQL-запросы дольше SLOW_QUERY_MS", ("route",),
+))
+
+
+@dataclass
+class QueryTrace:
+    statement: str
+    parameters: str
+    duration: float
+    executemany: bool
+    # Для поиска N+1: одинаковый SQL с разными значениями параметров
+    parameters_key: str
+
+
+# Трассировка профилируемого запроса (None — профилирование не включено)
+current_trace: ContextVar[Optional[List[QueryTrace]]] = ContextVar("current_trace", default=None)
+
+
+# ==================== ФОРМА ПАРАМЕТРОВ ====================
+# В журнал попадают типы параметров, а не значения: в них бывают пароли и персональные данные
+
+def _types(values) -> str:
+    """Типы подряд идущих значений с повторами: (int, str x 3)"""
+    parts, previous, count = [], None, 0
+    for value in values:
+        name = type(value).__name__
+        if name == previous:
+            count += 1
+            continue
+        if previous is not None:
+            parts.append(previous if count == 1 else f"{previous} x {count}")
+        previous, count = name, 1
+    if previous is not None:
+        parts.append(previous if count == 1 else f"{previous} x {count}")
+    return "(" + ", ".join(parts) + ")"
+
+
+def _single_shape(parameters) -> str:
+    if isinstance(parameters, dict):
+        return "{" + ", ".join(f"{key}: {type(value).__name__}" for key, value in parameters.items()) + "}"
+    if isinstance(parameters, (list, tuple)):
+        return _types(parameters)
+    return type(parameters).__name__
+
+
+def parameter_shape(parameters, executemany: bool) -> str:
+    """Форма параметров запроса: имена и типы, для executemany — число наборов"""
+    if executemany:
+        rows = list(parameters or ())
+        return f"{len(rows)} x {_single_shape(rows[0])}" if rows else "[]"
+    return _single_shape(parameters or ())
+
+
+# ==================== СБОР ====================
+
+def _route(scope: Optional[dict]) -> str:
+    if scope is None:
+        return "-"
+    route = scope.get("route")
+    return getattr(route, "path", None) or scope.get("path", "-")
+
+
+def observe_query(statement: str, parameters, executemany: bool, duration: float) -> None:
+    """Вызывается для каждого выполненного SQL-запроса"""
+    trace = current_trace.get()
+    is_slow = SLOW_QUERY_MS and duration * 1000 >= SLOW_QUERY_MS
+    if trace is None and not is_slow:
+        return
+
+    shape = parameter_shape(parameters, executemany)
+    if is_slow:
+        stats = metrics.current_request.get()
+        route = _route(stats.scope if stats is not None else None)
+        slow_queries.inc(route)
+        logger.warning(
+            "Медленный SQL-запрос %.1f мс, маршрут %s, параметры %s: %s",
+            duration * 1000, route, shape, statement[:SQL_TEXT_LIMIT],
+        )
+    if trace is not None:
+        trace.append(QueryTrace(
+            statement=statement[:SQL_TEXT_LIMIT],
+            parameters=shape,
+            duration=duration,
+            executemany=executemany,
+            parameters_key=repr(parameters),
+        ))
+
+
+def find_repeated(trace: List[QueryTrace], threshold: int = N_PLUS_ONE_THRESHOLD) -> List[dict]:
+    """Инструкции, выполненные не менее threshold раз с разными параметрами (признак N+1)"""
+    groups: Dict[str, List[QueryTrace]] = {}
+    for query in trace:
+        if not query.executemany:
+            groups.setdefault(query.statement, []).append(query)
+
+    repeated = []
+    for statement, queries in groups.items():
+        distinct = len({query.parameters_key for query in queries})
+        if len(queries) >= threshold and distinct > 1:
+            repeated.append({
+                "statement": statement,
+                "count": len(queries),
+                "distinct_parameters": distinct,
+                "total_ms": round(sum(query.duration for query in queries) * 1000, 3),
+            })
+    return sorted(repeated, key=lambda item: item["count"], reverse=True)
+
+
+# ==================== ПРОФИЛИРОВАНИЕ ЗАПРОСА ====================
+
+async def profile_request(app, method: str, path: str, params: Dict[str, str],
+                          headers: Dict[str, str], body) -> dict:
+    """Выполняет HTTP-запрос внутри процесса (через ASGI-приложение) и собирает его SQL-запросы"""
+    content = b"" if body is None else json.dumps(body).encode()
+    request_headers = {key.lower(): value for key, value in headers.items()}
+    if body is not None:
+        request_headers.setdefault("content-type", "application/json")
+    request_headers["content-length"] = str(len(content))
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method.upper(),
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": urlencode(params, doseq=True).encode(),
+        "headers": [(key.encode(), value.encode()) for key, value in request_headers.items()],
+        "client": ("sql-profiler", 0),
+        "server": ("sql-profiler", 80),
+    }
+    response = {"status_code": 500, "size": 0}
+    request_sent = False
+    response_complete = asyncio.Event()
+
+    async def receive():
+        # Тело отдается один раз; затем, как настоящий клиент, ждем конца ответа и «отключаемся».
+        # Иначе StreamingResponse.listen_for_disconnect крутится в цикле без ожидания
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": content, "more_body": False}
+        await response_complete.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response["status_code"] = message["status"]
+        elif message["type"] == "http.response.body":
+            response["size"] += len(message.get("body", b""))
+            if not message.get("more_body", False):
+                response_complete.set()
+
+    trace: List[QueryTrace] = []
+    token = current_trace.set(trace)
+    started = time.perf_counter()
+    try:
+        await app(scope, receive, send)
+    finally:
+        response_complete.set()
+        current_trace.reset(token)
+    duration = time.perf_counter() - started
+
+    return {
+        "method": scope["method"],
+        "path": path,
+        "route": _route(scope),
+        "status_code": response["status_code"],
+        "response_bytes": response["size"],
+        "duration_ms": round(duration * 1000, 3),
+        "query_count": len(trace),
+        "db_time_ms": round(sum(query.duration for query in trace) * 1000, 3),
+        "queries": [
+            {
+                "statement": query.statement,
+                "parameters": query.parameters,
+                "duration_ms": round(query.duration * 1000, 3),
+                "executemany": query.executemany,
+            }
+            for query in trace
+        ],
+        "n_plus_one": find_repeated(trace),
+    }
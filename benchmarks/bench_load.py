@@ -0,0 +1,223 @@
+"""
+Нагрузочный прогон API в процессе: параллельные сценарии поверх заново заполненной БД.
+Выводит пропускную способность и p50/p95/p99 по эндпоинтам в JSON для сравнения между коммитами.
+
+    python -m benchmarks.bench_load --duration 15 --scenario search=8 --scenario booking_churn=2 -o before.json
+
+Сценарии: search (анонимный каталог), dashboard (кабинет артиста и организатора),
+messaging (переписка), booking_churn (создание заявок и смена статусов).
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+
+os.environ.setdefault("BCRYPT_ROUNDS", "4")  # Заполнение БД через API не упирается в bcrypt
+
+from benchmarks.harness import INVOCATION_DIR, LatencyRecorder, app_client, git_revision  # noqa: E402
+
+PASSWORD = "secret123"
+GENRES = ["рок", "джаз", "поп", "фолк", "электроника", "классика", "блюз", "метал", "хип-хоп", "инди"]
+WORDS = ["звук", "группа", "живой", "концерт", "акустика", "вечер", "кавер", "оркестр", "дуэт", "сет"]
+DEFAULT_SCENARIOS = {"search": 8, "dashboard": 4, "messaging": 4, "booking_churn": 2}
+
+
+# ==================== ЗАПОЛНЕНИЕ ====================
+
+async def _register(client, email: str, role: str) -> dict:
+    await client.post("/api/register", json={"email": email, "password": PASSWORD, "role": role})
+    response = await client.post("/api/token", data={"username": email, "password": PASSWORD})
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    user_id = (await client.get("/api/users/me", headers=headers)).json()["id"]
+    return {"email": email, "headers": headers, "user_id": user_id}
+
+
+async def seed(client, args, rng: random.Random) -> dict:
+    artists, organizers = [], []
+    for i in range(args.artists):
+        artist = await _register(client, f"artist{i}@example.com", "artist")
+        price_min = rng.randrange(5, 200) * 1000
+        response = await client.post("/api/artists", headers=artist["headers"], json={
+            "stage_name": f"Артист {i} {rng.choice(WORDS)}",
+            "bio": " ".join(rng.choices(WORDS, k=12)),
+            "genres": rng.sample(GENRES, rng.randint(1, 3)),
+            "price_min": price_min,
+            "price_max": price_min + rng.randrange(0, 300) * 1000,
+        })
+        artist["artist_id"] = response.json()["artist_id"]
+        artists.append(artist)
+
+    for i in range(args.organizers):
+        organizer = await _register(client, f"organizer{i}@example.com", "organizer")
+        response = await client.post(
+            "/api/organizers", headers=organizer["headers"], json={"company_name": f"Площадка {i}"}
+        )
+        organizer["organizer_id"] = response.json()["organizer_id"]
+        organizers.append(organizer)
+
+    for organizer in organizers:
+        for artist in rng.sample(artists, min(len(artists), args.bookings_per_organizer)):
+            await client.post("/api/bookings", headers=organizer["headers"], json={
+                "artist_id": artist["artist_id"], "proposed_price": rng.randrange(10, 500) * 1000,
+            })
+            await client.post("/api/messages", headers=organizer["headers"], json={
+                "receiver_id": artist["user_id"], "content": " ".join(rng.choices(WORDS, k=8)),
+            })
+
+    return {"artists": artists, "organizers": organizers}
+
+
+# ==================== СЦЕНАРИИ ====================
+
+async def search(client, recorder: LatencyRecorder, data: dict, rng: random.Random):
+    params = {}
+    kind = rng.random()
+    if kind < 0.3:
+        params["genre"] = rng.choice(GENRES)
+    elif kind < 0.6:
+        params["search"] = rng.choice(WORDS)
+    elif kind < 0.8:
+        params["price_min"] = rng.randrange(5, 100) * 1000
+    await recorder.request(client, "GET /api/artists", "GET", "/api/artists", params=params)
+    artist = rng.choice(data["artists"])
+    await recorder.request(client, "GET /api/artists/{id}", "GET", f"/api/artists/{artist['artist_id']}")
+
+
+async def dashboard(client, recorder: LatencyRecorder, data: dict, rng: random.Random):
+    user = rng.choice(data["artists"] + data["organizers"])
+    headers = user["headers"]
+    await recorder.request(client, "GET /api/users/me", "GET", "/api/users/me", headers=headers)
+    await recorder.request(client, "GET /api/bookings", "GET", "/api/bookings", headers=headers)
+    await recorder.request(client, "GET /api/conversations", "GET", "/api/conversations", headers=headers)
+    await recorder.request(client, "GET /api/messages/unread", "GET", "/api/messages/unread", headers=headers)
+
+
+async def messaging(client, recorder: LatencyRecorder, data: dict, rng: random.Random):
+    sender = rng.choice(data["organizers"])
+    receiver = rng.choice(data["artists"])
+    await recorder.request(client, "POST /api/messages", "POST", "/api/messages", headers=sender["headers"], json={
+        "receiver_id": receiver["user_id"], "content": " ".join(rng.choices(WORDS, k=8)),
+    })
+    await recorder.request(
+        client, "GET /api/conversations/{id}/messages", "GET",
+        f"/api/conversations/{sender['user_id']}/messages", headers=receiver["headers"],
+    )
+    await recorder.request(
+        client, "POST /api/messages/read", "POST", "/api/messages/read",
+        headers=receiver["headers"], json={"counterpart_id": sender["user_id"]},
+    )
+
+
+async def booking_churn(client, recorder: LatencyRecorder, data: dict, rng: random.Random):
+    organizer = rng.choice(data["organizers"])
+    artist = rng.choice(data["artists"])
+    response = await recorder.request(
+        client, "POST /api/bookings", "POST", "/api/bookings", headers=organizer["headers"],
+        json={"artist_id": artist["artist_id"], "proposed_price": rng.randrange(10, 500) * 1000},
+    )
+    if response.status_code != 200:
+        return
+    await recorder.request(
+        client, "PATCH /api/bookings/{id}", "PATCH", f"/api/bookings/{response.json()['booking_id']}",
+        headers=artist["headers"], json={"status": rng.choice(["confirmed", "declined"])},
+    )
+
+
+SCENARIOS = {
+    "search": search,
+    "dashboard": dashboard,
+    "messaging": messaging,
+    "booking_churn": booking_churn,
+}
+
+
+# ==================== ЗАПУСК ====================
+
+async def run_scenarios(client, data: dict, scenarios: dict, duration: float, seed_value: int) -> dict:
+    recorders = {name: LatencyRecorder() for name in scenarios}
+    deadline = time.perf_counter() + duration
+
+    async def worker(name: str, worker_id: int):
+        rng = random.Random(f"{seed_value}:{name}:{worker_id}")
+        while time.perf_counter() < deadline:
+            await SCENARIOS[name](client, recorders[name], data, rng)
+
+    started = time.perf_counter()
+    await asyncio.gather(*[
+        worker(name, worker_id) for name, concurrency in scenarios.items() for worker_id in range(concurrency)
+    ])
+    elapsed = time.perf_counter() - started
+
+    endpoints = {}
+    for recorder in recorders.values():
+        endpoints.update(recorder.summary(elapsed))
+    return {
+        "elapsed_sec": round(elapsed, 2),
+        "scenarios": {
+            name: {
+                "concurrency": scenarios[name],
+                "requests": recorders[name].total(),
+                "rps": round(recorders[name].total() / elapsed, 1),
+            }
+            for name in scenarios
+        },
+        "endpoints": endpoints,
+    }
+
+
+def parse_scenarios(values) -> dict:
+    if not values:
+        return dict(DEFAULT_SCENARIOS)
+    scenarios = {}
+    for value in values:
+        name, _, concurrency = value.partition("=")
+        if name not in SCENARIOS:
+            raise SystemExit(f"Неизвестный сценарий: {name} (доступны: {', '.join(SCENARIOS)})")
+        scenarios[name] = int(concurrency or 1)
+    return scenarios
+
+
+async def main(args) -> dict:
+    scenarios = parse_scenarios(args.scenario)
+    async with app_client() as client:
+        started = time.perf_counter()
+        data = await seed(client, args, random.Random(args.seed))
+        seed_time = time.perf_counter() - started
+        # Прогрев: первые запросы компилируют SQL и наполняют кеши
+        await run_scenarios(client, data, scenarios, min(1.0, args.duration), args.seed)
+        results = await run_scenarios(client, data, scenarios, args.duration, args.seed)
+
+    return {
+        "revision": git_revision(),
+        "config": {
+            "duration": args.duration,
+            "seed": args.seed,
+            "artists": args.artists,
+            "organizers": args.organizers,
+            "bookings_per_organizer": args.bookings_per_organizer,
+            "seed_sec": round(seed_time, 2),
+        },
+        **results,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--duration", type=float, default=10.0, help="секунд замера")
+    parser.add_argument("--scenario", action="append", metavar="ИМЯ=ПАРАЛЛЕЛЬНОСТЬ",
+                        help="сценарий и число клиентов (можно несколько раз)")
+    parser.add_argument("--artists", type=int, default=100)
+    parser.add_argument("--organizers", type=int, default=30)
+    parser.add_argument("--bookings-per-organizer", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42, help="зерно генератора данных и запросов")
+    parser.add_argument("-o", "--output", help="файл для JSON-отчета (по умолчанию stdout)")
+    args = parser.parse_args()
+
+    report = json.dumps(asyncio.run(main(args)), indent=2, ensure_ascii=False)
+    if args.output:
+        with open(os.path.join(INVOCATION_DIR, args.output), "w", encoding="utf-8") as f:
+            f.write(report)
+    else:
+        print(report)
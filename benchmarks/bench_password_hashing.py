@@ -0,0 +1,91 @@
+"""
+Смешанная нагрузка: вход (/api/token) одновременно с чтением каталога (/api/artists).
+Сравнивает bcrypt в отдельном пуле процессов и в пуле потоков процесса приложения.
+
+    python -m benchmarks.bench_password_hashing --duration 10 --logins 8 --readers 8
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+import httpx
+
+from benchmarks.harness import app_client
+from app.services import passwords
+
+PASSWORD = "secret123"
+
+
+async def seed(client: httpx.AsyncClient, users: int) -> list:
+    emails = [f"bench{i}@test.com" for i in range(users)]
+    for email in emails:
+        await client.post("/api/register", json={"email": email, "password": PASSWORD, "role": "organizer"})
+    return emails
+
+
+async def run_mixed_load(client: httpx.AsyncClient, emails: list, args) -> dict:
+    deadline = time.perf_counter() + args.duration
+    stats = {"logins": 0, "rejected": 0, "reads": 0, "read_latency": []}
+
+    async def login_worker(worker: int):
+        i = worker
+        while time.perf_counter() < deadline:
+            response = await client.post(
+                "/api/token", data={"username": emails[i % len(emails)], "password": PASSWORD}
+            )
+            if response.status_code == 200:
+                stats["logins"] += 1
+            elif response.status_code == 503:
+                stats["rejected"] += 1
+                await asyncio.sleep(float(response.headers.get("Retry-After", "1")) / 10)
+            i += args.logins
+
+    async def read_worker():
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            await client.get("/api/artists")
+            stats["read_latency"].append((time.perf_counter() - started) * 1000)
+            stats["reads"] += 1
+
+    await asyncio.gather(
+        *[login_worker(w) for w in range(args.logins)],
+        *[read_worker() for _ in range(args.readers)],
+    )
+
+    latency = sorted(stats["read_latency"]) or [0.0]
+    return {
+        "logins_per_sec": round(stats["logins"] / args.duration, 1),
+        "logins_rejected_503": stats["rejected"],
+        "reads_per_sec": round(stats["reads"] / args.duration, 1),
+        "read_p50_ms": round(statistics.median(latency), 2),
+        "read_p95_ms": round(latency[int(len(latency) * 0.95) - 1 if len(latency) > 1 else 0], 2),
+    }
+
+
+async def main(args) -> dict:
+    async with app_client() as client:
+        emails = await seed(client, args.users)
+        results = {"bcrypt_rounds": passwords.BCRYPT_ROUNDS}
+        for mode, workers in (("process_pool", args.workers), ("thread_pool", 0)):
+            passwords.password_hasher.shutdown()
+            passwords.password_hasher.workers = workers
+            # Прогрев: запуск процессов пула не входит в замер
+            await asyncio.gather(*[
+                client.post("/api/token", data={"username": emails[0], "password": PASSWORD})
+                for _ in range(max(workers, 1))
+            ])
+            results[mode] = await run_mixed_load(client, emails, args)
+        passwords.password_hasher.shutdown()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--duration", type=float, default=10.0, help="секунд на каждый режим")
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--logins", type=int, default=8, help="параллельных клиентов входа")
+    parser.add_argument("--readers", type=int, default=8, help="параллельных клиентов чтения")
+    parser.add_argument("--workers", type=int, default=passwords.PASSWORD_HASH_WORKERS, help="процессов bcrypt")
+    print(json.dumps(asyncio.run(main(parser.parse_args())), indent=2, ensure_ascii=False))
@@ -0,0 +1,122 @@
+"""
+Сериализация большого списка бронирований: ORM-объекты + валидация response_model + json
+против колонок + orjson и потоковой выдачи частями. Замеряются процессорное время и пик памяти.
+
+    python -m benchmarks.bench_serialization --rows 50000 --repeat 3
+"""
+import argparse
+import asyncio
+import gc
+import json
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import List
+
+from benchmarks.harness import git_revision  # до импорта приложения: рабочий каталог — временный
+from pydantic import TypeAdapter
+from sqlalchemy import insert, select
+
+from app.models.models import Artist, Booking, Organizer, User
+from app.schemas.schemas import BookingResponse
+from app.services.serialization import dumps, response_columns, stream_rows
+from database.database import AsyncSessionLocal, engine, upgrade_database
+
+ORDER = (Booking.created_at.desc(), Booking.booking_id.desc())
+
+
+def prepare(rows: int) -> None:
+    upgrade_database()
+    started = datetime(2025, 1, 1)
+    with engine.begin() as connection:
+        connection.execute(insert(User), [
+            {"id": 1, "email": "artist@example.com", "password_hash": "-", "role": "artist"},
+            {"id": 2, "email": "organizer@example.com", "password_hash": "-", "role": "organizer"},
+        ])
+        connection.execute(insert(Artist), [{"artist_id": 1, "user_id": 1, "stage_name": "Bench"}])
+        connection.execute(insert(Organizer), [{"organizer_id": 1, "user_id": 2, "company_name": "Bench"}])
+        connection.execute(insert(Booking), [
+            {
+                "booking_id": i,
+                "artist_id": 1,
+                "organizer_id": 1,
+                "status": "pending",
+                "proposed_price": float(i % 500 * 1000),
+                "created_at": started + timedelta(minutes=i),
+                "updated_at": started + timedelta(minutes=i),
+                "technical_requirements": "Звук и свет" if i % 3 else None,
+            }
+            for i in range(1, rows + 1)
+        ])
+
+
+# ==================== ВАРИАНТЫ ====================
+
+async def orm_pydantic() -> int:
+    """Текущий путь FastAPI: ORM-объекты -> response_model -> json.dumps"""
+    adapter = TypeAdapter(List[BookingResponse])
+    async with AsyncSessionLocal() as db:
+        bookings = (await db.scalars(select(Booking).order_by(*ORDER))).all()
+        data = adapter.dump_python(adapter.validate_python(bookings, from_attributes=True), mode="json")
+        body = json.dumps(data, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+    return len(body)
+
+
+async def rows_fast() -> int:
+    """Колонки ответа как строки -> orjson, тело целиком в памяти"""
+    stmt = select(*response_columns(BookingResponse, Booking)).order_by(*ORDER)
+    names = [description["name"] for description in stmt.column_descriptions]
+    async with AsyncSessionLocal() as db:
+        rows = (await db.execute(stmt)).all()
+        body = dumps([dict(zip(names, row)) for row in rows])
+    return len(body)
+
+
+async def streamed() -> int:
+    """Колонки -> orjson частями по STREAM_BATCH_SIZE строк (так отдает /api/bookings/export)"""
+    size = 0
+    stmt = select(*response_columns(BookingResponse, Booking)).order_by(*ORDER)
+    async for chunk in stream_rows(stmt):
+        size += len(chunk)
+    return size
+
+
+VARIANTS = {"orm_pydantic": orm_pydantic, "rows_orjson": rows_fast, "streamed": streamed}
+
+
+async def measure(variant, repeat: int) -> dict:
+    # Время — без tracemalloc (он замедляет аллокации), пик памяти — отдельным прогоном
+    cpu_times, wall_times = [], []
+    for _ in range(repeat):
+        gc.collect()
+        cpu, wall = time.process_time(), time.perf_counter()
+        size = await variant()
+        cpu_times.append(time.process_time() - cpu)
+        wall_times.append(time.perf_counter() - wall)
+
+    gc.collect()
+    tracemalloc.start()
+    await variant()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        "bytes": size,
+        "cpu_ms": round(min(cpu_times) * 1000, 1),
+        "wall_ms": round(min(wall_times) * 1000, 1),
+        "peak_memory_mb": round(peak / 1024 / 1024, 2),
+    }
+
+
+async def main(args) -> dict:
+    prepare(args.rows)
+    results = {"revision": git_revision(), "rows": args.rows}
+    for name, variant in VARIANTS.items():
+        results[name] = await measure(variant, args.repeat)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=3, help="прогонов для замера времени (берется лучший)")
+    print(json.dumps(asyncio.run(main(parser.parse_args())), indent=2, ensure_ascii=False))
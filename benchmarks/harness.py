@@ -0,0 +1,84 @@
+"""
+Общая обвязка бенчмарков: приложение в процессе поверх чистой БД во временном каталоге.
+Импортируется до app.core.main — БД и каталог static создаются относительно рабочего каталога.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, List
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+# Каталог запуска — относительные пути в аргументах (например, файл отчета) считаются от него
+INVOCATION_DIR = os.getcwd()
+os.chdir(tempfile.mkdtemp(prefix="muzplatforma-bench-"))
+
+import httpx  # noqa: E402
+
+from database.database import upgrade_database  # noqa: E402
+
+
+@asynccontextmanager
+async def app_client():
+    """HTTP-клиент к приложению через ASGI, без сети; схема БД создается миграциями"""
+    from app.core.main import app
+
+    # ASGITransport не выполняет lifespan приложения
+    upgrade_database()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+        yield client
+
+
+def git_revision() -> str:
+    """Текущий коммит — чтобы сравнивать результаты между версиями"""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR, stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Перцентиль по ближайшему рангу (values отсортированы)"""
+    if not values:
+        return 0.0
+    rank = max(1, min(len(values), round(q / 100 * len(values) + 0.5)))
+    return values[rank - 1]
+
+
+class LatencyRecorder:
+    """Задержки и ошибки по эндпоинтам (метка — метод и шаблон пути)"""
+
+    def __init__(self):
+        self.latency: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+
+    async def request(self, client: httpx.AsyncClient, label: str, method: str, url: str, **kwargs) -> httpx.Response:
+        started = time.perf_counter()
+        response = await client.request(method, url, **kwargs)
+        self.latency.setdefault(label, []).append((time.perf_counter() - started) * 1000)
+        if response.status_code >= 400:
+            self.errors[label] = self.errors.get(label, 0) + 1
+        return response
+
+    def total(self) -> int:
+        return sum(len(values) for values in self.latency.values())
+
+    def summary(self, duration: float) -> Dict[str, dict]:
+        result = {}
+        for label in sorted(self.latency):
+            values = sorted(self.latency[label])
+            result[label] = {
+                "requests": len(values),
+                "errors": self.errors.get(label, 0),
+                "rps": round(len(values) / duration, 1),
+                "p50_ms": round(percentile(values, 50), 2),
+                "p95_ms": round(percentile(values, 95), 2),
+                "p99_ms": round(percentile(values, 99), 2),
+            }
+        return result
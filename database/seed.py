@@ -0,0 +1,302 @@
+"""
+Генератор синтетических данных большого объема для нагрузочных проверок.
+Строки вставляются напрямую через SQLAlchemy Core (executemany) крупными транзакциями,
+одинаковое зерно дает одинаковые данные.
+
+    python -m database.seed --scale 0.01
+    python -m database.seed --users 100000 --artists 20000 --bookings 500000 --reviews 1000000 --messages 5000000
+
+У всех пользователей пароль secret123.
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+from dataclasses import dataclass, fields
+from datetime import datetime, timedelta
+from typing import Callable, Iterable, Iterator, List
+
+from sqlalchemy import delete, func, insert, select, text
+from sqlalchemy.engine import Engine
+
+from app.models.models import (
+    Artist, Booking, Conversation, Genre, Message, Organizer, Review, User, artist_genres
+)
+
+# Строк в одном executemany
+SEED_BATCH_SIZE = 10000
+
+# Заранее посчитанный bcrypt-хеш пароля secret123 (стоимость 12): хеширование не повторяется для каждого пользователя
+SEED_PASSWORD = "secret123"
+SEED_PASSWORD_HASH = "$2b$12$d/1BD.Kh2oSaxlng.TF0MOoLKWc2bgzemLXw.WS85cPJM8DbvQ/Oe"
+
+# Все даты отсчитываются от фиксированного момента — результат не зависит от времени запуска
+SEED_EPOCH = datetime(2025, 1, 1)
+SEED_PERIOD = timedelta(days=730)
+
+GENRES = [
+    "рок", "джаз", "поп", "фолк", "электроника", "классика", "блюз", "метал", "хип-хоп", "инди",
+    "панк", "регги", "соул", "фанк", "кантри", "шансон", "диджей", "кавер", "акустика", "этно",
+]
+WORDS = [
+    "живой", "звук", "группа", "концерт", "вечер", "оркестр", "дуэт", "сет", "гитара", "вокал",
+    "барабаны", "саксофон", "танцы", "свадьба", "корпоратив", "фестиваль", "клуб", "программа",
+]
+# Доля статусов бронирований
+BOOKING_STATUSES = [("confirmed", 0.5), ("pending", 0.2), ("declined", 0.2), ("cancelled", 0.1)]
+
+
+@dataclass
+class Volumes:
+    users: int = 100_000
+    artists: int = 20_000
+    organizers: int = 10_000
+    bookings: int = 500_000
+    reviews: int = 1_000_000
+    messages: int = 5_000_000
+
+    def scaled(self, scale: float) -> "Volumes":
+        return Volumes(**{f.name: max(1, int(getattr(self, f.name) * scale)) for f in fields(self)})
+
+    def validate(self) -> None:
+        if self.artists + self.organizers > self.users:
+            raise ValueError("Артистов и организаторов больше, чем пользователей")
+
+
+def _batches(rows: Iterable[dict], size: int = SEED_BATCH_SIZE) -> Iterator[List[dict]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _moment(rng: random.Random) -> datetime:
+    return SEED_EPOCH + timedelta(seconds=rng.randrange(int(SEED_PERIOD.total_seconds())))
+
+
+# ==================== ГЕНЕРАЦИЯ СТРОК ====================
+# id задаются явно: связи между таблицами вычисляются без чтения из БД.
+# Пользователи 1..artists — артисты, далее организаторы, остальные без профиля
+
+def _users(rng: random.Random, volumes: Volumes) -> Iterator[dict]:
+    for user_id in range(1, volumes.users + 1):
+        if user_id <= volumes.artists:
+            role = "artist"
+        elif user_id <= volumes.artists + volumes.organizers:
+            role = "organizer"
+        else:
+            role = rng.choice(("artist", "organizer"))
+        yield {
+            "id": user_id,
+            "email": f"user{user_id}@example.com",
+            "password_hash": SEED_PASSWORD_HASH,
+            "phone": f"+7900{user_id:07d}",
+            "created_at": _moment(rng),
+            "is_active": True,
+            "role": role,
+        }
+
+
+def _artists(rng: random.Random, volumes: Volumes) -> Iterator[dict]:
+    for artist_id in range(1, volumes.artists + 1):
+        price_min = rng.randrange(5, 300) * 1000
+        yield {
+            "artist_id": artist_id,
+            "user_id": artist_id,
+            "stage_name": f"{rng.choice(WORDS).capitalize()} {rng.choice(WORDS)} {artist_id}",
+            "bio": " ".join(rng.choices(WORDS, k=rng.randint(5, 30))),
+            "price_min": price_min,
+            "price_max": price_min + rng.randrange(0, 500) * 1000,
+            "rating": 0.0,
+            "rating_sum": 0.0,
+            "rating_count": 0,
+        }
+
+
+def _artist_genres(rng: random.Random, volumes: Volumes) -> Iterator[dict]:
+    for artist_id in range(1, volumes.artists + 1):
+        for genre_id in rng.sample(range(1, len(GENRES) + 1), rng.randint(1, 3)):
+            yield {"artist_id": artist_id, "genre_id": genre_id}
+
+
+def _organizers(rng: random.Random, volumes: Volumes) -> Iterator[dict]:
+    for organizer_id in range(1, volumes.organizers + 1):
+        yield {
+            "organizer_id": organizer_id,
+            "user_id": volumes.artists + organizer_id,
+            "company_name": f"{rng.choice(WORDS).capitalize()} {organizer_id}",
+            "description": " ".join(rng.choices(WORDS, k=rng.randint(3, 15))),
+            "rating": 0.0,
+            "rating_sum": 0.0,
+            "rating_count": 0,
+        }
+
+
+def _booking_parties(booking_id: int, volumes: Volumes):
+    """Артист и организатор бронирования по его id (мультипликативный хеш) — без хранения бронирований в памяти"""
+    return (
+        booking_id * 2654435761 % 4294967291 % volumes.artists + 1,
+        booking_id * 2246822519 % 4294967279 % volumes.organizers + 1,
+    )
+
+
+def _bookings(rng: random.Random, volumes: Volumes) -> Iterator[dict]:
+    statuses, weights = zip(*BOOKING_STATUSES)
+    for booking_id in range(1, volumes.bookings + 1):
+        artist_id, organizer_id = _booking_parties(booking_id, volumes)
+        created_at = _moment(rng)
+        yield {
+            "booking_id": booking_id,
+            "artist_id": artist_id,
+            "organizer_id": organizer_id,
+            "status": rng.choices(statuses, weights)[0],
+            "proposed_price": rng.randrange(5, 800) * 1000,
+            "created_at": created_at,
+            "updated_at": created_at + timedelta(hours=rng.randint(0, 72)),
+            "response_deadline": created_at + timedelta(days=7),
+            "technical_requirements": None,
+        }
+
+
+def _reviews(rng: random.Random, volumes: Volumes) -> Iterator[dict]:
+    for review_id in range(1, volumes.reviews + 1):
+        booking_id = rng.randint(1, volumes.bookings)
+        artist_id, organizer_id = _booking_parties(booking_id, volumes)
+        artist_user, organizer_user = artist_id, volumes.artists + organizer_id
+        # Чаще отзыв пишет организатор об артисте
+        reviewer, reviewed = (organizer_user, artist_user) if rng.random() < 0.7 else (artist_user, organizer_user)
+        yield {
+            "review_id": review_id,
+            "booking_id": booking_id,
+            "reviewer_id": reviewer,
+            "reviewed_id": reviewed,
+            "rating_score": float(rng.choices((1, 2, 3, 4, 5), (1, 1, 3, 6, 9))[0]),
+            "comment": " ".join(rng.choices(WORDS, k=rng.randint(0, 20))) or None,
+            "created_at": _moment(rng),
+            "is_verified": rng.random() < 0.5,
+        }
+
+
+def _messages(rng: random.Random, volumes: Volumes) -> Iterator[dict]:
+    for message_id in range(1, volumes.messages + 1):
+        booking_id = rng.randint(1, volumes.bookings)
+        artist_id, organizer_id = _booking_parties(booking_id, volumes)
+        parties = (artist_id, volumes.artists + organizer_id)
+        sender = rng.randrange(2)
+        yield {
+            "message_id": message_id,
+            "sender_id": parties[sender],
+            "receiver_id": parties[1 - sender],
+            "booking_id": booking_id,
+            "content": " ".join(rng.choices(WORDS, k=rng.randint(1, 25))),
+            "sent_at": _moment(rng),
+            "is_read": rng.random() < 0.8,
+        }
+
+
+# ==================== ЗАГРУЗКА ====================
+
+def _load(engine: Engine, table, rows: Iterable[dict], log: Callable[[str], None]) -> int:
+    """Одна транзакция на таблицу, executemany пачками по SEED_BATCH_SIZE строк"""
+    started, count = time.perf_counter(), 0
+    with engine.begin() as connection:
+        for batch in _batches(rows):
+            connection.execute(insert(table), batch)
+            count += len(batch)
+    elapsed = time.perf_counter() - started
+    log(f"{table.name}: {count} строк за {elapsed:.1f} с ({count / max(elapsed, 1e-9):.0f} строк/с)")
+    return count
+
+
+def clear(engine: Engine) -> None:
+    """Удаляет все данные приложения (в порядке зависимостей)"""
+    with engine.begin() as connection:
+        for table in (Conversation, Message, Review, Booking, artist_genres, Organizer, Artist, Genre, User):
+            connection.execute(delete(table))
+
+
+def generate(engine: Engine, volumes: Volumes, seed: int = 42, log: Callable[[str], None] = print) -> None:
+    """Заполняет пустую БД; у каждой таблицы свой генератор от общего зерна"""
+    volumes.validate()
+    with engine.connect() as connection:
+        if connection.scalar(select(func.count()).select_from(User.__table__)):
+            raise RuntimeError("БД не пуста (используйте --reset)")
+
+    plan = [
+        (User.__table__, _users),
+        (Genre.__table__, lambda rng, v: ({"genre_id": i, "name": name} for i, name in enumerate(GENRES, 1))),
+        (Artist.__table__, _artists),
+        (artist_genres, _artist_genres),
+        (Organizer.__table__, _organizers),
+        (Booking.__table__, _bookings),
+        (Review.__table__, _reviews),
+        (Message.__table__, _messages),
+    ]
+    for table, rows in plan:
+        _load(engine, table, rows(random.Random(f"{seed}:{table.name}"), volumes), log)
+
+    if engine.dialect.name == "postgresql":
+        _reset_sequences(engine, [table for table, _ in plan])
+    asyncio.run(_rebuild_derived(log))
+
+
+def _reset_sequences(engine: Engine, tables) -> None:
+    """После вставки с явными id последовательности PostgreSQL продолжают с максимального id"""
+    with engine.begin() as connection:
+        for table in tables:
+            pk = list(table.primary_key.columns)
+            if len(pk) != 1:
+                continue
+            connection.execute(text(
+                f"SELECT setval(pg_get_serial_sequence('{table.name}', '{pk[0].name}'), "
+                f"coalesce(max({pk[0].name}), 1)) FROM {table.name}"
+            ))
+
+
+async def _rebuild_derived(log: Callable[[str], None]) -> None:
+    """Производные данные считаются теми же функциями, что и в служебных командах"""
+    from app.services.conversations import rebuild_conversations
+    from app.services.ratings import recompute_ratings
+    from app.services.search import rebuild_index
+    from database.database import AsyncSessionLocal
+
+    for name, rebuild in (
+        ("рейтинги", recompute_ratings),
+        ("диалоги", rebuild_conversations),
+        ("поисковый индекс", rebuild_index),
+    ):
+        started = time.perf_counter()
+        async with AsyncSessionLocal() as session:
+            await rebuild(session)
+        log(f"{name}: {time.perf_counter() - started:.1f} с")
+
+
+if __name__ == "__main__":
+    defaults = Volumes()
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    for f in fields(Volumes):
+        parser.add_argument(f"--{f.name}", type=int, default=getattr(defaults, f.name))
+    parser.add_argument("--scale", type=float, default=1.0, help="множитель всех объемов")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--reset", action="store_true", help="удалить существующие данные")
+    args = parser.parse_args()
+
+    from database.database import engine, upgrade_database
+
+    volumes = Volumes(**{f.name: getattr(args, f.name) for f in fields(Volumes)}).scaled(args.scale)
+    upgrade_database()
+    if args.reset:
+        clear(engine)
+
+    started = time.perf_counter()
+    try:
+        generate(engine, volumes, args.seed)
+    except (RuntimeError, ValueError) as e:
+        print(e)
+        sys.exit(1)
+    print(f"Готово за {time.perf_counter() - started:.1f} с")
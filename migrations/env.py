@@ -0,0 +1,58 @@
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine
+
+from database.database import SQLALCHEMY_DATABASE_URL, Base, engine
+import app.models.models  # noqa: F401  (регистрация моделей в Base.metadata)
+
+config = context.config
+
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = Base.metadata
+
+# Полнотекстовый индекс (и служебные таблицы FTS5) создается миграциями вручную и не описан моделями
+_UNMANAGED_TABLE_PREFIX = "artists_fts"
+
+
+def include_object(obj, name, type_, reflected, compare_to):
+    return not (type_ == "table" and name.startswith(_UNMANAGED_TABLE_PREFIX))
+
+
+def _configure(**kwargs) -> None:
+    context.configure(
+        target_metadata=target_metadata,
+        include_object=include_object,
+        # SQLite не умеет ALTER большинства ограничений — изменения таблиц через пересоздание
+        render_as_batch=True,
+        **kwargs,
+    )
+
+
+def run_migrations_offline() -> None:
+    """Генерация SQL без подключения: alembic upgrade head --sql"""
+    _configure(
+        url=config.get_main_option("sqlalchemy.url") or SQLALCHEMY_DATABASE_URL,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    url = config.get_main_option("sqlalchemy.url")
+    connectable = create_engine(url) if url else engine
+
+    with connectable.connect() as connection:
+        _configure(connection=connection)
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
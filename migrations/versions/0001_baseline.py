@@ -0,0 +1,137 @@
+"""Базовая схема — таблицы, которые исходная версия создавала через Base.metadata.create_all
+
+Для существующей БД, созданной до появления миграций:
+    alembic stamp 0001 && alembic upgrade head
+Последующие миграции переносят данные (жанры, рейтинги, диалоги, поисковый индекс).
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-16 12:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'users',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('email', sa.String(), nullable=False),
+        sa.Column('password_hash', sa.String(), nullable=False),
+        sa.Column('phone', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('last_login', sa.DateTime(), nullable=True),
+        sa.Column('is_active', sa.Boolean(), nullable=True),
+        sa.Column('role', sa.Enum('artist', 'organizer', 'admin', name='userrole'), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_users_email', 'users', ['email'], unique=True)
+    op.create_index('ix_users_id', 'users', ['id'])
+
+    op.create_table(
+        'artists',
+        sa.Column('artist_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('stage_name', sa.String(), nullable=False),
+        sa.Column('bio', sa.Text(), nullable=True),
+        sa.Column('genres', sa.String(), nullable=True),
+        sa.Column('price_min', sa.Float(), nullable=True),
+        sa.Column('price_max', sa.Float(), nullable=True),
+        sa.Column('rating', sa.Float(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('artist_id'),
+        sa.UniqueConstraint('user_id'),
+    )
+    op.create_index('ix_artists_artist_id', 'artists', ['artist_id'])
+
+    op.create_table(
+        'organizers',
+        sa.Column('organizer_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('company_name', sa.String(), nullable=False),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('address', sa.String(), nullable=True),
+        sa.Column('website', sa.String(), nullable=True),
+        sa.Column('rating', sa.Float(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('organizer_id'),
+        sa.UniqueConstraint('user_id'),
+    )
+    op.create_index('ix_organizers_organizer_id', 'organizers', ['organizer_id'])
+
+    op.create_table(
+        'bookings',
+        sa.Column('booking_id', sa.Integer(), nullable=False),
+        sa.Column('event_id', sa.Integer(), nullable=True),
+        sa.Column('artist_id', sa.Integer(), nullable=False),
+        sa.Column('organizer_id', sa.Integer(), nullable=False),
+        sa.Column(
+            'status',
+            sa.Enum('pending', 'confirmed', 'declined', 'cancelled', name='bookingstatus'),
+            nullable=True,
+        ),
+        sa.Column('proposed_price', sa.Float(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.Column('response_deadline', sa.DateTime(), nullable=True),
+        sa.Column('technical_requirements', sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(['artist_id'], ['artists.artist_id']),
+        sa.ForeignKeyConstraint(['organizer_id'], ['organizers.organizer_id']),
+        sa.PrimaryKeyConstraint('booking_id'),
+    )
+    op.create_index('ix_bookings_booking_id', 'bookings', ['booking_id'])
+
+    op.create_table(
+        'reviews',
+        sa.Column('review_id', sa.Integer(), nullable=False),
+        sa.Column('booking_id', sa.Integer(), nullable=False),
+        sa.Column('reviewer_id', sa.Integer(), nullable=False),
+        sa.Column('reviewed_id', sa.Integer(), nullable=False),
+        sa.Column('rating_score', sa.Float(), nullable=False),
+        sa.Column('comment', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('is_verified', sa.Boolean(), nullable=True),
+        sa.ForeignKeyConstraint(['booking_id'], ['bookings.booking_id']),
+        sa.ForeignKeyConstraint(['reviewed_id'], ['users.id']),
+        sa.ForeignKeyConstraint(['reviewer_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('review_id'),
+    )
+    op.create_index('ix_reviews_review_id', 'reviews', ['review_id'])
+
+    op.create_table(
+        'messages',
+        sa.Column('message_id', sa.Integer(), nullable=False),
+        sa.Column('sender_id', sa.Integer(), nullable=False),
+        sa.Column('receiver_id', sa.Integer(), nullable=False),
+        sa.Column('booking_id', sa.Integer(), nullable=True),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('sent_at', sa.DateTime(), nullable=True),
+        sa.Column('is_read', sa.Boolean(), nullable=True),
+        sa.ForeignKeyConstraint(['booking_id'], ['bookings.booking_id']),
+        sa.ForeignKeyConstraint(['receiver_id'], ['users.id']),
+        sa.ForeignKeyConstraint(['sender_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('message_id'),
+    )
+    op.create_index('ix_messages_message_id', 'messages', ['message_id'])
+
+
+def downgrade() -> None:
+    op.drop_table('messages')
+    op.drop_table('reviews')
+    op.drop_table('bookings')
+    op.drop_table('organizers')
+    op.drop_table('artists')
+    op.drop_table('users')
+    if op.get_bind().dialect.name == 'postgresql':
+        sa.Enum(name='bookingstatus').drop(op.get_bind(), checkfirst=True)
+        sa.Enum(name='userrole').drop(op.get_bind(), checkfirst=True)
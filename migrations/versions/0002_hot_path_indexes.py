@@ -0,0 +1,44 @@
+"""Составные индексы для частых запросов
+
+- бронирования участника: по artist_id / organizer_id с сортировкой по created_at и со статусом;
+- отзывы об артисте: соединение reviews с bookings по booking_id;
+- каталог артистов: фильтр по price_min / price_max и сортировка по rating.
+
+Индексы сообщений (включая непрочитанные: receiver_id, is_read) создаются вместе с диалогами в 0005.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16 12:30:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ('ix_bookings_artist_id_created_at', 'bookings', ['artist_id', 'created_at', 'booking_id']),
+    ('ix_bookings_organizer_id_created_at', 'bookings', ['organizer_id', 'created_at', 'booking_id']),
+    ('ix_bookings_artist_id_status_created_at', 'bookings', ['artist_id', 'status', 'created_at']),
+    ('ix_bookings_organizer_id_status_created_at', 'bookings', ['organizer_id', 'status', 'created_at']),
+    ('ix_reviews_booking_id_reviewer_id', 'reviews', ['booking_id', 'reviewer_id']),
+    ('ix_artists_price_min', 'artists', ['price_min']),
+    ('ix_artists_price_max', 'artists', ['price_max']),
+    ('ix_artists_rating_artist_id', 'artists', ['rating', 'artist_id']),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
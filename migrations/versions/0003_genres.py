@@ -0,0 +1,92 @@
+"""Справочник жанров вместо строки через запятую в artists.genres
+
+Жанры существующих артистов переносятся в genres / artist_genres (нижний регистр, без повторов),
+после чего колонка artists.genres удаляется.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 10:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+genres = sa.table('genres', sa.column('genre_id', sa.Integer), sa.column('name', sa.String))
+artist_genres = sa.table('artist_genres', sa.column('artist_id', sa.Integer), sa.column('genre_id', sa.Integer))
+artists = sa.table('artists', sa.column('artist_id', sa.Integer), sa.column('genres', sa.String))
+
+
+def _split(value):
+    """Та же нормализация, что и app.services.genres.normalize_genres"""
+    result = []
+    for name in (value or '').split(','):
+        name = name.strip().lower()
+        if name and name not in result:
+            result.append(name)
+    return result
+
+
+def upgrade() -> None:
+    op.create_table(
+        'genres',
+        sa.Column('genre_id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint('genre_id'),
+    )
+    op.create_index('ix_genres_genre_id', 'genres', ['genre_id'])
+    op.create_index('ix_genres_name', 'genres', ['name'], unique=True)
+
+    op.create_table(
+        'artist_genres',
+        sa.Column('artist_id', sa.Integer(), nullable=False),
+        sa.Column('genre_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['artist_id'], ['artists.artist_id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['genre_id'], ['genres.genre_id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('artist_id', 'genre_id'),
+    )
+    op.create_index('ix_artist_genres_genre_id_artist_id', 'artist_genres', ['genre_id', 'artist_id'])
+
+    connection = op.get_bind()
+    genre_ids, links = {}, []
+    for artist_id, value in connection.execute(
+        sa.select(artists.c.artist_id, artists.c.genres).where(artists.c.genres.isnot(None))
+    ):
+        for name in _split(value):
+            genre_ids.setdefault(name, len(genre_ids) + 1)
+            links.append({'artist_id': artist_id, 'genre_id': genre_ids[name]})
+    if genre_ids:
+        op.bulk_insert(genres, [{'genre_id': genre_id, 'name': name} for name, genre_id in genre_ids.items()])
+        op.bulk_insert(artist_genres, links)
+        if connection.dialect.name == 'postgresql':
+            op.execute("SELECT setval(pg_get_serial_sequence('genres', 'genre_id'), (SELECT max(genre_id) FROM genres))")
+
+    with op.batch_alter_table('artists') as batch_op:
+        batch_op.drop_column('genres')
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('artists') as batch_op:
+        batch_op.add_column(sa.Column('genres', sa.String(), nullable=True))
+
+    connection = op.get_bind()
+    joined = {}
+    for artist_id, name in connection.execute(
+        sa.select(artist_genres.c.artist_id, genres.c.name)
+        .join(genres, genres.c.genre_id == artist_genres.c.genre_id)
+        .order_by(artist_genres.c.artist_id, genres.c.name)
+    ):
+        joined.setdefault(artist_id, []).append(name)
+    for artist_id, names in joined.items():
+        connection.execute(artists.update().where(artists.c.artist_id == artist_id).values(genres=','.join(names)))
+
+    op.drop_table('artist_genres')
+    op.drop_table('genres')
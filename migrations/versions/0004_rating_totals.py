@@ -0,0 +1,78 @@
+"""Накопленные суммы и число оценок профилей (рейтинг без пересчета по всем отзывам)
+
+Значения для существующих профилей считаются по отзывам: отзыв организатора оценивает
+артиста бронирования, отзыв артиста — организатора (как app.services.ratings).
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 10:10:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+users = sa.table('users', sa.column('id', sa.Integer), sa.column('role', sa.String))
+bookings = sa.table(
+    'bookings', sa.column('booking_id', sa.Integer),
+    sa.column('artist_id', sa.Integer), sa.column('organizer_id', sa.Integer),
+)
+reviews = sa.table(
+    'reviews', sa.column('booking_id', sa.Integer),
+    sa.column('reviewer_id', sa.Integer), sa.column('rating_score', sa.Float),
+)
+PROFILES = [
+    # таблица, первичный ключ, роль автора отзыва
+    ('artists', 'artist_id', 'organizer'),
+    ('organizers', 'organizer_id', 'artist'),
+]
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    for table, pk, reviewer_role in PROFILES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.add_column(sa.Column('rating_sum', sa.Float(), server_default='0', nullable=False))
+            batch_op.add_column(sa.Column('rating_count', sa.Integer(), server_default='0', nullable=False))
+
+        profiles = sa.table(
+            table, sa.column(pk, sa.Integer), sa.column('rating', sa.Float),
+            sa.column('rating_sum', sa.Float), sa.column('rating_count', sa.Integer),
+        )
+        booking_fk = bookings.c[pk]
+        totals = connection.execute(
+            sa.select(booking_fk, sa.func.sum(reviews.c.rating_score), sa.func.count())
+            .select_from(reviews)
+            .join(bookings, bookings.c.booking_id == reviews.c.booking_id)
+            .join(users, users.c.id == reviews.c.reviewer_id)
+            .where(users.c.role == reviewer_role)
+            .group_by(booking_fk)
+        ).all()
+        connection.execute(profiles.update().values(rating=0.0))
+        if totals:
+            connection.execute(
+                profiles.update().where(profiles.c[pk] == sa.bindparam('profile_id')).values(
+                    rating_sum=sa.bindparam('total'),
+                    rating_count=sa.bindparam('count'),
+                    rating=sa.bindparam('average'),
+                ),
+                [
+                    {'profile_id': profile_id, 'total': total, 'count': count, 'average': round(total / count, 2)}
+                    for profile_id, total, count in totals
+                ],
+            )
+
+
+def downgrade() -> None:
+    for table, _, _ in PROFILES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column('rating_count')
+            batch_op.drop_column('rating_sum')
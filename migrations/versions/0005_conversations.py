@@ -0,0 +1,94 @@
+"""Индексы переписки и таблица диалогов со счетчиками непрочитанных
+
+Диалоги существующих сообщений собираются одним GROUP BY (как rebuild_conversations).
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 10:20:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MESSAGE_INDEXES = [
+    ('ix_messages_sender_id_receiver_id_sent_at', ['sender_id', 'receiver_id', 'sent_at', 'message_id']),
+    ('ix_messages_receiver_id_sender_id_sent_at', ['receiver_id', 'sender_id', 'sent_at', 'message_id']),
+    ('ix_messages_receiver_id_is_read_sender_id', ['receiver_id', 'is_read', 'sender_id']),
+    ('ix_messages_booking_id_sent_at', ['booking_id', 'sent_at', 'message_id']),
+]
+
+messages = sa.table(
+    'messages', sa.column('message_id', sa.Integer), sa.column('sender_id', sa.Integer),
+    sa.column('receiver_id', sa.Integer), sa.column('sent_at', sa.DateTime), sa.column('is_read', sa.Boolean),
+)
+conversations = sa.table(
+    'conversations', sa.column('user_id', sa.Integer), sa.column('counterpart_id', sa.Integer),
+    sa.column('last_message_id', sa.Integer), sa.column('last_message_at', sa.DateTime),
+    sa.column('unread_count', sa.Integer),
+)
+
+
+def upgrade() -> None:
+    for name, columns in MESSAGE_INDEXES:
+        op.create_index(name, 'messages', columns)
+
+    op.create_table(
+        'conversations',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('counterpart_id', sa.Integer(), nullable=False),
+        sa.Column('last_message_id', sa.Integer(), nullable=False),
+        sa.Column('last_message_at', sa.DateTime(), nullable=False),
+        sa.Column('unread_count', sa.Integer(), server_default='0', nullable=False),
+        sa.ForeignKeyConstraint(['counterpart_id'], ['users.id']),
+        sa.ForeignKeyConstraint(['last_message_id'], ['messages.message_id']),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('user_id', 'counterpart_id'),
+    )
+    op.create_index(
+        'ix_conversations_user_id_last_message_at', 'conversations', ['user_id', 'last_message_at', 'counterpart_id']
+    )
+
+    # Сообщения без времени отправки (колонка допускала NULL) в диалоги не попадают
+    sides = sa.union_all(
+        sa.select(
+            messages.c.sender_id.label('user_id'),
+            messages.c.receiver_id.label('counterpart_id'),
+            messages.c.message_id,
+            messages.c.sent_at,
+            sa.literal(0).label('unread'),
+        ).where(messages.c.sent_at.isnot(None)),
+        sa.select(
+            messages.c.receiver_id,
+            messages.c.sender_id,
+            messages.c.message_id,
+            messages.c.sent_at,
+            sa.case((sa.or_(messages.c.is_read.is_(None), messages.c.is_read == sa.false()), 1), else_=0),
+        ).where(messages.c.receiver_id != messages.c.sender_id, messages.c.sent_at.isnot(None)),
+    ).subquery()
+    op.execute(
+        conversations.insert().from_select(
+            ['user_id', 'counterpart_id', 'last_message_id', 'last_message_at', 'unread_count'],
+            sa.select(
+                sides.c.user_id,
+                sides.c.counterpart_id,
+                sa.func.max(sides.c.message_id),
+                sa.func.max(sides.c.sent_at),
+                sa.func.sum(sides.c.unread),
+            ).group_by(sides.c.user_id, sides.c.counterpart_id),
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('conversations')
+    for name, _ in reversed(MESSAGE_INDEXES):
+        op.drop_index(name, table_name='messages')
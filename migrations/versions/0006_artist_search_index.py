@@ -0,0 +1,76 @@
+"""Полнотекстовый индекс артистов (см. app/services/search.py)
+
+SQLite — виртуальная таблица FTS5 с основами слов, PostgreSQL — tsvector с GIN-индексом.
+Индекс заполняется по существующим артистам.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 10:30:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.services.search import tokenize
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    if connection.dialect.name == 'postgresql':
+        op.execute(
+            "CREATE TABLE artists_fts ("
+            "artist_id INTEGER PRIMARY KEY REFERENCES artists (artist_id) ON DELETE CASCADE, "
+            "document TSVECTOR NOT NULL)"
+        )
+        op.execute("CREATE INDEX ix_artists_fts_document ON artists_fts USING GIN (document)")
+        op.execute(
+            "INSERT INTO artists_fts (artist_id, document) "
+            "SELECT a.artist_id, "
+            "setweight(to_tsvector('russian', coalesce(a.stage_name, '')), 'A') || "
+            "setweight(to_tsvector('russian', coalesce(string_agg(g.name, ' '), '')), 'B') || "
+            "setweight(to_tsvector('russian', coalesce(a.bio, '')), 'C') "
+            "FROM artists a "
+            "LEFT JOIN artist_genres ag ON ag.artist_id = a.artist_id "
+            "LEFT JOIN genres g ON g.genre_id = ag.genre_id "
+            "GROUP BY a.artist_id, a.stage_name, a.bio"
+        )
+        return
+
+    op.execute(
+        "CREATE VIRTUAL TABLE artists_fts USING fts5("
+        "stage_name, bio, genres, tokenize = 'porter unicode61 remove_diacritics 2')"
+    )
+    # Русские основы считаются стеммером приложения, поэтому строки индекса готовятся в Python
+    rows = connection.execute(sa.text(
+        "SELECT a.artist_id, a.stage_name, a.bio, group_concat(g.name, ' ') "
+        "FROM artists a "
+        "LEFT JOIN artist_genres ag ON ag.artist_id = a.artist_id "
+        "LEFT JOIN genres g ON g.genre_id = ag.genre_id "
+        "GROUP BY a.artist_id, a.stage_name, a.bio"
+    )).all()
+    if rows:
+        connection.execute(
+            sa.text("INSERT INTO artists_fts (rowid, stage_name, bio, genres) VALUES (:rowid, :stage_name, :bio, :genres)"),
+            [
+                {
+                    'rowid': artist_id,
+                    'stage_name': ' '.join(tokenize(stage_name)),
+                    'bio': ' '.join(tokenize(bio)),
+                    'genres': ' '.join(tokenize(genres)),
+                }
+                for artist_id, stage_name, bio, genres in rows
+            ],
+        )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS artists_fts")
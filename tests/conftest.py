@@ -0,0 +1,71 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+# Приложение создает БД относительно рабочего каталога,
+# поэтому тесты работают во временном каталоге
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+os.chdir(tempfile.mkdtemp(prefix="muzplatforma-tests-"))
+# Минимальная стоимость bcrypt ускоряет регистрацию и вход в тестах
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+# Схема тестовой БД пересоздается из моделей в фикстуре client
+os.environ.setdefault("DB_AUTO_MIGRATE", "0")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.core.main import app  # noqa: E402
+from app.services.principals import principal_cache  # noqa: E402
+from app.services.response_cache import response_cache  # noqa: E402
+from database.database import Base, engine  # noqa: E402
+
+
+@pytest.fixture
+def client():
+    """Клиент API поверх чистой БД"""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    principal_cache.clear()
+    response_cache.clear()
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def login(client):
+    """Регистрирует пользователя и возвращает заголовки авторизации"""
+    def _login(email: str, role: str, password: str = "secret123"):
+        client.post("/api/register", json={"email": email, "password": password, "role": role})
+        response = client.post("/api/token", data={"username": email, "password": password})
+        assert response.status_code == 200
+        return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    return _login
+
+
+@pytest.fixture
+def booking(client, login):
+    """Артист, организатор и бронирование между ними"""
+    artist_headers = login("artist@test.com", "artist")
+    organizer_headers = login("organizer@test.com", "organizer")
+    artist_id = client.post(
+        "/api/artists", json={"stage_name": "Test Artist", "genres": ["rock"]}, headers=artist_headers
+    ).json()["artist_id"]
+    organizer_id = client.post(
+        "/api/organizers", json={"company_name": "Test Events"}, headers=organizer_headers
+    ).json()["organizer_id"]
+    booking_id = client.post(
+        "/api/bookings", json={"artist_id": artist_id, "proposed_price": 1000}, headers=organizer_headers
+    ).json()["booking_id"]
+
+    return {
+        "artist_id": artist_id,
+        "organizer_id": organizer_id,
+        "booking_id": booking_id,
+        "artist_user_id": client.get("/api/users/me", headers=artist_headers).json()["id"],
+        "organizer_user_id": client.get("/api/users/me", headers=organizer_headers).json()["id"],
+        "artist_headers": artist_headers,
+        "organizer_headers": organizer_headers,
+    }
@@ -0,0 +1,127 @@
+import asyncio
+import gzip
+import zlib
+
+from starlette.applications import Starlette
+from starlette.responses import Response, StreamingResponse
+from starlette.routing import Mount
+from starlette.testclient import TestClient
+
+from app.services.assets import IMMUTABLE_CACHE_CONTROL, StaticAssets, build_assets
+from app.services.compression import CompressionMiddleware, accepted_encodings
+
+
+def _static_client(tmp_path):
+    manifest = build_assets(target=tmp_path)
+    app = Starlette(routes=[Mount("/static", app=StaticAssets(build=tmp_path))])
+    return TestClient(app), manifest
+
+
+def test_build_hashes_assets_and_rewrites_references(tmp_path):
+    manifest = build_assets(target=tmp_path)
+
+    style = manifest["assets"]["css/style.css"]
+    assert style.startswith("css/style.") and style != "css/style.css"
+    assert manifest["assets"]["index.html"] == "index.html"
+    assert manifest["files"][style]["immutable"] is True
+
+    index = (tmp_path / "index.html").read_text(encoding="utf-8")
+    assert f"/static/{style}" in index
+    assert "/static/css/style.css" not in index
+    # Сжатый вариант совпадает с файлом после распаковки
+    assert gzip.decompress((tmp_path / (style + ".gz")).read_bytes()) == (tmp_path / style).read_bytes()
+
+
+def test_hashed_assets_are_immutable_and_negotiated(tmp_path):
+    client, manifest = _static_client(tmp_path)
+    url = "/static/" + manifest["assets"]["js/main.js"]
+
+    response = client.get(url, headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["content-type"].startswith("text/javascript")
+
+    plain = client.get(url, headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.content == response.content
+    assert plain.headers["etag"] != response.headers["etag"]
+
+    revalidated = client.get(url, headers={"Accept-Encoding": "gzip", "If-None-Match": response.headers["etag"]})
+    assert revalidated.status_code == 304
+
+
+def test_pages_and_unhashed_names_revalidate(tmp_path):
+    client, manifest = _static_client(tmp_path)
+
+    page = client.get("/static/index.html")
+    assert page.status_code == 200
+    assert page.headers["cache-control"] == "no-cache"
+
+    legacy = client.get("/static/css/style.css")
+    assert legacy.status_code == 200
+    assert legacy.headers["cache-control"] == "no-cache"
+    assert client.get("/static/../manifest.json").status_code == 404
+    assert client.post("/static/index.html").status_code == 405
+
+
+def test_accept_encoding_preferences():
+    assert accepted_encodings("gzip, br", ("br", "gzip")) == ["br", "gzip"]
+    assert accepted_encodings("br;q=0.5, gzip", ("br", "gzip")) == ["gzip", "br"]
+    assert accepted_encodings("gzip;q=0, *", ("br", "gzip")) == ["br"]
+    assert accepted_encodings("identity", ("br", "gzip")) == []
+    assert accepted_encodings(None, ("gzip",)) == []
+
+
+# ==================== СЖАТИЕ ОТВЕТОВ API ====================
+
+def test_api_json_is_compressed(client):
+    response = client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert response.json()["info"]["title"]
+
+    plain = client.get("/openapi.json", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+
+
+def test_weak_etag_of_compressed_response_revalidates(client, booking):
+    url = f"/api/artists/{booking['artist_id']}"
+    etag = client.get(url).headers["etag"]
+    assert client.get(url, headers={"If-None-Match": f"W/{etag}"}).status_code == 304
+
+
+def _run(app, headers):
+    """Ответ ASGI-приложения по частям тела"""
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": headers}
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    return messages[0], [message.get("body", b"") for message in messages[1:]]
+
+
+def test_streams_are_flushed_per_chunk_and_sse_is_untouched():
+    lines = [b'{"n": %d, "payload": "%s"}\n' % (n, b"x" * 600) for n in range(4)]
+
+    async def ndjson(scope, receive, send):
+        async def body():
+            for line in lines:
+                yield line
+        await StreamingResponse(body(), media_type="application/x-ndjson")(scope, receive, send)
+
+    start, chunks = _run(CompressionMiddleware(ndjson), [(b"accept-encoding", b"gzip")])
+    assert (b"content-encoding", b"gzip") in start["headers"]
+    # Каждая часть отдается сразу (flush), а не копится до конца потока
+    decompressor = zlib.decompressobj(31)
+    assert [decompressor.decompress(chunk) for chunk in chunks[:len(lines)]] == lines
+
+    events = Response(b"data: " + b"x" * 4000 + b"\n\n", media_type="text/event-stream")
+    start, chunks = _run(CompressionMiddleware(events), [(b"accept-encoding", b"gzip")])
+    assert all(name != b"content-encoding" for name, _ in start["headers"])
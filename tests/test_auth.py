@@ -0,0 +1,88 @@
+import asyncio
+
+from app.models.models import User
+from app.services import passwords
+from app.services.principals import principal_cache
+from database.database import AsyncSessionLocal, async_engine
+from sqlalchemy import event, select
+
+
+def _stored_hash(email):
+    async def load():
+        async with AsyncSessionLocal() as db:
+            return (await db.scalars(select(User.password_hash).where(User.email == email))).one()
+
+    return asyncio.run(load())
+
+
+def test_password_is_rehashed_when_cost_changes(client, login, monkeypatch):
+    login("rehash@test.com", "artist")
+    assert passwords.get_rounds(_stored_hash("rehash@test.com")) == passwords.BCRYPT_ROUNDS
+
+    monkeypatch.setattr(passwords, "BCRYPT_ROUNDS", passwords.BCRYPT_ROUNDS + 1)
+    response = client.post("/api/token", data={"username": "rehash@test.com", "password": "secret123"})
+
+    assert response.status_code == 200
+    assert passwords.get_rounds(_stored_hash("rehash@test.com")) == passwords.BCRYPT_ROUNDS
+
+
+def test_saturated_hasher_returns_503(client, monkeypatch):
+    monkeypatch.setattr(passwords.password_hasher, "queue_size", 0)
+
+    response = client.post(
+        "/api/register", json={"email": "busy@test.com", "password": "secret123", "role": "artist"}
+    )
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == str(passwords.PASSWORD_HASH_RETRY_AFTER)
+
+
+def _set_active(email, is_active):
+    async def update():
+        async with AsyncSessionLocal() as db:
+            user = (await db.scalars(select(User).where(User.email == email))).one()
+            user.is_active = is_active
+            await db.commit()
+
+    asyncio.run(update())
+
+
+def test_principal_is_cached_per_token(client, login):
+    headers = login("cached@test.com", "artist")
+    hits = principal_cache.hits
+
+    for _ in range(3):
+        assert client.get("/api/users/me", headers=headers).status_code == 200
+
+    assert principal_cache.hits - hits == 2
+
+
+def test_cache_is_invalidated_on_profile_and_deactivation(client, login):
+    headers = login("inv@test.com", "artist")
+    client.get("/api/users/me", headers=headers)
+
+    client.post("/api/artists", json={"stage_name": "Invalidated"}, headers=headers)
+    assert principal_cache.stats()["size"] == 0
+
+    assert client.get("/api/users/me", headers=headers).status_code == 200
+    _set_active("inv@test.com", False)
+    assert client.get("/api/users/me", headers=headers).status_code == 400
+
+
+def test_profile_ids_resolved_with_user_in_one_query(client, booking):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    principal_cache.clear()
+    event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        response = client.get("/api/bookings", headers=booking["artist_headers"])
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", record)
+
+    assert [b["booking_id"] for b in response.json()] == [booking["booking_id"]]
+    # Пользователь с профилями и сами бронирования; без повторного поиска профиля по user_id
+    assert len(statements) == 2
+    assert "LEFT OUTER JOIN artists" in statements[0] and "LEFT OUTER JOIN organizers" in statements[0]
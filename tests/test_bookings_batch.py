@@ -0,0 +1,118 @@
+import time
+
+from sqlalchemy import event
+
+from database.database import async_engine
+
+
+def _artists(client, login, count):
+    artist_ids = []
+    for i in range(count):
+        headers = login(f"batch-artist{i}@test.com", "artist")
+        response = client.post("/api/artists", json={"stage_name": f"Batch {i}"}, headers=headers)
+        artist_ids.append(response.json()["artist_id"])
+    return artist_ids
+
+
+class _StatementCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __enter__(self):
+        event.listen(async_engine.sync_engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(async_engine.sync_engine, "before_cursor_execute", self._record)
+
+    def _record(self, *args):
+        self.count += 1
+
+
+def test_batch_create_reports_per_item_results(client, booking):
+    response = client.post(
+        "/api/bookings:batch",
+        json={"items": [
+            {"artist_id": booking["artist_id"], "proposed_price": 500},
+            {"artist_id": 999999},
+            {"artist_id": booking["artist_id"], "technical_requirements": "свет"},
+        ]},
+        headers=booking["organizer_headers"],
+    )
+
+    assert response.status_code == 200
+    results = response.json()
+    assert [r["status_code"] for r in results] == [200, 404, 200]
+    assert results[0]["booking"]["proposed_price"] == 500
+    assert results[2]["booking"]["technical_requirements"] == "свет"
+    assert results[2]["booking"]["organizer_id"] == booking["organizer_id"]
+    assert len(client.get("/api/bookings", headers=booking["organizer_headers"]).json()) == 3
+
+    forbidden = client.post(
+        "/api/bookings:batch", json={"items": [{"artist_id": booking["artist_id"]}]},
+        headers=booking["artist_headers"],
+    )
+    assert forbidden.status_code == 403
+
+
+def test_batch_status_update(client, booking, login):
+    other = login("batch-other@test.com", "artist")
+    client.post("/api/artists", json={"stage_name": "Other"}, headers=other)
+    created = client.post(
+        "/api/bookings:batch",
+        json={"items": [{"artist_id": booking["artist_id"]}]},
+        headers=booking["organizer_headers"],
+    ).json()
+    second_id = created[0]["booking"]["booking_id"]
+
+    response = client.patch(
+        "/api/bookings:batch",
+        json={"items": [
+            {"booking_id": booking["booking_id"], "status": "confirmed"},
+            {"booking_id": second_id, "status": "declined"},
+            {"booking_id": 999999, "status": "confirmed"},
+            {"booking_id": second_id, "status": "confirmed"},
+        ]},
+        headers=booking["artist_headers"],
+    )
+    results = response.json()
+    assert [r["status_code"] for r in results] == [200, 200, 404, 400]
+    assert [results[0]["booking"]["status"], results[1]["booking"]["status"]] == ["confirmed", "declined"]
+
+    foreign = client.patch(
+        "/api/bookings:batch",
+        json={"items": [{"booking_id": booking["booking_id"], "status": "cancelled"}]},
+        headers=other,
+    )
+    assert foreign.json()[0]["status_code"] == 403
+    statuses = {b["booking_id"]: b["status"] for b in client.get("/api/bookings", headers=booking["artist_headers"]).json()}
+    assert statuses == {booking["booking_id"]: "confirmed", second_id: "declined"}
+
+
+def test_batch_is_cheaper_than_single_calls(client, login):
+    artist_ids = _artists(client, login, 20)
+    organizer = login("batch-organizer@test.com", "organizer")
+    client.post("/api/organizers", json={"company_name": "Festival"}, headers=organizer)
+    client.get("/api/users/me", headers=organizer)
+
+    with _StatementCounter() as single:
+        started = time.perf_counter()
+        for artist_id in artist_ids:
+            assert client.post("/api/bookings", json={"artist_id": artist_id}, headers=organizer).status_code == 200
+        single_time = time.perf_counter() - started
+
+    with _StatementCounter() as batch:
+        started = time.perf_counter()
+        response = client.post(
+            "/api/bookings:batch",
+            json={"items": [{"artist_id": artist_id} for artist_id in artist_ids]},
+            headers=organizer,
+        )
+        batch_time = time.perf_counter() - started
+
+    assert all(r["status_code"] == 200 for r in response.json())
+    # Проверка артистов — один запрос на пакет. Вставка одним INSERT ... RETURNING там, где SQLAlchemy
+    # может вернуть строки в порядке параметров (PostgreSQL); в SQLite — по строке в той же транзакции
+    inserts = 1 if async_engine.dialect.name == "postgresql" else len(artist_ids)
+    assert batch.count <= 2 + inserts < single.count
+    assert batch_time < single_time
@@ -0,0 +1,53 @@
+def _send(client, headers, receiver_id, content, booking_id=None):
+    response = client.post(
+        "/api/messages",
+        json={"receiver_id": receiver_id, "content": content, "booking_id": booking_id},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_conversations_track_last_message_and_unread(client, booking, login):
+    other = login("other@test.com", "organizer")
+    _send(client, booking["organizer_headers"], booking["artist_user_id"], "первое")
+    _send(client, booking["organizer_headers"], booking["artist_user_id"], "второе")
+    _send(client, other, booking["artist_user_id"], "от другого")
+    _send(client, booking["artist_headers"], booking["organizer_user_id"], "ответ")
+
+    conversations = client.get("/api/conversations", headers=booking["artist_headers"]).json()
+
+    assert [(c["counterpart_id"], c["unread_count"], c["last_message"]["content"]) for c in conversations] == [
+        (booking["organizer_user_id"], 2, "ответ"),
+        (client.get("/api/users/me", headers=other).json()["id"], 1, "от другого"),
+    ]
+    assert client.get("/api/messages/unread", headers=booking["artist_headers"]).json() == {"unread_count": 3}
+    assert client.get("/api/messages/unread", headers=booking["organizer_headers"]).json() == {"unread_count": 1}
+
+
+def test_thread_and_mark_read(client, booking, login):
+    other = login("other@test.com", "organizer")
+    for i in range(3):
+        _send(client, booking["organizer_headers"], booking["artist_user_id"], f"msg {i}", booking["booking_id"])
+    _send(client, other, booking["artist_user_id"], "чужое")
+
+    thread = client.get(
+        f"/api/conversations/{booking['organizer_user_id']}/messages",
+        params={"limit": 2},
+        headers=booking["artist_headers"],
+    )
+    assert [m["content"] for m in thread.json()] == ["msg 2", "msg 1"]
+    assert "X-Next-Cursor" in thread.headers
+
+    by_booking = client.get(f"/api/bookings/{booking['booking_id']}/messages", headers=booking["artist_headers"])
+    assert len(by_booking.json()) == 3
+    assert client.get(f"/api/bookings/{booking['booking_id']}/messages", headers=other).status_code == 403
+
+    response = client.post(
+        "/api/messages/read",
+        json={"counterpart_id": booking["organizer_user_id"]},
+        headers=booking["artist_headers"],
+    )
+    assert response.json() == {"unread_count": 1}
+    conversations = client.get("/api/conversations", headers=booking["artist_headers"]).json()
+    assert sorted(c["unread_count"] for c in conversations) == [0, 1]
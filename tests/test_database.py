@@ -0,0 +1,36 @@
+import asyncio
+
+from sqlalchemy import text
+
+from database import database
+from database.database import SQLITE_BUSY_TIMEOUT_MS, async_engine, engine, engine_options
+
+
+def test_sqlite_connections_are_tuned(client):
+    with engine.connect() as connection:
+        assert connection.scalar(text("PRAGMA journal_mode")) == "wal"
+        assert connection.scalar(text("PRAGMA synchronous")) == 1  # NORMAL
+        assert connection.scalar(text("PRAGMA busy_timeout")) == SQLITE_BUSY_TIMEOUT_MS
+
+    async def pragmas():
+        async with async_engine.connect() as connection:
+            return (
+                await connection.scalar(text("PRAGMA journal_mode")),
+                await connection.scalar(text("PRAGMA cache_size")),
+            )
+
+    assert asyncio.run(pragmas()) == ("wal", -database.SQLITE_CACHE_SIZE_KB)
+
+
+def test_postgresql_pool_and_statement_timeout(monkeypatch):
+    monkeypatch.setattr(database, "DB_POOL_SIZE", 7)
+    monkeypatch.setattr(database, "DB_STATEMENT_TIMEOUT_MS", 2000)
+    url = "postgresql://user:password@db/muzplatforma"
+
+    sync_options = engine_options(url)
+    async_options = engine_options(url, is_async=True)
+
+    assert sync_options["pool_size"] == 7 and sync_options["pool_pre_ping"] is True
+    assert sync_options["connect_args"] == {"options": "-c statement_timeout=2000"}
+    assert async_options["connect_args"] == {"server_settings": {"statement_timeout": "2000"}}
+    assert engine_options("sqlite:///./test.db") == {"connect_args": {"check_same_thread": False}}
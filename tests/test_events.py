@@ -0,0 +1,101 @@
+import asyncio
+
+import httpx
+import pytest
+from starlette.websockets import WebSocketDisconnect
+
+from app.core import main
+from app.services.events import format_sse
+
+
+def _token(headers):
+    return headers["Authorization"].split()[1]
+
+
+def test_websocket_receives_messages_and_booking_status(client, booking):
+    url = f"/api/ws?token={_token(booking['artist_headers'])}"
+    with client.websocket_connect(url) as websocket:
+        client.post(
+            "/api/messages",
+            json={"receiver_id": booking["artist_user_id"], "content": "Привет"},
+            headers=booking["organizer_headers"],
+        )
+        event = websocket.receive_json()
+        assert event["type"] == "message"
+        assert event["data"]["content"] == "Привет"
+
+        client.patch(
+            f"/api/bookings/{booking['booking_id']}",
+            json={"status": "confirmed"},
+            headers=booking["artist_headers"],
+        )
+        event = websocket.receive_json()
+        assert event["type"] == "booking_status"
+        assert event["data"]["status"] == "confirmed"
+
+
+def test_websocket_rejects_invalid_token(client):
+    with pytest.raises(WebSocketDisconnect):
+        with client.websocket_connect("/api/ws?token=invalid") as websocket:
+            websocket.receive_json()
+
+
+def test_sse_requires_token(client):
+    assert client.get("/api/events").status_code == 401
+    assert format_sse({"type": "message", "data": {"id": 1}}) == 'event: message\ndata: {"id": 1}\n\n'
+
+
+def test_sse_delivers_message_events(client, booking, monkeypatch):
+    # Клиент тестов дочитывает ответ целиком, поэтому поток SSE читается напрямую через ASGI
+    monkeypatch.setattr(main, "STREAM_HEARTBEAT_SECONDS", 0.05)
+    token = _token(booking["artist_headers"])
+
+    async def scenario():
+        chunks = asyncio.Queue()
+        disconnected = asyncio.Event()
+        request_sent = False
+
+        async def receive():
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                await chunks.put(message["status"])
+            elif message.get("body"):
+                await chunks.put(message["body"].decode())
+
+        scope = {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+            "scheme": "http", "path": "/api/events", "raw_path": b"/api/events", "root_path": "",
+            "query_string": f"token={token}".encode(), "headers": [(b"host", b"testserver")],
+            "client": ("test", 0), "server": ("testserver", 80),
+        }
+        stream = asyncio.create_task(main.app(scope, receive, send))
+        assert await asyncio.wait_for(chunks.get(), 5) == 200
+        assert await asyncio.wait_for(chunks.get(), 5) == ": connected\n\n"
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=main.app), base_url="http://test") as http:
+            response = await http.post(
+                "/api/messages",
+                json={"receiver_id": booking["artist_user_id"], "content": "Привет по SSE"},
+                headers=booking["organizer_headers"],
+            )
+            assert response.status_code == 200
+
+        while True:
+            chunk = await asyncio.wait_for(chunks.get(), 5)
+            if not chunk.startswith(":"):
+                break
+        disconnected.set()
+        # Поток завершается по отключению клиента
+        await asyncio.wait_for(stream, 5)
+        return chunk
+
+    chunk = asyncio.run(scenario())
+    assert chunk.startswith("event: message\n")
+    assert "Привет по SSE" in chunk
@@ -0,0 +1,57 @@
+import asyncio
+
+from app.services.genres import resolve_genres
+from database.database import AsyncSessionLocal
+
+
+def _create_artist(client, login, email, genres):
+    headers = login(email, "artist")
+    response = client.post("/api/artists", json={"stage_name": email.split("@")[0], "genres": genres}, headers=headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+def _ids(response):
+    return sorted(a["artist_id"] for a in response.json())
+
+
+def test_genres_are_normalized_and_returned_as_list(client, login):
+    artist = _create_artist(client, login, "one@test.com", [" Rock", "indie", "rock", ""])
+    assert artist["genres"] == ["indie", "rock"]
+    assert client.get(f"/api/artists/{artist['artist_id']}").json()["genres"] == ["indie", "rock"]
+
+
+def test_genre_filter_any_and_all(client, login):
+    rock = _create_artist(client, login, "rock@test.com", ["rock"])["artist_id"]
+    fusion = _create_artist(client, login, "fusion@test.com", ["hard-rock-fusion", "jazz"])["artist_id"]
+    both = _create_artist(client, login, "both@test.com", ["rock", "jazz"])["artist_id"]
+
+    # Точное совпадение жанра, без подстрок
+    assert _ids(client.get("/api/artists", params={"genre": "rock"})) == sorted([rock, both])
+    assert _ids(client.get("/api/artists", params={"genre": ["rock", "jazz"]})) == sorted([rock, fusion, both])
+    assert _ids(client.get("/api/artists", params={"genre": ["rock", "jazz"], "genre_match": "all"})) == [both]
+
+
+def test_update_replaces_genres(client, login):
+    headers = login("upd@test.com", "artist")
+    artist_id = client.post(
+        "/api/artists", json={"stage_name": "Upd", "genres": ["pop"]}, headers=headers
+    ).json()["artist_id"]
+
+    response = client.put(f"/api/artists/{artist_id}", json={"genres": ["folk", "blues"]}, headers=headers)
+    assert response.json()["genres"] == ["blues", "folk"]
+    assert _ids(client.get("/api/artists", params={"genre": "pop"})) == []
+
+
+def test_concurrent_resolve_creates_genre_once(client):
+    async def resolve():
+        async with AsyncSessionLocal() as db:
+            genres = await resolve_genres(db, ["Новый жанр", "rock"])
+            await db.commit()
+            return [genre.genre_id for genre in genres]
+
+    async def main():
+        return await asyncio.gather(resolve(), resolve())
+
+    first, second = asyncio.run(main())
+    assert first == second
@@ -0,0 +1,64 @@
+from app.services import metrics
+
+
+def _sample(text: str, prefix: str) -> float:
+    """Значение ряда метрики по началу строки (имя и метки)"""
+    for line in text.splitlines():
+        if line.startswith(prefix):
+            return float(line.rsplit(" ", 1)[1])
+    return 0.0
+
+
+def test_metrics_endpoint_reports_route_latency_and_db_time(client, booking):
+    route = '{route="/api/artists/{artist_id}"}'
+    before = client.get("/metrics").text
+    client.get(f"/api/artists/{booking['artist_id']}", headers=booking["artist_headers"])
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+
+    # Путь с id сводится к шаблону маршрута
+    latency = 'http_request_duration_seconds_count{method="GET",route="/api/artists/{artist_id}",status="200"}'
+    assert _sample(text, latency) == _sample(before, latency) + 1
+    assert f"/api/artists/{booking['artist_id']}\"" not in text
+    assert _sample(text, f"db_queries_per_request_count{route}") == _sample(before, f"db_queries_per_request_count{route}") + 1
+    assert _sample(text, f"db_queries_per_request_sum{route}") > _sample(before, f"db_queries_per_request_sum{route}")
+    assert _sample(text, "db_queries_total") > _sample(before, "db_queries_total")
+    assert _sample(text, 'db_pool_checkouts_total{engine="async"}') > 0
+    assert _sample(text, 'password_hash_duration_seconds_count{operation="hash_password"}') >= 2
+    assert _sample(text, 'password_hash_duration_seconds_count{operation="check_password"}') >= 2
+
+
+def test_cached_responses_keep_route_template(client, booking):
+    url = f"/api/artists/{booking['artist_id']}"
+    client.get(url)
+    assert client.get(url).headers["X-Cache"] == "HIT"
+
+    text = client.get("/metrics").text
+    assert 'route="/api/artists/{artist_id}",status="200"' in text
+    assert 'method="GET",route="unmatched",status="200"' not in text
+
+
+def test_unknown_paths_share_one_series(client):
+    client.get("/api/no-such-endpoint/1")
+    client.get("/api/no-such-endpoint/2")
+
+    text = client.get("/metrics").text
+    assert "/api/no-such-endpoint" not in text
+    assert 'route="unmatched",status="404"' in text
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = metrics.Histogram("test_seconds", "Тест", ("kind",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 5.0):
+        histogram.observe(value, "a")
+
+    assert histogram.samples() == [
+        'test_seconds_bucket{kind="a",le="0.1"} 1',
+        'test_seconds_bucket{kind="a",le="1.0"} 2',
+        'test_seconds_bucket{kind="a",le="+Inf"} 3',
+        'test_seconds_sum{kind="a"} 5.55',
+        'test_seconds_count{kind="a"} 3',
+    ]
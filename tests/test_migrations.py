@@ -0,0 +1,137 @@
+import os
+
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from sqlalchemy import create_engine, desc, false, func, inspect, select, text
+
+from app.models.models import Artist, Booking, BookingStatus, Message, Review
+from database.database import ALEMBIC_INI, Base
+
+
+def _config(url: str) -> Config:
+    config = Config(ALEMBIC_INI)
+    config.set_main_option("sqlalchemy.url", url)
+    config.attributes["configure_logger"] = False
+    return config
+
+
+@pytest.fixture
+def migrated_engine(tmp_path):
+    """Пустая SQLite БД, схема которой создана миграциями"""
+    url = f"sqlite:///{tmp_path / 'migrated.db'}"
+    config = _config(url)
+    command.upgrade(config, "head")
+    engine = create_engine(url)
+    yield engine
+    engine.dispose()
+    command.downgrade(config, "base")
+
+
+def test_migrations_match_models(migrated_engine):
+    with migrated_engine.connect() as connection:
+        context = MigrationContext.configure(connection, opts={
+            "include_object": lambda obj, name, type_, *_: not (type_ == "table" and name.startswith("artists_fts"))
+        })
+        diff = compare_metadata(context, Base.metadata)
+        tables = set(migrated_engine.dialect.get_table_names(connection))
+
+    assert diff == []
+    assert "artists_fts" in tables
+
+
+def test_legacy_database_is_migrated_with_data(tmp_path):
+    """БД исходной версии (create_all без миграций): stamp 0001 и upgrade head переносят данные"""
+    url = f"sqlite:///{tmp_path / 'legacy.db'}"
+    config = _config(url)
+    command.upgrade(config, "0001")
+    engine = create_engine(url)
+    with engine.begin() as connection:
+        connection.execute(text(
+            "INSERT INTO users (id, email, password_hash, role, is_active) VALUES "
+            "(1, 'a@example.com', '-', 'artist', 1), (2, 'o@example.com', '-', 'organizer', 1)"
+        ))
+        connection.execute(text(
+            "INSERT INTO artists (artist_id, user_id, stage_name, bio, genres, rating) "
+            "VALUES (1, 1, 'Джазовый квартет', 'живой звук', 'Jazz, рок,jazz', 0)"
+        ))
+        connection.execute(text("INSERT INTO organizers (organizer_id, user_id, company_name) VALUES (1, 2, 'Клуб')"))
+        connection.execute(text(
+            "INSERT INTO bookings (booking_id, artist_id, organizer_id, status) VALUES (1, 1, 1, 'confirmed')"
+        ))
+        connection.execute(text(
+            "INSERT INTO reviews (review_id, booking_id, reviewer_id, reviewed_id, rating_score) "
+            "VALUES (1, 1, 2, 1, 5), (2, 1, 2, 1, 4)"
+        ))
+        connection.execute(text(
+            "INSERT INTO messages (message_id, sender_id, receiver_id, content, sent_at, is_read) VALUES "
+            "(1, 2, 1, 'привет', '2025-01-01 10:00:00', 0), (2, 2, 1, 'как дела', '2025-01-01 10:05:00', 0)"
+        ))
+
+    command.upgrade(config, "head")
+    with engine.connect() as connection:
+        genres = connection.execute(text(
+            "SELECT g.name FROM artist_genres ag JOIN genres g USING (genre_id) ORDER BY g.name"
+        )).scalars().all()
+        rating = connection.execute(text("SELECT rating, rating_sum, rating_count FROM artists")).one()
+        conversation = connection.execute(text(
+            "SELECT user_id, counterpart_id, last_message_id, unread_count FROM conversations WHERE user_id = 1"
+        )).one()
+        found = connection.execute(text("SELECT rowid FROM artists_fts WHERE artists_fts MATCH 'квартет'")).scalars().all()
+        columns = {column["name"] for column in inspect(connection).get_columns("artists")}
+    engine.dispose()
+
+    assert genres == ["jazz", "рок"]
+    assert "genres" not in columns
+    assert tuple(rating) == (4.5, 9.0, 2)
+    assert tuple(conversation) == (1, 2, 2, 2)
+    assert found == [1]
+
+    command.downgrade(config, "0001")
+
+
+def _plan(engine, stmt):
+    sql = str(stmt.compile(engine, compile_kwargs={"literal_binds": True}))
+    with engine.connect() as connection:
+        return [row[3] for row in connection.execute(text(f"EXPLAIN QUERY PLAN {sql}"))]
+
+
+HOT_QUERIES = {
+    "bookings_of_artist": select(Booking).where(Booking.artist_id == 1).order_by(
+        desc(Booking.created_at), desc(Booking.booking_id)
+    ),
+    "bookings_of_organizer": select(Booking).where(Booking.organizer_id == 1).order_by(
+        desc(Booking.created_at), desc(Booking.booking_id)
+    ),
+    "pending_bookings_of_artist": select(Booking).where(
+        Booking.artist_id == 1, Booking.status == BookingStatus.pending
+    ).order_by(Booking.created_at),
+    "reviews_of_artist": select(Review).join(Booking).where(Booking.artist_id == 1).order_by(
+        desc(Review.created_at)
+    ),
+    "unread_messages": select(Message).where(Message.receiver_id == 1, Message.is_read == false()),
+    # Фильтр по цене — как в каталоге (app.services.catalog.selective)
+    "artists_by_price": select(Artist).where(func.unlikely(Artist.price_min >= 1000)).order_by(
+        desc(Artist.rating), desc(Artist.artist_id)
+    ).limit(21),
+    "artists_by_max_price": select(Artist).where(func.unlikely(Artist.price_max <= 1000)).order_by(
+        desc(Artist.rating), desc(Artist.artist_id)
+    ).limit(21),
+    "artists_by_rating": select(Artist).order_by(desc(Artist.rating), desc(Artist.artist_id)).limit(20),
+}
+
+
+@pytest.mark.parametrize("name", HOT_QUERIES)
+def test_hot_queries_use_indexes(migrated_engine, name):
+    plan = _plan(migrated_engine, HOT_QUERIES[name])
+
+    table_steps = [step for step in plan if step.startswith(("SCAN", "SEARCH"))]
+    assert table_steps, plan
+    for step in table_steps:
+        # Полный обход индекса допустим только для первой страницы каталога по рейтингу (LIMIT)
+        if name == "artists_by_rating":
+            assert step.startswith(("SEARCH", "SCAN")) and "USING" in step and "INDEX" in step, plan
+        else:
+            assert step.startswith("SEARCH") and "USING" in step, plan
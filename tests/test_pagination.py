@@ -0,0 +1,50 @@
+from app.services import pagination
+
+
+def _walk(client, url, headers=None, **params):
+    """Проходит все страницы и возвращает их размеры и все записи"""
+    sizes, items, cursor = [], [], None
+    while True:
+        query = dict(params, **({"cursor": cursor} if cursor else {}))
+        response = client.get(url, params=query, headers=headers)
+        assert response.status_code == 200
+        sizes.append(len(response.json()))
+        items.extend(response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            return sizes, items
+
+
+def test_messages_are_paginated_newest_first(client, login):
+    sender = login("sender@test.com", "organizer")
+    receiver = login("receiver@test.com", "artist")
+    receiver_id = client.get("/api/users/me", headers=receiver).json()["id"]
+    for i in range(5):
+        client.post("/api/messages", json={"receiver_id": receiver_id, "content": f"msg {i}"}, headers=sender)
+
+    sizes, messages = _walk(client, "/api/messages", headers=receiver, limit=2)
+
+    assert sizes == [2, 2, 1]
+    assert [m["content"] for m in messages] == [f"msg {i}" for i in reversed(range(5))]
+
+
+def test_artists_are_paginated_by_rating(client, login):
+    for i in range(3):
+        headers = login(f"artist{i}@test.com", "artist")
+        client.post("/api/artists", json={"stage_name": f"Artist {i}"}, headers=headers)
+
+    sizes, artists = _walk(client, "/api/artists", limit=1)
+
+    assert sizes == [1, 1, 1]
+    assert [a["stage_name"] for a in artists] == ["Artist 2", "Artist 1", "Artist 0"]
+
+
+def test_page_size_is_capped(client, monkeypatch):
+    monkeypatch.setattr(pagination, "PAGE_SIZE_MAX", 3)
+    assert pagination.PageParams(limit=1000).limit == 3
+    assert pagination.PageParams(limit=None).limit == 3
+
+
+def test_invalid_cursor_is_rejected(client, login):
+    headers = login("bad@test.com", "artist")
+    assert client.get("/api/messages", params={"cursor": "not-a-cursor"}, headers=headers).status_code == 400
@@ -0,0 +1,55 @@
+import asyncio
+
+from sqlalchemy import update
+from sqlalchemy.dialects import postgresql
+
+from app.models.models import Artist, Organizer
+from app.services.ratings import _rounded_average, recompute_ratings
+from database.database import AsyncSessionLocal
+
+
+def _review(client, booking, headers, reviewed_id, score):
+    response = client.post(
+        "/api/reviews",
+        json={"booking_id": booking["booking_id"], "reviewed_id": reviewed_id, "rating_score": score},
+        headers=headers,
+    )
+    assert response.status_code == 200
+
+
+def test_reviews_update_artist_and_organizer_ratings(client, booking):
+    client.patch(
+        f"/api/bookings/{booking['booking_id']}", json={"status": "confirmed"}, headers=booking["artist_headers"]
+    )
+    _review(client, booking, booking["organizer_headers"], booking["artist_user_id"], 5.0)
+    _review(client, booking, booking["organizer_headers"], booking["artist_user_id"], 4.0)
+    _review(client, booking, booking["artist_headers"], booking["organizer_user_id"], 3.0)
+
+    assert client.get(f"/api/artists/{booking['artist_id']}").json()["rating"] == 4.5
+    assert client.get(f"/api/organizers/{booking['organizer_id']}").json()["rating"] == 3.0
+
+
+def test_recompute_restores_ratings(client, booking):
+    client.patch(
+        f"/api/bookings/{booking['booking_id']}", json={"status": "confirmed"}, headers=booking["artist_headers"]
+    )
+    _review(client, booking, booking["organizer_headers"], booking["artist_user_id"], 2.0)
+    _review(client, booking, booking["organizer_headers"], booking["artist_user_id"], 5.0)
+
+    async def corrupt_and_recompute():
+        async with AsyncSessionLocal() as db:
+            await db.execute(update(Artist).values(rating=1.0, rating_sum=100.0, rating_count=1))
+            await db.execute(update(Organizer).values(rating=5.0, rating_sum=5.0, rating_count=1))
+            await db.commit()
+            await recompute_ratings(db)
+
+    asyncio.run(corrupt_and_recompute())
+
+    assert client.get(f"/api/artists/{booking['artist_id']}").json()["rating"] == 3.5
+    assert client.get(f"/api/organizers/{booking['organizer_id']}").json()["rating"] == 0.0
+
+
+def test_rounding_compiles_for_postgresql():
+    # round(double precision, integer) в PostgreSQL не существует
+    sql = str(_rounded_average(Artist.rating_sum, Artist.rating_count).compile(dialect=postgresql.dialect()))
+    assert sql.startswith("round(CAST(") and "AS NUMERIC)" in sql
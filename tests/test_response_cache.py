@@ -0,0 +1,35 @@
+def test_public_profile_is_cached_with_etag(client, booking):
+    url = f"/api/artists/{booking['artist_id']}"
+
+    first = client.get(url)
+    assert first.headers["X-Cache"] == "MISS"
+    etag = first.headers["ETag"]
+
+    second = client.get(url)
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.json() == first.json()
+
+    not_modified = client.get(url, headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.headers["ETag"] == etag
+
+
+def test_writes_invalidate_cached_responses(client, booking):
+    url = f"/api/artists/{booking['artist_id']}"
+    etag = client.get(url).headers["ETag"]
+    client.get("/api/artists")
+
+    client.put(url, json={"bio": "Новое описание"}, headers=booking["artist_headers"])
+
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["bio"] == "Новое описание"
+    assert client.get("/api/artists").headers["X-Cache"] == "MISS"
+
+
+def test_search_cache_key_is_normalized_and_anonymous_only(client, booking):
+    client.get("/api/artists", params=[("genre", "rock"), ("limit", "5")])
+    assert client.get("/api/artists?limit=5&genre=rock").headers["X-Cache"] == "HIT"
+
+    response = client.get("/api/artists?limit=5&genre=rock", headers=booking["artist_headers"])
+    assert "X-Cache" not in response.headers
@@ -0,0 +1,49 @@
+from app.services.search import build_match_expression, stem_word
+
+
+def _create_artist(client, login, email, **profile):
+    headers = login(email, "artist")
+    response = client.post("/api/artists", json=profile, headers=headers)
+    assert response.status_code == 200
+    return response.json()["artist_id"], headers
+
+
+def test_stemming_reduces_russian_word_forms():
+    assert stem_word("группа") == stem_word("группы") == stem_word("группой")
+    assert stem_word("выступления") == stem_word("выступлений")
+    assert stem_word("Ёлки") == "елк"
+    assert build_match_expression("рок-группы!") == '"рок"* "групп"*'
+    assert build_match_expression("  ...  ") is None
+
+
+def test_search_is_ranked_and_matches_word_forms(client, login):
+    bio_only, _ = _create_artist(
+        client, login, "bio@test.com",
+        stage_name="Квартет Север", bio="Играем джаз для любой группы гостей", genres=["jazz"],
+    )
+    in_name, _ = _create_artist(
+        client, login, "name@test.com",
+        stage_name="Джазовая группа Луна", bio="Живая музыка", genres=["jazz", "soul"],
+    )
+    _create_artist(
+        client, login, "other@test.com",
+        stage_name="DJ Max", bio="Электроника", genres=["house"],
+    )
+
+    response = client.get("/api/artists", params={"search": "группой"})
+    assert [a["artist_id"] for a in response.json()] == [in_name, bio_only]
+
+    response = client.get("/api/artists", params={"search": "soul"})
+    assert [a["artist_id"] for a in response.json()] == [in_name]
+
+
+def test_index_follows_profile_updates(client, login):
+    artist_id, headers = _create_artist(
+        client, login, "upd@test.com", stage_name="Старое Имя", genres=["rock"],
+    )
+
+    response = client.put(f"/api/artists/{artist_id}", json={"stage_name": "Новые Горизонты"}, headers=headers)
+    assert response.status_code == 200
+
+    assert client.get("/api/artists", params={"search": "старое"}).json() == []
+    assert [a["artist_id"] for a in client.get("/api/artists", params={"search": "горизонт"}).json()] == [artist_id]
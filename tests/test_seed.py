@@ -0,0 +1,47 @@
+from sqlalchemy import func, select
+
+from app.models.models import Artist, Booking, Conversation, Message, Review, User
+from database.database import engine
+from database.seed import SEED_PASSWORD, Volumes, clear, generate
+
+VOLUMES = Volumes(users=60, artists=12, organizers=6, bookings=80, reviews=120, messages=300)
+
+
+def _snapshot():
+    with engine.connect() as connection:
+        return [
+            connection.execute(select(table).order_by(*table.primary_key.columns)).all()
+            for table in (User.__table__, Artist.__table__, Booking.__table__, Review.__table__, Message.__table__)
+        ]
+
+
+def test_seed_is_deterministic_and_consistent(client):
+    generate(engine, VOLUMES, seed=7, log=lambda message: None)
+    first = _snapshot()
+
+    assert [len(rows) for rows in first] == [60, 12, 80, 120, 300]
+    with engine.connect() as connection:
+        artist_reviews = connection.scalar(
+            select(func.count()).select_from(Review).join(User, User.id == Review.reviewer_id)
+            .where(User.role == "organizer")
+        )
+        assert connection.scalar(select(func.sum(Artist.rating_count))) == artist_reviews
+        assert connection.scalar(select(func.sum(Conversation.unread_count))) == connection.scalar(
+            select(func.count()).select_from(Message).where(Message.is_read.is_(False))
+        )
+
+    clear(engine)
+    generate(engine, VOLUMES, seed=7, log=lambda message: None)
+    assert _snapshot() == first
+
+
+def test_seeded_users_can_log_in_and_search(client):
+    generate(engine, VOLUMES, seed=7, log=lambda message: None)
+
+    response = client.post("/api/token", data={"username": "user1@example.com", "password": SEED_PASSWORD})
+    assert response.status_code == 200
+    artist = client.get("/api/artists/1").json()
+    by_genre = client.get("/api/artists", params={"genre": artist["genres"][0]}).json()
+    assert 1 in [a["artist_id"] for a in by_genre]
+    by_name = client.get("/api/artists", params={"search": artist["stage_name"].split()[0]}).json()
+    assert 1 in [a["artist_id"] for a in by_name]
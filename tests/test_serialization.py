@@ -0,0 +1,57 @@
+import json
+from datetime import datetime
+
+from app.models.models import BookingStatus
+from app.schemas.schemas import BookingResponse
+from app.services import serialization
+
+
+def _bookings(client, booking, count):
+    for price in range(count):
+        response = client.post(
+            "/api/bookings",
+            json={"artist_id": booking["artist_id"], "proposed_price": price},
+            headers=booking["organizer_headers"],
+        )
+        assert response.status_code == 200
+
+
+def test_fast_path_matches_response_model(client, booking):
+    created = client.post(
+        "/api/bookings",
+        json={"artist_id": booking["artist_id"], "proposed_price": 1500, "technical_requirements": "свет"},
+        headers=booking["organizer_headers"],
+    ).json()
+
+    listed = client.get("/api/bookings", headers=booking["organizer_headers"]).json()
+    # Ответ быстрого пути совпадает с сериализацией через response_model
+    assert listed[0] == BookingResponse.model_validate(created).model_dump(mode="json")
+
+    artist = client.get("/api/artists").json()[0]
+    assert artist == client.get(f"/api/artists/{booking['artist_id']}").json()
+
+
+def test_export_streams_json_array_and_ndjson(client, booking, monkeypatch):
+    monkeypatch.setattr(serialization, "STREAM_BATCH_SIZE", 2)
+    _bookings(client, booking, 4)
+    headers = booking["organizer_headers"]
+
+    array = client.get("/api/bookings/export", headers=headers)
+    assert array.headers["content-type"] == "application/json"
+    bookings = array.json()
+    assert len(bookings) == 5
+    assert [b["booking_id"] for b in bookings] == sorted((b["booking_id"] for b in bookings), reverse=True)
+
+    ndjson = client.get("/api/bookings/export", headers={**headers, "Accept": "application/x-ndjson"})
+    assert ndjson.headers["content-type"] == "application/x-ndjson"
+    assert [json.loads(line) for line in ndjson.text.splitlines()] == bookings
+
+    empty = client.get("/api/messages/export", headers=headers)
+    assert empty.json() == []
+
+
+def test_dumps_without_orjson_matches(monkeypatch):
+    value = {"status": BookingStatus.confirmed, "at": datetime(2025, 1, 2, 3, 4, 5, 6), "text": "жанр"}
+    fast = serialization.dumps(value)
+    monkeypatch.setattr(serialization, "orjson", None)
+    assert serialization.dumps(value) == fast
@@ -0,0 +1,48 @@
+import logging
+
+from app.services import sql_profiler
+from app.services.sql_profiler import QueryTrace, find_repeated, parameter_shape
+
+
+def test_profile_returns_query_trace_for_admins_only(client, login, booking):
+    admin_headers = login("admin@test.com", "admin")
+    payload = {"path": "/api/bookings", "headers": booking["organizer_headers"]}
+
+    assert client.post("/api/admin/sql-profile", json=payload, headers=booking["organizer_headers"]).status_code == 403
+
+    response = client.post("/api/admin/sql-profile", json=payload, headers=admin_headers)
+    assert response.status_code == 200
+    profile = response.json()
+    assert profile["status_code"] == 200
+    assert profile["route"] == "/api/bookings"
+    assert profile["query_count"] == len(profile["queries"]) > 0
+    assert all("FROM" in query["statement"].upper() or query["executemany"] for query in profile["queries"])
+    # Значения параметров не раскрываются — только типы
+    assert all(str(booking["organizer_id"]) not in query["parameters"] for query in profile["queries"])
+
+
+def test_repeated_statements_are_flagged_as_n_plus_one():
+    statement = "SELECT * FROM artists WHERE artist_id = ?"
+    trace = [QueryTrace(statement, "(int)", 0.001, False, repr((i,))) for i in range(5)]
+    trace.append(QueryTrace("SELECT count(*) FROM users", "()", 0.001, False, "()"))
+    # Один и тот же запрос с одинаковыми параметрами — не N+1
+    trace += [QueryTrace("SELECT 1", "()", 0.001, False, "()") for _ in range(5)]
+
+    repeated = find_repeated(trace, threshold=3)
+    assert [item["statement"] for item in repeated] == [statement]
+    assert repeated[0]["count"] == 5 and repeated[0]["distinct_parameters"] == 5
+
+
+def test_parameter_shape_hides_values():
+    assert parameter_shape((1, 2, 3, "secret"), False) == "(int x 3, str)"
+    assert parameter_shape({"email": "a@b.c", "limit": 5}, False) == "{email: str, limit: int}"
+    assert parameter_shape([(1, "x"), (2, "y")], True) == "2 x (int, str)"
+
+
+def test_slow_queries_are_logged_with_route(client, booking, monkeypatch, caplog):
+    monkeypatch.setattr(sql_profiler, "SLOW_QUERY_MS", 1e-6)
+    with caplog.at_level(logging.WARNING, logger="muzplatforma.sql"):
+        client.get("/api/bookings", headers=booking["organizer_headers"])
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert messages and all("маршрут /api/bookings" in message for message in messages)